@@ -0,0 +1,80 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Time how long ``import pandas_gbq`` takes in a fresh interpreter.
+
+Exits with a non-zero status if the median import time exceeds the budget or
+if importing pandas-gbq eagerly imports one of the heavy dependencies that
+should only be loaded on first use.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# pandas optionally imports pandas-gbq, so `import pandas_gbq` should stay
+# nearly free. The budget leaves plenty of room for slow CI machines.
+DEFAULT_BUDGET_MS = 100.0
+
+DEFERRED_MODULES = (
+    "google.auth",
+    "google.cloud.bigquery",
+    "google.cloud.bigquery_storage",
+    "pandas",
+    "psutil",
+    "pyarrow",
+    "pydata_google_auth",
+)
+
+_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import pandas_gbq
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def time_import():
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    results = [time_import() for _ in range(args.runs)]
+    median_ms = statistics.median(result["seconds"] for result in results) * 1000
+    imported = sorted(
+        module for module in DEFERRED_MODULES if module in results[0]["modules"]
+    )
+
+    print(f"import pandas_gbq: median {median_ms:.1f} ms over {args.runs} runs")
+    print(f"budget: {args.budget_ms:.1f} ms")
+
+    failed = False
+    if median_ms > args.budget_ms:
+        print("FAIL: import time is over budget")
+        failed = True
+    if imported:
+        print(f"FAIL: imported deferred modules: {', '.join(imported)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Measure the fixed per-call overhead of ``read_gbq`` without the network.
+
+The BigQuery client is replaced with a fake that returns a small, in-memory
+result, so the time reported is spent in pandas-gbq (and the client library's
+DataFrame conversion) rather than waiting on BigQuery.
+"""
+
+import argparse
+import cProfile
+import pstats
+import statistics
+import sys
+import time
+
+import google.auth.credentials
+import google.cloud.bigquery
+from google.cloud.bigquery.table import RowIterator
+
+import pandas_gbq
+
+NUM_ROWS = 10
+
+SCHEMA = [
+    google.cloud.bigquery.SchemaField("id", "INTEGER"),
+    google.cloud.bigquery.SchemaField("name", "STRING"),
+    google.cloud.bigquery.SchemaField("score", "FLOAT"),
+]
+
+ROWS = [
+    {"f": [{"v": str(i)}, {"v": f"name-{i}"}, {"v": str(i / 2)}]}
+    for i in range(NUM_ROWS)
+]
+
+
+class FakeClient:
+    """Stand-in for ``google.cloud.bigquery.Client`` with no network access."""
+
+    def __init__(self, project=None, credentials=None, location=None, **kwargs):
+        self.project = project
+        self.location = location
+        self._credentials = credentials
+
+    def query_and_wait(self, query, **kwargs):
+        return RowIterator(
+            client=self,
+            api_request=None,
+            path=None,
+            schema=SCHEMA,
+            total_rows=NUM_ROWS,
+            first_page_response={"rows": ROWS},
+            job_id="benchmark-job",
+            location=kwargs.get("location"),
+            project=self.project,
+        )
+
+
+def read_once(credentials):
+    return pandas_gbq.read_gbq(
+        "SELECT id, name, score FROM `my_dataset.my_table`",
+        project_id="benchmark-project",
+        credentials=credentials,
+        progress_bar_type=None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument(
+        "--profile", action="store_true", help="Print the slowest functions."
+    )
+    args = parser.parse_args()
+
+    google.cloud.bigquery.Client = FakeClient
+    credentials = google.auth.credentials.AnonymousCredentials()
+
+    # Warm up imports and caches, which are one-time costs.
+    assert len(read_once(credentials).index) == NUM_ROWS
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+
+    durations = []
+    for _ in range(args.calls):
+        start = time.perf_counter()
+        read_once(credentials)
+        durations.append(time.perf_counter() - start)
+
+    if profiler is not None:
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(30)
+
+    print(f"read_gbq with a mocked client, {NUM_ROWS} rows, {args.calls} calls")
+    print(f"  median: {statistics.median(durations) * 1e6:.0f} us/call")
+    print(f"  mean:   {statistics.mean(durations) * 1e6:.0f} us/call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
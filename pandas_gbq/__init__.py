@@ -2,15 +2,36 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
+import importlib
 import logging
+import typing
 import warnings
 
 from pandas_gbq import version as pandas_gbq_version
 from pandas_gbq.contexts import Context, context
-from pandas_gbq.core.sample import sample
 
 from . import _versions_helpers
-from .gbq import read_gbq, to_gbq  # noqa
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    from pandas_gbq.bigquery_session import BigQuerySession
+    from pandas_gbq.core.credentials_manager import CredentialsManager
+    from pandas_gbq.core.dry_run_cache import DryRunCache
+    from pandas_gbq.core.job_tracker import JobTracker
+    from pandas_gbq.core.key_cache import KeyCache
+    from pandas_gbq.core.memory_cache import MemoryCache
+    from pandas_gbq.core.metadata_cache import MetadataCache
+    from pandas_gbq.core.result_cache import ResultCache
+    from pandas_gbq.core.scheduler import JobScheduler
+    from pandas_gbq.core.sample import sample
+    from pandas_gbq.core.token_store import FileTokenStore
+    from pandas_gbq.dry_runs import dry_run_many
+    from pandas_gbq.gbq import read_gbq, to_gbq
+    from pandas_gbq.gbq_async import read_gbq_async, to_gbq_async
+    from pandas_gbq.joins import read_gbq_join
+    from pandas_gbq.lookups import read_gbq_by_keys
+    from pandas_gbq.query_results import QueryResult, execute_query
+    from pandas_gbq.read_many import read_gbq_many
+    from pandas_gbq.session import Session
 
 sys_major, sys_minor, sys_micro = _versions_helpers.extract_runtime_version()
 if sys_major == 3 and sys_minor < 9:
@@ -30,8 +51,77 @@ __version__ = pandas_gbq_version.__version__
 __all__ = [
     "__version__",
     "to_gbq",
+    "to_gbq_async",
     "read_gbq",
+    "read_gbq_async",
+    "read_gbq_by_keys",
+    "read_gbq_join",
+    "read_gbq_many",
+    "BigQuerySession",
     "Context",
     "context",
+    "CredentialsManager",
+    "dry_run_many",
+    "DryRunCache",
+    "execute_query",
+    "FileTokenStore",
+    "JobScheduler",
+    "JobTracker",
+    "KeyCache",
+    "MemoryCache",
+    "MetadataCache",
+    "QueryResult",
+    "ResultCache",
     "sample",
+    "Session",
 ]
+
+# pandas optionally imports pandas-gbq, so defer importing the BigQuery client
+# libraries (and everything else that's slow to import) until first use.
+_LAZY_ATTRIBUTES = {
+    "BigQuerySession": ("pandas_gbq.bigquery_session", "BigQuerySession"),
+    "CredentialsManager": (
+        "pandas_gbq.core.credentials_manager",
+        "CredentialsManager",
+    ),
+    "dry_run_many": ("pandas_gbq.dry_runs", "dry_run_many"),
+    "DryRunCache": ("pandas_gbq.core.dry_run_cache", "DryRunCache"),
+    "execute_query": ("pandas_gbq.query_results", "execute_query"),
+    "FileTokenStore": ("pandas_gbq.core.token_store", "FileTokenStore"),
+    "gbq": ("pandas_gbq.gbq", None),
+    "JobScheduler": ("pandas_gbq.core.scheduler", "JobScheduler"),
+    "JobTracker": ("pandas_gbq.core.job_tracker", "JobTracker"),
+    "KeyCache": ("pandas_gbq.core.key_cache", "KeyCache"),
+    "MemoryCache": ("pandas_gbq.core.memory_cache", "MemoryCache"),
+    "MetadataCache": ("pandas_gbq.core.metadata_cache", "MetadataCache"),
+    "QueryResult": ("pandas_gbq.query_results", "QueryResult"),
+    "read_gbq": ("pandas_gbq.gbq", "read_gbq"),
+    "read_gbq_async": ("pandas_gbq.gbq_async", "read_gbq_async"),
+    "read_gbq_by_keys": ("pandas_gbq.lookups", "read_gbq_by_keys"),
+    "read_gbq_join": ("pandas_gbq.joins", "read_gbq_join"),
+    "read_gbq_many": ("pandas_gbq.read_many", "read_gbq_many"),
+    "ResultCache": ("pandas_gbq.core.result_cache", "ResultCache"),
+    "sample": ("pandas_gbq.core.sample", "sample"),
+    "Session": ("pandas_gbq.session", "Session"),
+    "to_gbq": ("pandas_gbq.gbq", "to_gbq"),
+    "to_gbq_async": ("pandas_gbq.gbq_async", "to_gbq_async"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    # Avoid calling __getattr__ on future lookups.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -22,6 +22,8 @@ def get_credentials(
     auth_redirect_uri=None,
     client_id=None,
     client_secret=None,
+    scopes=None,
+    token_store=None,
 ):
     import pydata_google_auth
 
@@ -35,7 +37,7 @@ method from the google-auth package."""
         )
 
     credentials, default_project_id = pydata_google_auth.default(
-        SCOPES,
+        scopes if scopes is not None else SCOPES,
         client_id=client_id,
         client_secret=client_secret,
         credentials_cache=get_credentials_cache(reauth),
@@ -43,6 +45,9 @@ method from the google-auth package."""
         redirect_uri=auth_redirect_uri,
     )
 
+    if token_store is not None:
+        credentials = token_store.wrap(credentials)
+
     project_id = project_id or default_project_id
     return credentials, project_id
 
@@ -0,0 +1,138 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""BigQuery sessions, in which jobs share temporary tables and variables."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+import google.api_core.exceptions
+import google.cloud.bigquery
+
+logger = logging.getLogger(__name__)
+
+_SESSION_DATASET = "_SESSION"
+
+
+def _connection_properties(session_id: str) -> List[Dict[str, Any]]:
+    return [{"key": "session_id", "value": session_id}]
+
+
+def _session_config(session_id: str) -> Dict[str, Any]:
+    return {"query": {"connectionProperties": _connection_properties(session_id)}}
+
+
+def _abort_session(connector, session_id: str, location: Optional[str]) -> None:
+    """End the session early, dropping its temporary tables."""
+    job_config = google.cloud.bigquery.QueryJobConfig.from_api_repr(
+        _session_config(session_id)
+    )
+    try:
+        connector.client.query(
+            "CALL BQ.ABORT_SESSION()",
+            job_config=job_config,
+            location=location,
+            project=connector.project_id,
+        ).result()
+    except google.api_core.exceptions.GoogleAPICallError as ex:
+        # The session expires on its own, eventually.
+        logger.debug("Could not abort session %s: %s", session_id, ex)
+
+
+def is_session_table(table_id: str) -> bool:
+    """Whether ``table_id`` names a temporary table of a session."""
+    parts = table_id.split(".")
+    return len(parts) >= 2 and parts[-2] == _SESSION_DATASET
+
+
+class BigQuerySession:
+    """A BigQuery session, shared by several calls to pandas-gbq.
+
+    Pass the same session as the ``session`` argument of
+    :func:`pandas_gbq.read_gbq` and :func:`pandas_gbq.to_gbq` to run their
+    jobs in one `BigQuery session
+    <https://cloud.google.com/bigquery/docs/sessions-intro>`__. Jobs in a
+    session share temporary tables, such as ``_SESSION.my_table``, and
+    variables, so multi-step workflows don't need permanent intermediate
+    tables, nor to clean them up afterwards.
+
+    The session starts with the first call that uses it, and ends with
+    :meth:`close`, or after 24 hours, or once it's unused for 6 hours.
+    Query results aren't shared through
+    :attr:`pandas_gbq.context.result_cache` or
+    :attr:`pandas_gbq.context.coalesce_requests` within a session, since
+    they can depend on its temporary tables.
+
+    Args:
+        location:
+            Optional. Location of the session. All of its jobs run there.
+            Defaults to the location of the first call that uses it.
+
+    Examples:
+        >>> import pandas_gbq
+        >>> with pandas_gbq.BigQuerySession(location="US") as session:
+        ...     pandas_gbq.to_gbq(orders_df, "_SESSION.orders", session=session)
+        ...     totals = pandas_gbq.read_gbq(
+        ...         "SELECT customer_id, SUM(amount) AS total "
+        ...         "FROM _SESSION.orders GROUP BY customer_id",
+        ...         session=session,
+        ...     )
+    """
+
+    def __init__(self, *, location: Optional[str] = None):
+        self.location = location
+        self._session_id: Optional[str] = None
+        self._connector = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> BigQuerySession:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def session_id(self) -> Optional[str]:
+        """ID of the session, or ``None`` if it hasn't started."""
+        return self._session_id
+
+    def connection_properties(self, connector) -> List[Dict[str, Any]]:
+        """Connection properties that run a job in this session.
+
+        Starts the session, with ``connector``, if it hasn't started yet.
+        """
+        with self._lock:
+            if self._session_id is None:
+                self._start(connector)
+            return _connection_properties(self._session_id)
+
+    def close(self) -> None:
+        """End the session, dropping its temporary tables."""
+        with self._lock:
+            if self._session_id is None:
+                return
+            _abort_session(self._connector, self._session_id, self.location)
+            self._session_id = None
+            self._connector = None
+
+    def _start(self, connector) -> None:
+        job_config = google.cloud.bigquery.QueryJobConfig(create_session=True)
+        try:
+            query_job = connector.client.query(
+                "SELECT 1",
+                job_config=job_config,
+                location=self.location or connector.location,
+                project=connector.project_id,
+            )
+            query_job.result()
+        except connector.http_error as ex:
+            connector.process_http_error(ex)
+
+        self._session_id = query_job.session_info.session_id
+        self.location = query_job.location
+        self._connector = connector
+        logger.debug("Started session %s in %s.", self._session_id, self.location)
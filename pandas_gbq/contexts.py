@@ -2,6 +2,10 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
+import contextlib
+import contextvars
+from typing import Optional
+
 
 class Context(object):
     """Storage for objects to be used throughout a session.
@@ -15,6 +19,16 @@ class Context(object):
         self._project = None
         # dialect defaults to None so that read_gbq can stop warning if set.
         self._dialect = None
+        self._result_cache = None
+        self._coalesce_requests = False
+        self._metadata_cache = None
+        self._dry_run_cache = None
+        self._token_store = None
+        self._sample_cache = None
+        self._key_cache = None
+        self._job_scheduler = None
+        self._query_progress_callback = None
+        self._max_bytes_billed = None
 
     @property
     def credentials(self):
@@ -110,6 +124,308 @@ class Context(object):
     def dialect(self, value):
         self._dialect = value
 
+    @property
+    def result_cache(self):
+        """
+        Local cache for query results from :func:`pandas_gbq.read_gbq`.
+
+        Defaults to ``None``, meaning results are not cached locally. Set to a
+        :class:`pandas_gbq.ResultCache` to cache results on disk, validated
+        against the modification time of the tables referenced by the query,
+        or to a :class:`pandas_gbq.MemoryCache` to cache results in memory
+        for a fixed time-to-live.
+
+        Returns
+        -------
+        pandas_gbq.ResultCache, pandas_gbq.MemoryCache, or None
+
+        Examples
+        --------
+
+        Caching query results on disk, using up to 10 GiB:
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.result_cache = pandas_gbq.ResultCache(
+        ...     '~/.cache/pandas_gbq',
+        ...     max_bytes=10 * 1024 ** 3,
+        ... )
+
+        Caching query results in memory for up to a minute, refreshing
+        expired results in the background:
+
+        >>> pandas_gbq.context.result_cache = pandas_gbq.MemoryCache(
+        ...     ttl_seconds=60,
+        ...     stale_while_revalidate=True,
+        ... )
+        """
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, value):
+        self._result_cache = value
+
+    @property
+    def coalesce_requests(self):
+        """
+        Share one query job and download among identical concurrent requests.
+
+        When ``True``, calls to :func:`pandas_gbq.read_gbq` from multiple
+        threads with the same query (or table), options, and credentials
+        wait for a single BigQuery job and download, rather than each
+        starting their own. Each caller still gets its own DataFrame.
+
+        Defaults to ``False``. Queries that use non-deterministic functions,
+        such as ``RAND()``, return the same results to all coalesced callers.
+
+        Returns
+        -------
+        bool
+
+        Examples
+        --------
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.coalesce_requests = True
+        """
+        return self._coalesce_requests
+
+    @coalesce_requests.setter
+    def coalesce_requests(self, value):
+        self._coalesce_requests = value
+
+    @property
+    def metadata_cache(self):
+        """
+        Cache for table and dataset metadata lookups.
+
+        Defaults to ``None``, meaning each call to :func:`pandas_gbq.to_gbq`
+        or :func:`pandas_gbq.read_gbq` fetches metadata again. Set to a
+        :class:`pandas_gbq.MetadataCache` to share metadata across calls.
+        Tables and datasets created, deleted, or loaded into by pandas-gbq
+        are removed from the cache automatically.
+
+        Returns
+        -------
+        pandas_gbq.MetadataCache or None
+
+        Examples
+        --------
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.metadata_cache = pandas_gbq.MetadataCache(
+        ...     ttl_seconds=300,
+        ... )
+        """
+        return self._metadata_cache
+
+    @metadata_cache.setter
+    def metadata_cache(self, value):
+        self._metadata_cache = value
+
+    @property
+    def dry_run_cache(self):
+        """
+        Cache for the statistics of dry run queries.
+
+        Defaults to ``None``, meaning each dry run, such as from
+        :func:`pandas_gbq.read_gbq` with ``dry_run=True`` or
+        :func:`pandas_gbq.dry_run_many`, is sent to BigQuery. Set to a
+        :class:`pandas_gbq.DryRunCache` to reuse the statistics of a query
+        until one of the tables it references is modified.
+
+        Returns
+        -------
+        pandas_gbq.DryRunCache or None
+
+        Examples
+        --------
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.dry_run_cache = pandas_gbq.DryRunCache()
+        """
+        return self._dry_run_cache
+
+    @dry_run_cache.setter
+    def dry_run_cache(self, value):
+        self._dry_run_cache = value
+
+    @property
+    def token_store(self):
+        """
+        Store for access tokens shared by processes on the same host.
+
+        Defaults to ``None``, meaning each process refreshes its own access
+        token. Set to a :class:`pandas_gbq.FileTokenStore` to share default
+        credentials' tokens among worker processes, such as in a prefork
+        server or a :mod:`multiprocessing` pool. Use
+        :meth:`pandas_gbq.FileTokenStore.wrap` to share the tokens of
+        credentials that you pass in yourself.
+
+        Returns
+        -------
+        pandas_gbq.FileTokenStore or None
+
+        Examples
+        --------
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.token_store = pandas_gbq.FileTokenStore(
+        ...     '/var/run/my-service/bigquery-tokens.json',
+        ... )
+        """
+        return self._token_store
+
+    @token_store.setter
+    def token_store(self, value):
+        self._token_store = value
+
+    @property
+    def sample_cache(self):
+        """
+        On-disk cache for samples from :func:`pandas_gbq.sample`.
+
+        Defaults to ``None``, meaning each call runs a new sampling query.
+        Set to a :class:`pandas_gbq.ResultCache` to reuse the sample of a
+        table, for the same ``target_mb``, until the table is modified. This
+        avoids paying for the same sampling query again after restarting a
+        notebook kernel.
+
+        Returns
+        -------
+        pandas_gbq.ResultCache or None
+
+        Examples
+        --------
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.sample_cache = pandas_gbq.ResultCache(
+        ...     '~/.cache/pandas_gbq/samples',
+        ... )
+        """
+        return self._sample_cache
+
+    @sample_cache.setter
+    def sample_cache(self, value):
+        self._sample_cache = value
+
+    @property
+    def key_cache(self):
+        """
+        Cache for the rows read by :func:`pandas_gbq.read_gbq_by_keys`.
+
+        Defaults to ``None``, meaning every key is queried on every call. Set
+        to a :class:`pandas_gbq.KeyCache` to reuse the rows already read for
+        a key, so that only new keys are queried. Cached rows are not checked
+        against changes to the table.
+
+        Returns
+        -------
+        pandas_gbq.KeyCache or None
+
+        Examples
+        --------
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.key_cache = pandas_gbq.KeyCache(
+        ...     max_keys=100_000,
+        ...     ttl_seconds=600,
+        ... )
+        """
+        return self._key_cache
+
+    @key_cache.setter
+    def key_cache(self, value):
+        self._key_cache = value
+
+    @property
+    def job_scheduler(self):
+        """
+        Queue for the query and load jobs started by pandas-gbq.
+
+        Defaults to ``None``, meaning jobs start right away. Set to a
+        :class:`pandas_gbq.JobScheduler` to hold jobs until they can start
+        within its concurrency and rate limits. Since the global context is
+        shared by all threads, this limits all jobs started by the process.
+
+        Returns
+        -------
+        pandas_gbq.JobScheduler or None
+
+        Examples
+        --------
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.job_scheduler = pandas_gbq.JobScheduler(
+        ...     max_concurrent_jobs_per_project=50,
+        ...     table_updates_per_second=0.5,
+        ...     table_update_burst=5,
+        ... )
+        """
+        return self._job_scheduler
+
+    @job_scheduler.setter
+    def job_scheduler(self, value):
+        self._job_scheduler = value
+
+    @property
+    def query_progress_callback(self):
+        """
+        Function called when the state of a query job changes.
+
+        Defaults to ``None``. While pandas-gbq waits for a query job, it calls
+        this function with the :class:`google.cloud.bigquery.QueryJob` each
+        time the job's ``state`` changes, such as from ``"PENDING"`` to
+        ``"RUNNING"`` to ``"DONE"``. The function is called on the thread
+        that waits for the job, so it should return quickly.
+
+        Returns
+        -------
+        Callable[[google.cloud.bigquery.QueryJob], None] or None
+
+        Examples
+        --------
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.query_progress_callback = lambda job: print(
+        ...     job.job_id, job.state
+        ... )
+        """
+        return self._query_progress_callback
+
+    @query_progress_callback.setter
+    def query_progress_callback(self, value):
+        self._query_progress_callback = value
+
+    @property
+    def max_bytes_billed(self):
+        """
+        Default limit on the bytes billed by queries from
+        :func:`pandas_gbq.read_gbq`.
+
+        Defaults to ``None``, for no limit. Queries estimated by a dry run to
+        process more bytes than this are rejected with
+        :class:`pandas_gbq.exceptions.BytesBilledLimitExceeded` before they
+        start. The limit is also sent with the query job, so that BigQuery
+        fails the query rather than bill more than this.
+
+        Returns
+        -------
+        int or None
+
+        Examples
+        --------
+
+        Reject queries that would bill more than 10 GiB:
+
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.max_bytes_billed = 10 * 1024**3
+        """
+        return self._max_bytes_billed
+
+    @max_bytes_billed.setter
+    def max_bytes_billed(self, value):
+        self._max_bytes_billed = value
+
 
 # Create an empty context, used to cache credentials.
 context = Context()
@@ -118,3 +434,26 @@ context = Context()
 Credentials automatically are cached in-memory by :func:`pandas_gbq.read_gbq`
 and :func:`pandas_gbq.to_gbq`.
 """
+
+# Overrides the global context, such as within calls made by a
+# pandas_gbq.Session. A context variable keeps this local to each thread and
+# asyncio task.
+_current_context: contextvars.ContextVar[Optional[Context]] = contextvars.ContextVar(
+    "pandas_gbq_current_context", default=None
+)
+
+
+def get_context() -> Context:
+    """Get the context in use by the current thread or task."""
+    current = _current_context.get()
+    return context if current is None else current
+
+
+@contextlib.contextmanager
+def use_context(value: Context):
+    """Use ``value`` instead of the global context within this block."""
+    token = _current_context.set(value)
+    try:
+        yield value
+    finally:
+        _current_context.reset(token)
@@ -0,0 +1,139 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Process-wide pool of BigQuery and BigQuery Storage API clients.
+
+Creating a client is cheap compared to a query, but the first request made
+with a new client has to open a new HTTP session (or gRPC channel, for the
+BigQuery Storage Read API). Reusing clients across calls to
+:func:`pandas_gbq.read_gbq` and :func:`pandas_gbq.to_gbq` keeps these
+connections warm.
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+import pandas_gbq.features
+
+DEFAULT_MAX_CLIENTS = 32
+
+
+class ClientPool:
+    """Reuse clients with the same project, credentials, location and user agent.
+
+    Credentials are compared by identity, since refreshing credentials
+    updates the same object in place.
+
+    Clients removed from a full pool are not closed, because another thread
+    may still be using them.
+    """
+
+    def __init__(self, *, max_clients: int = DEFAULT_MAX_CLIENTS):
+        self.max_clients = max_clients
+        self._clients: collections.OrderedDict[
+            Hashable, Any
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get_client(
+        self,
+        *,
+        project_id: str,
+        credentials,
+        location: Optional[str],
+        user_agent: str,
+    ):
+        """Get a ``google.cloud.bigquery.Client``, creating it if needed."""
+        import google.api_core.client_info
+
+        def create():
+            bigquery = pandas_gbq.features.FEATURES.bigquery_try_import()
+            return bigquery.Client(
+                project=project_id,
+                credentials=credentials,
+                location=location,
+                client_info=google.api_core.client_info.ClientInfo(
+                    user_agent=user_agent,
+                ),
+            )
+
+        key = ("bigquery", project_id, id(credentials), location, user_agent)
+        return self._get(key, credentials, create)
+
+    def get_bqstorage_client(self, *, credentials, user_agent: str):
+        """Get a BigQuery Storage Read API client, creating it if needed.
+
+        Returns:
+            ``None`` if the ``google-cloud-bigquery-storage`` package isn't
+            installed.
+        """
+        try:
+            from google.cloud import bigquery_storage
+        except ImportError:
+            return None
+
+        import google.api_core.gapic_v1.client_info
+
+        def create():
+            return bigquery_storage.BigQueryReadClient(
+                credentials=credentials,
+                client_info=google.api_core.gapic_v1.client_info.ClientInfo(
+                    user_agent=user_agent,
+                ),
+            )
+
+        key = ("bqstorage", id(credentials), user_agent)
+        return self._get(key, credentials, create)
+
+    def clear(self) -> None:
+        """Remove all clients from the pool."""
+        with self._lock:
+            self._clients.clear()
+
+    def _get(self, key: Hashable, credentials, create: Callable[[], Any]):
+        with self._lock:
+            entry = self._clients.get(key)
+            # Keep a reference to the credentials so that their id() isn't
+            # reused by different credentials while the client is pooled.
+            if entry is not None and entry[0] is credentials:
+                self._clients.move_to_end(key)
+                return entry[1]
+
+            client = create()
+            self._clients[key] = (credentials, client)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+            return client
+
+
+_POOL = ClientPool()
+
+
+def get_client(
+    *, project_id: str, credentials, location: Optional[str], user_agent: str
+):
+    """Get a pooled ``google.cloud.bigquery.Client``."""
+    return _POOL.get_client(
+        project_id=project_id,
+        credentials=credentials,
+        location=location,
+        user_agent=user_agent,
+    )
+
+
+def get_bqstorage_client(*, credentials, user_agent: str):
+    """Get a pooled BigQuery Storage Read API client, if available."""
+    return _POOL.get_bqstorage_client(credentials=credentials, user_agent=user_agent)
+
+
+def clear() -> None:
+    """Remove all clients from the process-wide pool."""
+    _POOL.clear()
@@ -0,0 +1,138 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Share the work of identical requests made concurrently from many threads."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import pandas_gbq.features
+
+# Tells waiting callers to run the request themselves.
+_NOT_SHARED = object()
+
+
+@dataclasses.dataclass
+class _InFlight:
+    future: concurrent.futures.Future
+    waiters: int = 0
+
+
+def _copy_on_write_enabled() -> bool:
+    import pandas
+
+    if pandas_gbq.features.FEATURES.pandas_has_copy_on_write_by_default:
+        return True
+
+    try:
+        return pandas.get_option("mode.copy_on_write") is True
+    except (KeyError, ValueError):
+        # Option doesn't exist in older versions of pandas.
+        return False
+
+
+def copy_result(result: Any) -> Any:
+    """Copy a DataFrame or Series so that each caller owns its result.
+
+    With pandas copy-on-write, a shallow copy is enough, since the underlying
+    data is only copied if one of the callers modifies it.
+    """
+    if result is None or not hasattr(result, "copy"):
+        return result
+
+    if _copy_on_write_enabled():
+        return result.copy(deep=False)
+    return result.copy()
+
+
+class RequestCoalescer:
+    """Run a function once for all concurrent callers with the same key.
+
+    The first caller with a given key runs the function. Callers that arrive
+    with the same key while it is running wait for and share its result (or
+    exception). The first caller gets the original result and the others get
+    copies of a snapshot taken before it's returned.
+
+    If ``is_shareable`` is provided, the first caller checks it after running
+    the function, but only when other callers are waiting. If it returns
+    ``False``, such as when a query turned out to be a DML statement, each
+    waiting caller runs its own function instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _InFlight] = {}
+
+    def run(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        *,
+        is_shareable: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            is_leader = in_flight is None
+            if is_leader:
+                in_flight = _InFlight(future=concurrent.futures.Future())
+                self._in_flight[key] = in_flight
+            else:
+                in_flight.waiters += 1
+
+        if not is_leader:
+            result = in_flight.future.result()
+            if result is _NOT_SHARED:
+                return fn()
+            return copy_result(result)
+
+        try:
+            result = fn()
+        except BaseException as ex:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.future.set_exception(ex)
+            raise
+
+        # Stop accepting new waiters before deciding whether the result can be
+        # shared with the current ones.
+        with self._lock:
+            del self._in_flight[key]
+            has_waiters = in_flight.waiters > 0
+
+        if has_waiters and is_shareable is not None:
+            try:
+                shareable = is_shareable()
+            except Exception:
+                # The request itself succeeded, so don't fail this caller.
+                shareable = False
+            if not shareable:
+                in_flight.future.set_result(_NOT_SHARED)
+                return result
+
+        if has_waiters:
+            # Share a snapshot that no caller owns, since the first caller may
+            # modify its result, such as with set_index(..., inplace=True),
+            # before the others have copied it.
+            in_flight.future.set_result(copy_result(result))
+        else:
+            in_flight.future.set_result(result)
+        return result
+
+
+# Requests are coalesced across all connectors in the process.
+_COALESCER = RequestCoalescer()
+
+
+def run(
+    key: Hashable,
+    fn: Callable[[], Any],
+    *,
+    is_shareable: Optional[Callable[[], bool]] = None,
+) -> Any:
+    """Run ``fn``, sharing the result with concurrent callers using ``key``."""
+    return _COALESCER.run(key, fn, is_shareable=is_shareable)
@@ -0,0 +1,299 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Refresh credentials in the background, before their access tokens expire.
+
+Google credentials refresh themselves when they are used after their access
+token has expired, so the first request after an expiry waits on a round trip
+to the token endpoint. Refreshing ahead of time, off the request path, keeps
+that latency out of queries.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+import threading
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+
+import pandas_gbq.auth
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_MARGIN_SECONDS = 300.0
+DEFAULT_RETRY_SECONDS = 30.0
+
+# Upper bound on how long the refresh thread sleeps, so that credentials
+# without an expiry are checked again now and then.
+_MAX_SLEEP_SECONDS = 600.0
+
+
+def _utcnow() -> datetime.datetime:
+    # google-auth stores expiry as a naive datetime in UTC.
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _account_of(credentials) -> Optional[str]:
+    for attribute in ("service_account_email", "signer_email", "account"):
+        account = getattr(credentials, attribute, None)
+        if isinstance(account, str) and account and account != "default":
+            return account
+    return None
+
+
+def _key(scopes: Optional[Sequence[str]], account: Optional[str]) -> Hashable:
+    if scopes is None:
+        scopes = pandas_gbq.auth.SCOPES
+    return (tuple(sorted(scopes)), account)
+
+
+@dataclasses.dataclass
+class _Entry:
+    credentials: object
+    project_id: Optional[str]
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    retry_at: Optional[datetime.datetime] = None
+
+
+class CredentialsManager:
+    """Keep credentials in memory and refresh them before they expire.
+
+    A background thread refreshes each managed credentials object shortly
+    before its access token expires. Credentials are refreshed in place, so
+    clients that already hold them, such as those created by
+    :func:`pandas_gbq.read_gbq`, always find a valid token.
+
+    Credentials are kept by scopes and account. Set
+    :attr:`pandas_gbq.context.credentials` to the managed credentials to use
+    them by default.
+
+    This object is safe to share across threads.
+
+    Args:
+        refresh_margin_seconds:
+            Refresh credentials this many seconds before they expire. Keep
+            this above the few minutes before expiry at which google-auth
+            considers a token stale and refreshes it inline.
+        retry_seconds:
+            Wait this long before trying again after a failed refresh.
+        background:
+            If ``False``, don't start a refresh thread. Credentials are then
+            only refreshed by calls to :meth:`refresh`.
+
+    Examples:
+        >>> import pandas_gbq
+        >>> manager = pandas_gbq.CredentialsManager()
+        >>> credentials, project_id = manager.get_credentials()
+        >>> pandas_gbq.context.credentials = credentials
+        >>> pandas_gbq.context.project = project_id
+    """
+
+    def __init__(
+        self,
+        *,
+        refresh_margin_seconds: float = DEFAULT_REFRESH_MARGIN_SECONDS,
+        retry_seconds: float = DEFAULT_RETRY_SECONDS,
+        background: bool = True,
+    ):
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.retry_seconds = retry_seconds
+        self.background = background
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> "CredentialsManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_credentials(
+        self,
+        scopes: Optional[Sequence[str]] = None,
+        *,
+        account: Optional[str] = None,
+    ) -> Tuple[object, Optional[str]]:
+        """Get managed credentials, loading the default credentials if needed.
+
+        Args:
+            scopes:
+                Optional. OAuth 2.0 scopes. Defaults to the BigQuery scope.
+            account:
+                Optional. Email of the account the credentials belong to. If
+                set, and no credentials for this account were added with
+                :meth:`manage`, the default credentials must belong to it.
+
+        Returns:
+            Tuple[google.auth.credentials.Credentials, Optional[str]]:
+                The credentials and the default project ID, if any.
+
+        Raises:
+            ValueError:
+                If ``account`` is set, but the default credentials belong to a
+                different account.
+        """
+        key = _key(scopes, account)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            return entry.credentials, entry.project_id
+
+        credentials, project_id = pandas_gbq.auth.get_credentials(scopes=scopes)
+        if account is not None and _account_of(credentials) != account:
+            raise ValueError(
+                f"Default credentials don't belong to account {account!r}. "
+                "Use manage() to add credentials for this account."
+            )
+        return self._add(key, credentials, project_id)
+
+    def manage(
+        self,
+        credentials,
+        *,
+        scopes: Optional[Sequence[str]] = None,
+        account: Optional[str] = None,
+        project_id: Optional[str] = None,
+    ):
+        """Start refreshing the given credentials in the background.
+
+        Args:
+            credentials (google.auth.credentials.Credentials):
+                Credentials to keep fresh.
+            scopes:
+                Optional. OAuth 2.0 scopes the credentials were created with,
+                for lookups with :meth:`get_credentials`. Defaults to the
+                BigQuery scope.
+            account:
+                Optional. Account for lookups with :meth:`get_credentials`.
+                Defaults to the service account email of the credentials, if
+                any.
+            project_id:
+                Optional. Project ID to return with the credentials from
+                :meth:`get_credentials`.
+
+        Returns:
+            google.auth.credentials.Credentials:
+                The managed credentials. If credentials with the same scopes
+                and account are already managed, those are returned instead.
+        """
+        if account is None:
+            account = _account_of(credentials)
+        if project_id is None:
+            project_id = getattr(credentials, "project_id", None)
+        credentials, _ = self._add(_key(scopes, account), credentials, project_id)
+        return credentials
+
+    def refresh(self, *, force: bool = False) -> None:
+        """Refresh managed credentials that are close to expiring.
+
+        Args:
+            force:
+                If ``True``, refresh all managed credentials, whether or not
+                they are close to expiring.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+
+        now = _utcnow()
+        for entry in entries:
+            if force or self._due_at(entry) <= now:
+                self._refresh_entry(entry)
+
+    def close(self) -> None:
+        """Stop the background refresh thread.
+
+        Managed credentials stay usable, and refresh themselves inline when
+        they expire, as usual.
+        """
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+            self._thread = None
+        self._wakeup.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _add(self, key, credentials, project_id):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(credentials=credentials, project_id=project_id)
+                self._entries[key] = entry
+                self._start_locked()
+        # Wake the refresh thread, since the new credentials may be due first.
+        self._wakeup.set()
+        return entry.credentials, entry.project_id
+
+    def _start_locked(self):
+        if not self.background or self._closed or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="pandas-gbq-credentials-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def _due_at(self, entry: _Entry) -> datetime.datetime:
+        if entry.retry_at is not None:
+            return entry.retry_at
+
+        credentials = entry.credentials
+        expiry = getattr(credentials, "expiry", None)
+        if expiry is None:
+            # Credentials without a token yet are refreshed right away, but
+            # those that never expire are left alone.
+            if getattr(credentials, "valid", True):
+                return datetime.datetime.max
+            return datetime.datetime.min
+
+        if expiry.tzinfo is not None:
+            expiry = expiry.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return expiry - datetime.timedelta(seconds=self.refresh_margin_seconds)
+
+    def _refresh_entry(self, entry: _Entry) -> None:
+        import google.auth.exceptions
+        import google.auth.transport.requests
+
+        # Skip credentials that another thread is already refreshing.
+        if not entry.lock.acquire(blocking=False):
+            return
+        try:
+            entry.credentials.refresh(google.auth.transport.requests.Request())
+            entry.retry_at = None
+            # Don't spin if the new token is already within the margin.
+            if self._due_at(entry) <= _utcnow():
+                entry.retry_at = _utcnow() + datetime.timedelta(
+                    seconds=self.retry_seconds
+                )
+        except (google.auth.exceptions.GoogleAuthError, OSError) as exc:
+            logger.warning("Background credentials refresh failed: %s", exc)
+            entry.retry_at = _utcnow() + datetime.timedelta(seconds=self.retry_seconds)
+        finally:
+            entry.lock.release()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                entries = list(self._entries.values())
+                # Clear under the lock, so that entries added after this point
+                # wake up the wait below.
+                self._wakeup.clear()
+
+            now = _utcnow()
+            next_due = now + datetime.timedelta(seconds=_MAX_SLEEP_SECONDS)
+            for entry in entries:
+                if self._due_at(entry) <= now:
+                    self._refresh_entry(entry)
+                next_due = min(next_due, self._due_at(entry))
+
+            timeout = max((next_due - _utcnow()).total_seconds(), 0.0)
+            self._wakeup.wait(timeout)
@@ -0,0 +1,145 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""In-process cache of dry run statistics, validated against table changes."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import datetime
+import logging
+import threading
+import time
+import typing
+from typing import Optional, Sequence
+
+import google.cloud.bigquery
+
+import pandas_gbq.core.result_cache
+
+# Only import at module-level at type checking time to avoid circular
+# dependencies in the pandas package, which has an optional dependency on
+# pandas-gbq.
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    import pandas
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class _Entry:
+    stats: pandas.Series
+    referenced_tables: Sequence[str]
+    created: datetime.datetime
+    stored_at: float
+
+
+class DryRunCache:
+    """A cache of the statistics returned by dry run queries.
+
+    Entries are keyed by the query text and the options that affect it, and
+    are only used if none of the tables referenced by the query have been
+    modified since the dry run. Validating an entry costs one ``get_table``
+    request per referenced table, which is cheaper than a dry run. Set
+    :attr:`pandas_gbq.context.metadata_cache` to avoid even those requests,
+    at the cost of possibly stale statistics for up to its TTL.
+
+    Only queries that reference at least one table are cached.
+
+    This object is safe to share across threads.
+
+    Args:
+        max_entries:
+            Maximum number of dry run results to keep. The least recently
+            used entries are removed first.
+        ttl_seconds:
+            Optional. Maximum age of an entry, regardless of whether the
+            referenced tables have changed.
+    """
+
+    def __init__(self, *, max_entries: int = 4096, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: collections.OrderedDict[str, _Entry] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: str,
+        *,
+        bqclient: google.cloud.bigquery.Client,
+        metadata_cache=None,
+        **kwargs,
+    ) -> Optional[pandas.Series]:
+        """Return cached dry run statistics if the source tables are unchanged."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+
+        expired = (
+            self.ttl_seconds is not None
+            and time.monotonic() - entry.stored_at >= self.ttl_seconds
+        )
+        if expired or not pandas_gbq.core.result_cache.tables_unmodified_since(
+            bqclient,
+            entry.referenced_tables,
+            entry.created,
+            metadata_cache=metadata_cache,
+        ):
+            logger.debug("Cached dry run for %s is stale.", key)
+            self.invalidate(key)
+            return None
+
+        return entry.stats.copy()
+
+    def put(
+        self,
+        key: str,
+        stats: Optional[pandas.Series],
+        *,
+        query_job: Optional[google.cloud.bigquery.QueryJob],
+    ) -> None:
+        """Store dry run statistics, if they are eligible for caching."""
+        if stats is None or query_job is None or query_job.created is None:
+            return
+
+        referenced_tables = [
+            f"{table.project}.{table.dataset_id}.{table.table_id}"
+            for table in (query_job.referenced_tables or ())
+        ]
+        if not referenced_tables:
+            return
+
+        created = query_job.created
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=datetime.timezone.utc)
+
+        entry = _Entry(
+            stats=stats.copy(),
+            referenced_tables=referenced_tables,
+            created=created,
+            stored_at=time.monotonic(),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """Remove a single entry from the cache."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,140 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Keep track of the BigQuery jobs started within a block, to cancel them."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import logging
+import threading
+from typing import Any, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JobTracker:
+    """Collect the BigQuery jobs started by pandas-gbq, so they can be cancelled.
+
+    Jobs started by :func:`pandas_gbq.read_gbq`, :func:`pandas_gbq.to_gbq`
+    and the other functions of pandas-gbq are tracked while a thread is
+    within :meth:`tracking`. Call :meth:`cancel_all` from any thread to stop
+    them. Queries waiting for a tracked job then raise
+    :class:`pandas_gbq.exceptions.QueryCancelled`.
+
+    While a tracker is active, queries always create a job before waiting
+    for it, rather than use the faster API for short queries, whose job
+    isn't known until it finishes.
+
+    Examples:
+        >>> import concurrent.futures
+        >>> import pandas_gbq
+        >>> tracker = pandas_gbq.JobTracker()
+        >>> def read():
+        ...     with tracker.tracking():
+        ...         return pandas_gbq.read_gbq("SELECT ...")
+        >>> future = concurrent.futures.ThreadPoolExecutor().submit(read)
+        >>> tracker.cancel_all()
+    """
+
+    def __init__(self):
+        self._jobs: List[Any] = []
+        self._lock = threading.Lock()
+        self._cancelled = False
+
+    @property
+    def jobs(self) -> List[Any]:
+        """Jobs started while this tracker was active."""
+        with self._lock:
+            return list(self._jobs)
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether :meth:`cancel_all` has been called."""
+        return self._cancelled
+
+    def add(self, job) -> None:
+        with self._lock:
+            self._jobs.append(job)
+            cancelled = self._cancelled
+        if cancelled:
+            # Started after cancel_all, so cancel it right away.
+            _cancel(job)
+
+    def cancel_all(self) -> None:
+        """Request cancellation of all tracked jobs that aren't done yet.
+
+        Jobs that are started with this tracker afterwards are cancelled as
+        soon as they start.
+        """
+        with self._lock:
+            self._cancelled = True
+        for job in self.jobs:
+            if job.state == "DONE":
+                continue
+            _cancel(job)
+
+    @contextlib.contextmanager
+    def tracking(self) -> Iterator[JobTracker]:
+        """Track the jobs started by this thread within the block.
+
+        If the block raises, such as on :class:`KeyboardInterrupt`, all
+        tracked jobs that are still running are cancelled.
+        """
+        with tracking(self):
+            try:
+                yield self
+            except BaseException:
+                self.cancel_all()
+                raise
+
+
+def _cancel(job) -> None:
+    import google.api_core.exceptions
+
+    try:
+        job.cancel()
+    except google.api_core.exceptions.GoogleAPICallError as ex:
+        # The job may have finished in the meantime.
+        logger.debug("Could not cancel job %s: %s", job.job_id, ex)
+
+
+# Trackers can be nested, such as a tracker for the queries of one call within
+# a caller's tracker, so keep all active trackers, innermost last.
+_current_trackers: contextvars.ContextVar[
+    Tuple[JobTracker, ...]
+] = contextvars.ContextVar("pandas_gbq_job_trackers", default=())
+
+
+def current() -> Optional[JobTracker]:
+    """Return the innermost active tracker, if any."""
+    trackers = _current_trackers.get()
+    return trackers[-1] if trackers else None
+
+
+def cancelled() -> bool:
+    """Whether any active tracker has been cancelled."""
+    return any(tracker.cancelled for tracker in _current_trackers.get())
+
+
+def track(job):
+    """Record ``job`` with all active trackers, if any, and return it."""
+    if job is not None:
+        for tracker in _current_trackers.get():
+            tracker.add(job)
+    return job
+
+
+@contextlib.contextmanager
+def tracking(tracker: JobTracker) -> Iterator[JobTracker]:
+    """Record jobs started within this block with ``tracker``.
+
+    Jobs are also recorded with any trackers that were already active.
+    """
+    token = _current_trackers.set(_current_trackers.get() + (tracker,))
+    try:
+        yield tracker
+    finally:
+        _current_trackers.reset(token)
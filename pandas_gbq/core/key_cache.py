@@ -0,0 +1,106 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""In-memory cache of the rows fetched for each key by ``read_gbq_by_keys``."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import threading
+import time
+import typing
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+# Only import at module-level at type checking time to avoid circular
+# dependencies in the pandas package, which has an optional dependency on
+# pandas-gbq.
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    import pandas
+
+
+@dataclasses.dataclass
+class _Entry:
+    rows: pandas.DataFrame
+    stored_at: float
+
+
+class KeyCache:
+    """A least recently used cache of rows, by the key they were looked up by.
+
+    Used by :func:`pandas_gbq.read_gbq_by_keys` so that keys fetched by an
+    earlier call aren't queried again. Keys without any matching rows are
+    cached too.
+
+    Entries aren't checked against changes to the table. Use ``ttl_seconds``
+    to bound how stale the cached rows can be.
+
+    This object is safe to share across threads.
+
+    Args:
+        max_keys:
+            Maximum number of keys to keep rows for. The least recently used
+            keys are removed first.
+        ttl_seconds:
+            Optional. Maximum age of the rows cached for a key.
+    """
+
+    def __init__(self, *, max_keys: int = 10_000, ttl_seconds: Optional[float] = None):
+        self.max_keys = max_keys
+        self.ttl_seconds = ttl_seconds
+        self._entries: collections.OrderedDict[
+            Hashable, _Entry
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(
+        self, namespace: Hashable, keys: Iterable[Any]
+    ) -> Dict[Any, pandas.DataFrame]:
+        """Return the cached rows for each of ``keys`` that is in the cache.
+
+        Args:
+            namespace:
+                Identifies the table, key column and selected columns that
+                the rows were read from.
+            keys:
+                Key values to look up.
+        """
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                cache_key = (namespace, key)
+                entry = self._entries.get(cache_key)
+                if entry is None:
+                    continue
+                if (
+                    self.ttl_seconds is not None
+                    and now - entry.stored_at >= self.ttl_seconds
+                ):
+                    del self._entries[cache_key]
+                    continue
+                self._entries.move_to_end(cache_key)
+                found[key] = entry.rows
+        return found
+
+    def put_many(
+        self, namespace: Hashable, rows_by_key: Iterable[Tuple[Any, pandas.DataFrame]]
+    ) -> None:
+        """Store the rows read for each key."""
+        now = time.monotonic()
+        with self._lock:
+            for key, rows in rows_by_key:
+                cache_key = (namespace, key)
+                self._entries[cache_key] = _Entry(rows=rows, stored_at=now)
+                self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,216 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""In-process cache of query results with a per-entry time-to-live."""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import contextvars
+import dataclasses
+import logging
+import threading
+import time
+import typing
+from typing import Callable, Optional
+
+import google.cloud.bigquery
+
+# Only import at module-level at type checking time to avoid circular
+# dependencies in the pandas package, which has an optional dependency on
+# pandas-gbq.
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    import pandas
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class _Entry:
+    df: pandas.DataFrame
+    stored_at: float
+    num_bytes: int
+
+
+class MemoryCache:
+    """An in-memory cache of query results with a time-to-live (TTL).
+
+    Unlike :class:`pandas_gbq.ResultCache`, entries are not validated against
+    the modification time of the referenced tables, so a cache hit doesn't
+    make any API requests. Results may be up to ``ttl_seconds`` old (plus
+    ``stale_seconds`` when ``stale_while_revalidate`` is enabled).
+
+    Each call to :func:`pandas_gbq.read_gbq` that hits the cache gets its own
+    copy of the cached DataFrame, so modifying the result doesn't affect other
+    callers.
+
+    This object is safe to share across threads.
+
+    Args:
+        ttl_seconds:
+            How long an entry is considered fresh.
+        max_entries:
+            Maximum number of results to keep. The least recently used entries
+            are removed first.
+        max_bytes:
+            Optional. Maximum total in-memory size of the cached DataFrames.
+        stale_while_revalidate:
+            If ``True``, return an expired entry right away and refresh it in a
+            background thread.
+        stale_seconds:
+            How long past ``ttl_seconds`` an expired entry can still be
+            returned while it is refreshed. Defaults to ``ttl_seconds``.
+        max_refresh_workers:
+            Maximum number of background threads used to refresh entries.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        stale_while_revalidate: bool = False,
+        stale_seconds: Optional[float] = None,
+        max_refresh_workers: int = 4,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_seconds = ttl_seconds if stale_seconds is None else stale_seconds
+        self._max_refresh_workers = max_refresh_workers
+        self._entries: collections.OrderedDict[str, _Entry] = collections.OrderedDict()
+        self._total_bytes = 0
+        self._refreshing = set()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: str,
+        *,
+        refresh: Optional[Callable[[], Optional[pandas.DataFrame]]] = None,
+        **kwargs,
+    ) -> Optional[pandas.DataFrame]:
+        """Return a copy of the cached results for ``key``, if still usable.
+
+        Args:
+            key:
+                Cache key, such as from
+                :func:`pandas_gbq.core.result_cache.make_key`.
+            refresh:
+                Optional. Callable that re-runs the query and stores the new
+                results with :meth:`put`. Used to refresh expired entries in
+                the background when ``stale_while_revalidate`` is enabled.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            age = now - entry.stored_at
+            if age >= self.ttl_seconds:
+                if (
+                    not self.stale_while_revalidate
+                    or refresh is None
+                    or age >= self.ttl_seconds + self.stale_seconds
+                ):
+                    self._remove(key)
+                    return None
+                self._start_refresh(key, refresh)
+
+            self._entries.move_to_end(key)
+            df = entry.df
+
+        return df.copy()
+
+    def put(
+        self,
+        key: str,
+        df: Optional[pandas.DataFrame],
+        *,
+        query_job: Optional[google.cloud.bigquery.QueryJob],
+    ) -> None:
+        """Store query results, if they are eligible for caching.
+
+        Only the results of ``SELECT`` statements are cached, so that repeated
+        DML or DDL statements are never skipped.
+        """
+        if df is None or query_job is None or query_job.statement_type != "SELECT":
+            return
+
+        # Copy so that callers modifying their results, such as with
+        # set_index(..., inplace=True), don't modify the cached entry.
+        df = df.copy()
+        num_bytes = int(df.memory_usage(index=True, deep=True).sum())
+        if self.max_bytes is not None and num_bytes > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(
+                df=df, stored_at=time.monotonic(), num_bytes=num_bytes
+            )
+            self._total_bytes += num_bytes
+            self._evict()
+
+    def invalidate(self, key: str) -> None:
+        """Remove a single entry from the cache."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.num_bytes
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.num_bytes
+
+    def _start_refresh(self, key: str, refresh: Callable):
+        # Only refresh each key once, even if many callers see it expired.
+        if key in self._refreshing:
+            return
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_refresh_workers,
+                thread_name_prefix="pandas_gbq_cache_refresh",
+            )
+
+        self._refreshing.add(key)
+        # Executor threads don't inherit context variables, such as the
+        # context used by a pandas_gbq.Session, so refresh in a copy of the
+        # caller's.
+        ctx = contextvars.copy_context()
+        self._executor.submit(ctx.run, self._refresh, key, refresh)
+
+    def _refresh(self, key: str, refresh: Callable):
+        try:
+            refresh()
+        except Exception as ex:
+            # Keep serving the stale entry until it is too old. The error will
+            # surface to a caller once the entry can no longer be used.
+            logger.warning("Could not refresh cached results: %s", ex)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
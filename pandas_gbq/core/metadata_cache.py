@@ -0,0 +1,145 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Cache of table and dataset metadata, shared by pandas-gbq API calls."""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+import typing
+from typing import Any, Optional, Union
+
+import google.api_core.exceptions
+import google.cloud.bigquery
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    _TableRef = Union[
+        google.cloud.bigquery.Table,
+        google.cloud.bigquery.TableReference,
+        str,
+    ]
+    _DatasetRef = Union[
+        google.cloud.bigquery.Dataset,
+        google.cloud.bigquery.DatasetReference,
+        str,
+    ]
+
+
+def _copy_resource(resource: Any) -> Any:
+    # Callers may modify the returned object, so don't share the cached
+    # instance.
+    if isinstance(
+        resource, (google.cloud.bigquery.Table, google.cloud.bigquery.Dataset)
+    ):
+        return type(resource).from_api_repr(resource.to_api_repr())
+    return resource
+
+
+def _table_key(table: _TableRef) -> str:
+    if isinstance(table, str):
+        table = google.cloud.bigquery.TableReference.from_string(table)
+    return f"table:{table.project}.{table.dataset_id}.{table.table_id}"
+
+
+def _dataset_key(dataset: _DatasetRef) -> str:
+    if isinstance(dataset, str):
+        dataset = google.cloud.bigquery.DatasetReference.from_string(dataset)
+    return f"dataset:{dataset.project}.{dataset.dataset_id}"
+
+
+class MetadataCache:
+    """A cache of BigQuery table and dataset metadata with a time-to-live.
+
+    Calls to ``get_table`` and ``get_dataset`` are shared across the places
+    that pandas-gbq looks up metadata, such as checking whether the
+    destination of :func:`pandas_gbq.to_gbq` exists. "Not found" responses are
+    cached too. pandas-gbq invalidates entries for the tables and datasets it
+    creates, deletes, or loads data into. Call :meth:`invalidate_table` or
+    :meth:`clear` if tables are modified by other means.
+
+    This object is safe to share across threads.
+
+    Args:
+        ttl_seconds:
+            How long an entry is used before fetching the metadata again. If
+            ``None``, entries never expire.
+        max_entries:
+            Maximum number of tables and datasets to keep. The least recently
+            used entries are removed first.
+    """
+
+    def __init__(self, *, ttl_seconds: Optional[float] = 60.0, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[str, tuple] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_table(
+        self, bqclient: google.cloud.bigquery.Client, table: _TableRef
+    ) -> google.cloud.bigquery.Table:
+        """Get table metadata, from the cache if possible.
+
+        Raises:
+            google.api_core.exceptions.NotFound: If the table doesn't exist.
+        """
+        return self._get(_table_key(table), lambda: bqclient.get_table(table))
+
+    def get_dataset(
+        self, bqclient: google.cloud.bigquery.Client, dataset: _DatasetRef
+    ) -> google.cloud.bigquery.Dataset:
+        """Get dataset metadata, from the cache if possible.
+
+        Raises:
+            google.api_core.exceptions.NotFound: If the dataset doesn't exist.
+        """
+        return self._get(_dataset_key(dataset), lambda: bqclient.get_dataset(dataset))
+
+    def invalidate_table(self, table: _TableRef) -> None:
+        """Remove a table from the cache."""
+        with self._lock:
+            self._entries.pop(_table_key(table), None)
+
+    def invalidate_dataset(self, dataset: _DatasetRef) -> None:
+        """Remove a dataset from the cache."""
+        with self._lock:
+            self._entries.pop(_dataset_key(dataset), None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: str, fetch) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, resource, not_found = entry
+                if self.ttl_seconds is None or now - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    if not_found is not None:
+                        raise google.api_core.exceptions.NotFound(not_found)
+                    return _copy_resource(resource)
+                del self._entries[key]
+
+        try:
+            resource = fetch()
+        except google.api_core.exceptions.NotFound as ex:
+            self._put(key, None, ex.message)
+            raise
+
+        self._put(key, resource, None)
+        return _copy_resource(resource)
+
+    def _put(self, key: str, resource, not_found):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), resource, not_found)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
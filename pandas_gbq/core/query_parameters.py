@@ -0,0 +1,108 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Convert Python values to BigQuery query parameters."""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import google.cloud.bigquery
+import numpy as np
+import pandas
+
+QueryParameters = Union[
+    Mapping[str, Any],
+    Sequence[google.cloud.bigquery.query._AbstractQueryParameter],
+]
+
+
+def to_python_value(value: Any) -> Any:
+    """Convert a NumPy scalar, such as from ``Series.unique()``, to Python."""
+    if isinstance(value, np.datetime64):
+        # item() returns an int for nanosecond precision, so use pandas.
+        return pandas.Timestamp(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def parameter_type(value: Any) -> Optional[str]:
+    """Return the BigQuery type for a Python value, or ``None`` if unknown."""
+    value = to_python_value(value)
+    # Check bool before int, since bool is a subclass of int.
+    if isinstance(value, bool):
+        return "BOOL"
+    if isinstance(value, int):
+        return "INT64"
+    if isinstance(value, float):
+        return "FLOAT64"
+    if isinstance(value, decimal.Decimal):
+        return "NUMERIC"
+    if isinstance(value, str):
+        return "STRING"
+    if isinstance(value, bytes):
+        return "BYTES"
+    # Check datetime before date, since datetime is a subclass of date.
+    if isinstance(value, datetime.datetime):
+        return "DATETIME" if value.tzinfo is None else "TIMESTAMP"
+    if isinstance(value, datetime.date):
+        return "DATE"
+    if isinstance(value, datetime.time):
+        return "TIME"
+    return None
+
+
+def _array_type(name: str, values: Sequence[Any]) -> str:
+    types = {parameter_type(value) for value in values if value is not None}
+    if None in types or len(types) != 1:
+        raise ValueError(
+            f"Can't infer the BigQuery type of the elements of query parameter "
+            f"{name!r}. Pass a google.cloud.bigquery.ArrayQueryParameter instead."
+        )
+    return types.pop()
+
+
+def _to_parameter(name: str, value: Any):
+    if isinstance(value, google.cloud.bigquery.query._AbstractQueryParameter):
+        return value
+    if isinstance(value, (list, tuple, np.ndarray)):
+        values = [to_python_value(element) for element in value]
+        return google.cloud.bigquery.ArrayQueryParameter(
+            name, _array_type(name, values), values
+        )
+
+    value = to_python_value(value)
+    type_ = parameter_type(value)
+    if type_ is None:
+        # NULL parameters still need a type, so they can't be inferred either.
+        raise ValueError(
+            f"Can't infer the BigQuery type of query parameter {name!r} from "
+            f"{value!r}. Pass a google.cloud.bigquery.ScalarQueryParameter "
+            "instead."
+        )
+    return google.cloud.bigquery.ScalarQueryParameter(name, type_, value)
+
+
+def to_api_repr(query_parameters: QueryParameters) -> List[Dict[str, Any]]:
+    """Convert query parameters to their REST API representation.
+
+    Args:
+        query_parameters:
+            Either a mapping from parameter name to value, or a sequence of
+            ``google.cloud.bigquery`` query parameter objects. In a mapping,
+            values can also be query parameter objects, lists, tuples and
+            NumPy arrays become ``ARRAY`` parameters, and NumPy scalars are
+            converted to their Python equivalents.
+    """
+    if isinstance(query_parameters, Mapping):
+        parameters = [
+            _to_parameter(name, value) for name, value in query_parameters.items()
+        ]
+    else:
+        parameters = list(query_parameters)
+
+    return [parameter.to_api_repr() for parameter in parameters]
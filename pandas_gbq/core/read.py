@@ -118,6 +118,8 @@ def download_results(
     max_results: Optional[int],
     user_dtypes: Optional[dict],
     use_bqstorage_api: bool,
+    metadata_cache=None,
+    bqstorage_client=None,
 ) -> Optional[pandas.DataFrame]:
     # No results are desired, so don't bother downloading anything.
     if max_results == 0:
@@ -138,7 +140,10 @@ def download_results(
         warn_on_large_results
         and (table_ref := getattr(results, "_table", None)) is not None
     ):
-        table = bqclient.get_table(table_ref)
+        if metadata_cache is None:
+            table = bqclient.get_table(table_ref)
+        else:
+            table = metadata_cache.get_table(bqclient, table_ref)
         if (
             isinstance((num_bytes := table.num_bytes), int)
             and num_bytes > pandas_gbq.constants.BYTES_TO_RECOMMEND_BIGFRAMES
@@ -165,11 +170,20 @@ def download_results(
         schema_fields = [field.to_api_repr() for field in results.schema]
         conversion_dtypes = _bqschema_to_nullsafe_dtypes(schema_fields)
         conversion_dtypes.update(user_dtypes)
-        df = results.to_dataframe(
-            dtypes=conversion_dtypes,
-            progress_bar_type=progress_bar_type,
-            create_bqstorage_client=create_bqstorage_client,
-        )
+        if create_bqstorage_client and bqstorage_client is not None:
+            # Use a long-lived client, such as from the client pool, rather
+            # than opening a new gRPC channel for each download.
+            df = results.to_dataframe(
+                bqstorage_client=bqstorage_client,
+                dtypes=conversion_dtypes,
+                progress_bar_type=progress_bar_type,
+            )
+        else:
+            df = results.to_dataframe(
+                dtypes=conversion_dtypes,
+                progress_bar_type=progress_bar_type,
+                create_bqstorage_client=create_bqstorage_client,
+            )
     except pandas_gbq.constants.HTTP_ERRORS as ex:
         raise pandas_gbq.exceptions.translate_exception(ex) from ex
 
@@ -0,0 +1,385 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""On-disk cache of query results, validated against table modification times."""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import re
+import threading
+import typing
+from typing import Any, Dict, Iterable, Optional, Sequence
+import uuid
+
+import google.api_core.exceptions
+import google.cloud.bigquery
+
+import pandas_gbq.constants
+
+# Only import at module-level at type checking time to avoid circular
+# dependencies in the pandas package, which has an optional dependency on
+# pandas-gbq.
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    import pandas
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1 * pandas_gbq.constants.BYTES_IN_GIB
+
+_FILE_FORMATS = {
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+_METADATA_SUFFIX = ".json"
+
+# Functions whose results differ from one run to the next, even when the
+# referenced tables don't change. BigQuery's own cache skips these queries,
+# too. Mentions in string literals or comments are matched as well, which only
+# means such queries aren't cached.
+_NON_DETERMINISTIC_FUNCTIONS = re.compile(
+    r"\b(?:CURRENT_(?:DATE|DATETIME|TIME|TIMESTAMP)\b"
+    r"|(?:RAND|GENERATE_UUID|SESSION_USER|NOW)\s*\()",
+    re.IGNORECASE,
+)
+
+
+def is_deterministic(query: str) -> bool:
+    """Whether ``query`` calls no functions with per-run results, like ``RAND()``."""
+    return _NON_DETERMINISTIC_FUNCTIONS.search(query) is None
+
+
+def make_key(
+    query: str,
+    *,
+    dialect: str,
+    location: Optional[str],
+    project_id: Optional[str],
+    configuration: Optional[Dict[str, Any]] = None,
+    max_results: Optional[int] = None,
+    dtypes: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Create a stable cache key for a query and the options that affect its results.
+
+    Only leading and trailing whitespace is stripped from the query text.
+    Whitespace inside the query could be part of a string literal, so it is
+    not safe to collapse.
+    """
+    key_parts = {
+        "query": query.strip(),
+        "dialect": dialect,
+        "location": location,
+        "project_id": project_id,
+        "configuration": configuration,
+        "max_results": max_results,
+        "dtypes": None if dtypes is None else {k: str(v) for k, v in dtypes.items()},
+    }
+    serialized = json.dumps(key_parts, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def get_query_job(
+    bqclient: google.cloud.bigquery.Client,
+    rows_iter: google.cloud.bigquery.table.RowIterator,
+    *,
+    project_id: Optional[str],
+) -> Optional[google.cloud.bigquery.QueryJob]:
+    """Find the job that produced ``rows_iter``, fetching it if needed.
+
+    The ``query_and_wait`` code path only returns a job ID, so job statistics
+    such as the referenced tables require an additional API request.
+    """
+    query_job = getattr(rows_iter, "job", None)
+    if query_job is not None:
+        return query_job
+
+    job_id = getattr(rows_iter, "job_id", None)
+    if job_id is None:
+        return None
+
+    return bqclient.get_job(
+        job_id, project=project_id, location=getattr(rows_iter, "location", None)
+    )
+
+
+def tables_unmodified_since(
+    bqclient: google.cloud.bigquery.Client,
+    table_ids: Iterable[str],
+    since: datetime.datetime,
+    *,
+    metadata_cache=None,
+) -> bool:
+    """Check that none of the given tables have changed since a point in time.
+
+    Tables that can change without updating ``lastModifiedTime``, such as
+    external tables and tables with an active streaming buffer, are always
+    considered modified. If ``metadata_cache`` is set, table metadata is
+    read through it.
+    """
+    for table_id in table_ids:
+        try:
+            if metadata_cache is None:
+                table = bqclient.get_table(table_id)
+            else:
+                table = metadata_cache.get_table(bqclient, table_id)
+        except google.api_core.exceptions.NotFound:
+            return False
+
+        if table.table_type == "EXTERNAL" or table.streaming_buffer is not None:
+            return False
+
+        if table.modified is None or table.modified > since:
+            return False
+
+    return True
+
+
+class ResultCache:
+    """A local, on-disk cache of query results.
+
+    Results are stored under ``directory`` as Parquet (default) or Arrow IPC
+    files. When the total size of the cache exceeds ``max_bytes``, the least
+    recently used entries are removed.
+
+    Entries are only used if none of the tables referenced by the original
+    query have been modified since that query started. Only ``SELECT``
+    statements which reference at least one table are cached, since queries
+    that don't read from a table may depend on non-deterministic functions
+    such as ``CURRENT_TIMESTAMP()``.
+
+    Args:
+        directory:
+            Directory to store cached results in. Created if it doesn't exist.
+        max_bytes:
+            Maximum total size of the cached files, in bytes.
+        file_format:
+            Either ``"parquet"`` or ``"arrow"`` (Arrow IPC / Feather V2).
+    """
+
+    def __init__(
+        self,
+        directory,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        file_format: str = "parquet",
+    ):
+        if file_format not in _FILE_FORMATS:
+            raise ValueError(
+                f"Got unexpected file_format {repr(file_format)}. "
+                f"Expected one of {sorted(_FILE_FORMATS)}."
+            )
+
+        self.directory = pathlib.Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        self.file_format = file_format
+        self._lock = threading.Lock()
+
+    def _data_path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}{_FILE_FORMATS[self.file_format]}"
+
+    def _metadata_path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}{_METADATA_SUFFIX}"
+
+    def _read_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._metadata_path(key), "r", encoding="utf-8") as metadata_file:
+                return json.load(metadata_file)
+        except (OSError, ValueError):
+            return None
+
+    def _read_dataframe(self, path: pathlib.Path) -> pandas.DataFrame:
+        import pandas
+
+        if self.file_format == "arrow":
+            return pandas.read_feather(path)
+        return pandas.read_parquet(path)
+
+    def _write_dataframe(self, df: pandas.DataFrame, path: pathlib.Path):
+        if self.file_format == "arrow":
+            df.to_feather(path)
+        else:
+            df.to_parquet(path, index=False)
+
+    def _atomic_write(self, path: pathlib.Path, write_fn):
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            write_fn(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def get_entry(self, key: str) -> Optional[tuple]:
+        """Return the cached DataFrame and metadata for ``key``, if present.
+
+        This does not check whether the entry is stale.
+        """
+        metadata = self._read_metadata(key)
+        data_path = self._data_path(key)
+        if metadata is None or not data_path.exists():
+            return None
+
+        try:
+            df = self._read_dataframe(data_path)
+        except (OSError, ValueError) as ex:
+            logger.debug("Could not read cached results %s: %s", data_path, ex)
+            self.invalidate(key)
+            return None
+
+        # Track recency of use with the file modification time so that the
+        # least recently used entries can be evicted first.
+        try:
+            os.utime(data_path)
+        except OSError:
+            pass
+
+        return df, metadata
+
+    def get(
+        self,
+        key: str,
+        *,
+        bqclient: google.cloud.bigquery.Client,
+        **kwargs,
+    ) -> Optional[pandas.DataFrame]:
+        """Return cached results for ``key`` if the source tables are unchanged."""
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+
+        df, metadata = entry
+        started = datetime.datetime.fromtimestamp(
+            metadata["created_ms"] / 1000.0, tz=datetime.timezone.utc
+        )
+        if not tables_unmodified_since(
+            bqclient, metadata["referenced_tables"], started
+        ):
+            logger.debug("Cached results for %s are stale.", key)
+            self.invalidate(key)
+            return None
+
+        logger.debug("Using cached results for %s.", key)
+        return df
+
+    def put_entry(
+        self, key: str, df: pandas.DataFrame, metadata: Dict[str, Any]
+    ) -> None:
+        """Store ``df`` with arbitrary JSON-serializable ``metadata``."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data_path = self._data_path(key)
+
+        with self._lock:
+            try:
+                self._atomic_write(
+                    data_path, lambda path: self._write_dataframe(df, path)
+                )
+                self._atomic_write(
+                    self._metadata_path(key),
+                    lambda path: path.write_text(
+                        json.dumps(metadata), encoding="utf-8"
+                    ),
+                )
+            except (OSError, ValueError, TypeError) as ex:
+                # Caching is an optimization, so don't fail the user's request
+                # if the results can't be serialized.
+                logger.debug("Could not cache results for %s: %s", key, ex)
+                self._remove(key)
+                return
+
+            self._evict()
+
+    def put(
+        self,
+        key: str,
+        df: Optional[pandas.DataFrame],
+        *,
+        query_job: Optional[google.cloud.bigquery.QueryJob],
+    ) -> None:
+        """Store query results, if they are eligible for caching.
+
+        Only ``SELECT`` statements that reference at least one table are
+        cached. Queries that call non-deterministic functions, such as
+        ``RAND()``, ``GENERATE_UUID()`` or ``CURRENT_TIMESTAMP()``, are not.
+        """
+        if df is None or query_job is None:
+            return
+
+        if query_job.statement_type != "SELECT" or query_job.created is None:
+            return
+
+        # Replaying one run of a random or time-dependent query would be wrong.
+        if not is_deterministic(query_job.query or ""):
+            return
+
+        referenced_tables = [
+            f"{table.project}.{table.dataset_id}.{table.table_id}"
+            for table in (query_job.referenced_tables or ())
+        ]
+        if not referenced_tables:
+            return
+
+        created = query_job.created
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=datetime.timezone.utc)
+
+        self.put_entry(
+            key,
+            df,
+            {
+                "created_ms": created.timestamp() * 1000.0,
+                "referenced_tables": referenced_tables,
+            },
+        )
+
+    def invalidate(self, key: str) -> None:
+        """Remove a single entry from the cache."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            for path in self._data_paths():
+                self._remove(path.stem)
+
+    def _remove(self, key: str):
+        for path in (self._data_path(key), self._metadata_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _data_paths(self) -> Sequence[pathlib.Path]:
+        if not self.directory.exists():
+            return []
+        suffix = _FILE_FORMATS[self.file_format]
+        return [
+            path
+            for path in self.directory.iterdir()
+            if path.suffix == suffix and not path.name.startswith(".")
+        ]
+
+    def _evict(self):
+        entries = []
+        for path in self._data_paths():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Removed by another process sharing this directory.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        # Oldest access time first.
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(path.stem)
+            total_bytes -= size
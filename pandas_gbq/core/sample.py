@@ -4,8 +4,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import typing
-from typing import Optional, Sequence, Union
+from typing import Callable, Optional, Sequence, Union
 
 import google.cloud.bigquery
 import google.cloud.bigquery.table
@@ -13,6 +16,7 @@ import google.oauth2.credentials
 import psutil
 
 import pandas_gbq.constants
+import pandas_gbq.contexts
 import pandas_gbq.core.read
 import pandas_gbq.core.biglake
 import pandas_gbq.gbq_connector
@@ -25,6 +29,8 @@ if typing.TYPE_CHECKING:  # pragma: NO COVER
     import pandas
 
 
+logger = logging.getLogger(__name__)
+
 _READ_API_ELIGIBLE_TYPES = ("TABLE", "MATERIALIZED_VIEW", "EXTERNAL")
 _TABLESAMPLE_ELIGIBLE_TYPES = ("TABLE", "EXTERNAL")
 
@@ -205,6 +211,65 @@ def _sample_with_limit(
     )
 
 
+def _sample_cache_key(
+    table: google.cloud.bigquery.Table,
+    *,
+    target_mb: Optional[int],
+    method: str,
+) -> Optional[str]:
+    """Key for a cached sample, or ``None`` if the sample can't be cached.
+
+    Only tables whose modification time changes with their data are cached.
+    Views and external tables can change without updating ``modified``.
+    """
+    if (
+        table.table_type != "TABLE"
+        or table.modified is None
+        or table.streaming_buffer is not None
+    ):
+        return None
+
+    key_parts = {
+        "sample": f"{table.project}.{table.dataset_id}.{table.table_id}",
+        "modified": table.modified.isoformat(),
+        "target_mb": target_mb,
+        "method": method,
+    }
+    serialized = json.dumps(key_parts, sort_keys=True)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _sample_with_cache(
+    sample_fn: Callable[[], Optional[pandas.DataFrame]],
+    *,
+    cache,
+    table: google.cloud.bigquery.Table,
+    target_mb: Optional[int],
+    method: str,
+) -> Optional[pandas.DataFrame]:
+    key = None
+    if cache is not None:
+        key = _sample_cache_key(table, target_mb=target_mb, method=method)
+
+    if key is not None:
+        entry = cache.get_entry(key)
+        if entry is not None:
+            logger.debug("Using cached sample of %s.", table.table_id)
+            return entry[0]
+
+    df = sample_fn()
+    if key is not None and df is not None:
+        cache.put_entry(
+            key,
+            df,
+            {
+                "table_id": f"{table.project}.{table.dataset_id}.{table.table_id}",
+                "method": method,
+            },
+        )
+    return df
+
+
 def _sample_biglake_table(
     *,
     reference: pandas_gbq.core.resource_references.BigLakeTableId,
@@ -249,6 +314,8 @@ def _sample_bq_table(
     target_bytes: int,
     progress_bar_type: Union[str, None],
     use_bqstorage_api: bool,
+    target_mb: Optional[int] = None,
+    cache=None,
 ) -> Optional[pandas.DataFrame]:
     table = bqclient.get_table(
         google.cloud.bigquery.TableReference(
@@ -272,15 +339,25 @@ def _sample_bq_table(
         and num_bytes is not None
         and num_bytes <= target_bytes
     ):
-        rows_iter = bqclient.list_rows(table)
-        return pandas_gbq.core.read.download_results(
-            rows_iter,
-            bqclient=bqclient,
-            progress_bar_type=progress_bar_type,
-            warn_on_large_results=False,
-            max_results=None,
-            user_dtypes=None,
-            use_bqstorage_api=use_bqstorage_api,
+
+        def download_all():
+            rows_iter = bqclient.list_rows(table)
+            return pandas_gbq.core.read.download_results(
+                rows_iter,
+                bqclient=bqclient,
+                progress_bar_type=progress_bar_type,
+                warn_on_large_results=False,
+                max_results=None,
+                user_dtypes=None,
+                use_bqstorage_api=use_bqstorage_api,
+            )
+
+        return _sample_with_cache(
+            download_all,
+            cache=cache,
+            table=table,
+            target_mb=target_mb,
+            method="download",
         )
 
     target_row_count = _estimate_limit(
@@ -293,23 +370,35 @@ def _sample_bq_table(
     # Table is eligible for TABLESAMPLE.
     if num_bytes is not None and table_type in _TABLESAMPLE_ELIGIBLE_TYPES:
         proportion = target_bytes / num_bytes
-        return _sample_with_tablesample(
+        return _sample_with_cache(
+            lambda: _sample_with_tablesample(
+                f"{table.project}.{table.dataset_id}.{table.table_id}",
+                bqclient=bqclient,
+                proportion=proportion,
+                target_row_count=target_row_count,
+                progress_bar_type=progress_bar_type,
+                use_bqstorage_api=use_bqstorage_api,
+            ),
+            cache=cache,
+            table=table,
+            target_mb=target_mb,
+            method="tablesample",
+        )
+
+    # Not eligible for TABLESAMPLE or reading directly, so take a random sample
+    # with a full table scan.
+    return _sample_with_cache(
+        lambda: _sample_with_limit(
             f"{table.project}.{table.dataset_id}.{table.table_id}",
             bqclient=bqclient,
-            proportion=proportion,
             target_row_count=target_row_count,
             progress_bar_type=progress_bar_type,
             use_bqstorage_api=use_bqstorage_api,
-        )
-
-    # Not eligible for TABLESAMPLE or reading directly, so take a random sample
-    # with a full table scan.
-    return _sample_with_limit(
-        f"{table.project}.{table.dataset_id}.{table.table_id}",
-        bqclient=bqclient,
-        target_row_count=target_row_count,
-        progress_bar_type=progress_bar_type,
-        use_bqstorage_api=use_bqstorage_api,
+        ),
+        cache=cache,
+        table=table,
+        target_mb=target_mb,
+        method="limit",
     )
 
 
@@ -367,11 +456,18 @@ def sample(
         use_bqstorage_api: Optional. If `True`, use the BigQuery Storage Read
             API for faster downloads. Defaults to `True`.
 
+    If :attr:`pandas_gbq.context.sample_cache` is set, samples of tables are
+    stored on disk and reused until the table is modified. A cached sample is
+    only used for calls with the same ``target_mb``. Samples of views,
+    external tables, tables with a streaming buffer, and BigLake tables are
+    not cached.
+
     Returns:
         A `pandas.DataFrame` containing the sampled data, or `None` if no data
         could be sampled.
     """
     target_bytes = _calculate_target_bytes(target_mb)
+    cache = pandas_gbq.contexts.get_context().sample_cache
     connector = pandas_gbq.gbq_connector.GbqConnector(
         project_id=billing_project_id, credentials=credentials
     )
@@ -395,4 +491,6 @@ def sample(
             target_bytes=target_bytes,
             progress_bar_type=progress_bar_type,
             use_bqstorage_api=use_bqstorage_api,
+            target_mb=target_mb,
+            cache=cache,
         )
@@ -0,0 +1,368 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Limit how many BigQuery jobs start, to stay within quotas."""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import contextvars
+import dataclasses
+import itertools
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas_gbq.contexts
+
+_current_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "pandas_gbq_job_priority", default=0
+)
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1
+
+
+@dataclasses.dataclass
+class Ticket:
+    """Permission to run a job, returned by :meth:`JobScheduler.acquire`."""
+
+    project_id: Optional[str]
+    table_id: Optional[str]
+    priority: int
+    granted: bool = False
+
+
+class JobScheduler:
+    """Queue BigQuery jobs so that they start within quota limits.
+
+    Set :attr:`pandas_gbq.context.job_scheduler` to share a scheduler among
+    all threads of a process. Query jobs from :func:`pandas_gbq.read_gbq` and
+    load jobs from :func:`pandas_gbq.to_gbq` then wait in a queue until they
+    can start without exceeding any of the limits, rather than failing with a
+    quota error.
+
+    Concurrency limits count jobs from when they start until they finish.
+    Rate limits are token buckets, which allow bursts of up to the bucket
+    size, then a steady rate. Limits on tables apply to load jobs and to
+    queries with a destination table.
+
+    Jobs with a higher priority start first. A job with a lower priority only
+    starts ahead of a waiting job with a higher priority if they don't share
+    a project or table.
+
+    Args:
+        max_concurrent_jobs_per_project:
+            Optional. Maximum number of running jobs in each project.
+        max_concurrent_jobs_per_table:
+            Optional. Maximum number of running jobs writing to each table.
+        jobs_per_second:
+            Optional. Maximum rate at which jobs start in each project.
+        job_burst:
+            Number of jobs that can start at once in a project, before being
+            limited to ``jobs_per_second``. Defaults to ``jobs_per_second``,
+            or 1 if that's lower.
+        table_updates_per_second:
+            Optional. Maximum rate at which jobs writing to each table start.
+        table_update_burst:
+            Number of jobs that can start writing to a table at once, before
+            being limited to ``table_updates_per_second``. Defaults to
+            ``table_updates_per_second``, or 1 if that's lower.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent_jobs_per_project: Optional[int] = None,
+        max_concurrent_jobs_per_table: Optional[int] = None,
+        jobs_per_second: Optional[float] = None,
+        job_burst: Optional[float] = None,
+        table_updates_per_second: Optional[float] = None,
+        table_update_burst: Optional[float] = None,
+    ):
+        for name, value in (
+            ("max_concurrent_jobs_per_project", max_concurrent_jobs_per_project),
+            ("max_concurrent_jobs_per_table", max_concurrent_jobs_per_table),
+            ("jobs_per_second", jobs_per_second),
+            ("table_updates_per_second", table_updates_per_second),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}.")
+        for name, value in (
+            ("job_burst", job_burst),
+            ("table_update_burst", table_update_burst),
+        ):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}.")
+
+        self.max_concurrent_jobs_per_project = max_concurrent_jobs_per_project
+        self.max_concurrent_jobs_per_table = max_concurrent_jobs_per_table
+        self.jobs_per_second = jobs_per_second
+        self.job_burst = _default_burst(job_burst, jobs_per_second)
+        self.table_updates_per_second = table_updates_per_second
+        self.table_update_burst = _default_burst(
+            table_update_burst, table_updates_per_second
+        )
+
+        self._condition = threading.Condition()
+        self._counter = itertools.count()
+        self._waiting: List[Tuple[int, int, Ticket]] = []
+        self._running_by_project: Dict[Optional[str], int] = {}
+        self._running_by_table: Dict[str, int] = {}
+        self._project_buckets: Dict[Optional[str], _TokenBucket] = {}
+        self._table_buckets: Dict[str, _TokenBucket] = {}
+
+    @property
+    def waiting(self) -> int:
+        """Number of jobs waiting to start."""
+        with self._condition:
+            return len(self._waiting)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def priority(value: int) -> Iterator[None]:
+        """Set the priority of jobs started by this thread within the block.
+
+        Jobs have priority 0 by default. Higher values start first.
+        """
+        token = _current_priority.set(value)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+
+    def acquire(
+        self,
+        project_id: Optional[str],
+        *,
+        table_id: Optional[str] = None,
+        priority: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Ticket:
+        """Wait until a job can start, and count it as running.
+
+        Call :meth:`release` with the returned ticket once the job finishes.
+
+        Args:
+            project_id:
+                Project the job runs in.
+            table_id:
+                Optional. Table that the job writes to, in the format
+                ``project.dataset.table``.
+            priority:
+                Optional. Priority of the job. Defaults to the priority set
+                with :meth:`priority`, or 0.
+            timeout:
+                Optional. Maximum number of seconds to wait.
+
+        Raises:
+            TimeoutError: If the job can't start within ``timeout`` seconds.
+        """
+        if priority is None:
+            priority = _current_priority.get()
+        ticket = Ticket(project_id=project_id, table_id=table_id, priority=priority)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            bisect.insort(self._waiting, (-priority, next(self._counter), ticket))
+            try:
+                while True:
+                    delay = self._dispatch(time.monotonic())
+                    if ticket.granted:
+                        return ticket
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise TimeoutError(
+                                f"Timed out after {timeout} seconds waiting "
+                                "to start a BigQuery job."
+                            )
+                        delay = remaining if delay is None else min(delay, remaining)
+                    self._condition.wait(delay)
+            except BaseException:
+                if ticket.granted:
+                    self._release(ticket)
+                else:
+                    self._waiting = [
+                        entry for entry in self._waiting if entry[2] is not ticket
+                    ]
+                self._condition.notify_all()
+                raise
+
+    def release(self, ticket: Ticket) -> None:
+        """Count the job for ``ticket`` as finished."""
+        with self._condition:
+            self._release(ticket)
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def slot(
+        self,
+        project_id: Optional[str],
+        *,
+        table_id: Optional[str] = None,
+        priority: Optional[int] = None,
+    ) -> Iterator[Ticket]:
+        """Run a job within the block, once it can start."""
+        ticket = self.acquire(project_id, table_id=table_id, priority=priority)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def _release(self, ticket: Ticket) -> None:
+        if not ticket.granted:
+            return
+        ticket.granted = False
+        _decrement(self._running_by_project, ticket.project_id)
+        if ticket.table_id is not None:
+            _decrement(self._running_by_table, ticket.table_id)
+
+    def _project_delay(self, project_id: Optional[str], now: float) -> Optional[float]:
+        """Seconds until the project allows a job, or ``None`` if one must finish."""
+        if (
+            self.max_concurrent_jobs_per_project is not None
+            and self._running_by_project.get(project_id, 0)
+            >= self.max_concurrent_jobs_per_project
+        ):
+            return None
+        if self.jobs_per_second is None:
+            return 0.0
+        return self._project_bucket(project_id, now).delay(now)
+
+    def _table_delay(self, table_id: Optional[str], now: float) -> Optional[float]:
+        """Seconds until the table allows a job, or ``None`` if one must finish."""
+        if table_id is None:
+            return 0.0
+        if (
+            self.max_concurrent_jobs_per_table is not None
+            and self._running_by_table.get(table_id, 0)
+            >= self.max_concurrent_jobs_per_table
+        ):
+            return None
+        if self.table_updates_per_second is None:
+            return 0.0
+        return self._table_bucket(table_id, now).delay(now)
+
+    def _dispatch(self, now: float) -> Optional[float]:
+        """Start the waiting jobs that can start, in priority order.
+
+        Returns the number of seconds until a rate limit allows another job
+        to start, or ``None`` if only a finishing job can unblock the rest.
+        """
+        next_delay: Optional[float] = None
+        blocked_projects = set()
+        blocked_tables = set()
+        still_waiting = []
+
+        for entry in self._waiting:
+            ticket = entry[2]
+            if ticket.project_id in blocked_projects or (
+                ticket.table_id is not None and ticket.table_id in blocked_tables
+            ):
+                still_waiting.append(entry)
+                continue
+
+            project_delay = self._project_delay(ticket.project_id, now)
+            table_delay = self._table_delay(ticket.table_id, now)
+            if project_delay == 0 and table_delay == 0:
+                self._start(ticket, now)
+                # Wake up the thread waiting for this ticket.
+                self._condition.notify_all()
+                continue
+
+            # Don't let jobs with a lower priority take this job's turn, but
+            # only block the limits that are holding it back, so that jobs
+            # for other tables in the same project can still start.
+            still_waiting.append(entry)
+            if project_delay != 0:
+                blocked_projects.add(ticket.project_id)
+            if table_delay != 0:
+                blocked_tables.add(ticket.table_id)
+            if project_delay is not None and table_delay is not None:
+                delay = max(project_delay, table_delay)
+                next_delay = delay if next_delay is None else min(next_delay, delay)
+
+        self._waiting = still_waiting
+        return next_delay
+
+    def _start(self, ticket: Ticket, now: float) -> None:
+        ticket.granted = True
+        project_id, table_id = ticket.project_id, ticket.table_id
+        self._running_by_project[project_id] = (
+            self._running_by_project.get(project_id, 0) + 1
+        )
+        if self.jobs_per_second is not None:
+            self._project_bucket(project_id, now).take(now)
+        if table_id is not None:
+            self._running_by_table[table_id] = (
+                self._running_by_table.get(table_id, 0) + 1
+            )
+            if self.table_updates_per_second is not None:
+                self._table_bucket(table_id, now).take(now)
+
+    def _project_bucket(self, project_id: Optional[str], now: float) -> _TokenBucket:
+        bucket = self._project_buckets.get(project_id)
+        if bucket is None:
+            bucket = _TokenBucket(self.jobs_per_second, self.job_burst, now)
+            self._project_buckets[project_id] = bucket
+        return bucket
+
+    def _table_bucket(self, table_id: str, now: float) -> _TokenBucket:
+        bucket = self._table_buckets.get(table_id)
+        if bucket is None:
+            bucket = _TokenBucket(
+                self.table_updates_per_second, self.table_update_burst, now
+            )
+            self._table_buckets[table_id] = bucket
+        return bucket
+
+
+def _default_burst(burst: Optional[float], rate: Optional[float]) -> float:
+    if burst is not None:
+        return burst
+    if rate is None:
+        return 1.0
+    return max(1.0, rate)
+
+
+def _decrement(counts: Dict, key) -> None:
+    counts[key] -= 1
+    if counts[key] <= 0:
+        del counts[key]
+
+
+@contextlib.contextmanager
+def job_slot(
+    project_id: Optional[str], *, table_id: Optional[str] = None
+) -> Iterator[None]:
+    """Wait for the active context's job scheduler, if any, to start a job."""
+    scheduler = pandas_gbq.contexts.get_context().job_scheduler
+    if scheduler is None:
+        yield
+        return
+
+    with scheduler.slot(project_id, table_id=table_id):
+        yield
@@ -0,0 +1,283 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Share access tokens among processes on the same host.
+
+Each process in a prefork server or multiprocessing pool otherwise fetches
+its own access token from the metadata server or OAuth 2.0 endpoint. When
+many workers do so at the same time, those endpoints throttle them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime
+import json
+import logging
+import os
+import pathlib
+import sys
+import threading
+from typing import Any, Dict, Iterator, Optional
+import uuid
+
+import google.auth.credentials
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_REMAINING_SECONDS = 300.0
+
+
+def _utcnow() -> datetime.datetime:
+    # google-auth stores expiry as a naive datetime in UTC.
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+if sys.platform == "win32":  # pragma: NO COVER
+    import msvcrt
+
+    def _lock_file(lock_file):
+        lock_file.seek(0)
+        # LK_LOCK retries for about 10 seconds, so keep trying after that.
+        while True:
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(lock_file):
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(lock_file):
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(lock_file):
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _default_key(credentials) -> str:
+    credentials_type = type(credentials)
+    account = None
+    for attribute in ("service_account_email", "signer_email", "account"):
+        value = getattr(credentials, attribute, None)
+        if isinstance(value, str) and value:
+            account = value
+            break
+    scopes = getattr(credentials, "scopes", None) or ()
+    return json.dumps(
+        [
+            f"{credentials_type.__module__}.{credentials_type.__qualname__}",
+            account,
+            sorted(scopes),
+        ]
+    )
+
+
+class FileTokenStore:
+    """Access tokens shared among processes through a file on local disk.
+
+    Use :meth:`wrap` to get credentials that check this file before
+    refreshing. While one process refreshes a token, others wait for the file
+    lock and then reuse the new token instead of refreshing it themselves.
+
+    The file contains bearer tokens, so it is created readable only by the
+    current user. Don't put it on a shared network drive.
+
+    Args:
+        path:
+            Path of the JSON file to store tokens in. A ``.lock`` file is
+            created next to it.
+        min_remaining_seconds:
+            Only reuse a stored token if it is valid for at least this many
+            more seconds.
+
+    Examples:
+        >>> import pandas_gbq
+        >>> pandas_gbq.context.token_store = pandas_gbq.FileTokenStore(
+        ...     '/var/run/my-service/bigquery-tokens.json',
+        ... )
+    """
+
+    def __init__(
+        self,
+        path,
+        *,
+        min_remaining_seconds: float = DEFAULT_MIN_REMAINING_SECONDS,
+    ):
+        self.path = pathlib.Path(path).expanduser()
+        self.min_remaining_seconds = min_remaining_seconds
+        self._lock_path = self.path.with_name(f"{self.path.name}.lock")
+        # File locks only exclude other processes (or other open files), so
+        # also serialize threads in this process.
+        self._thread_lock = threading.Lock()
+
+    def wrap(
+        self, credentials: google.auth.credentials.Credentials, *, key=None
+    ) -> google.auth.credentials.Credentials:
+        """Get credentials that share their access token through this store.
+
+        Args:
+            credentials:
+                Credentials to use when the stored token needs a refresh.
+            key:
+                Optional. Name of the token in the store. Defaults to a name
+                based on the type, account and scopes of ``credentials``.
+                Processes share a token only if they use the same key.
+
+        Returns:
+            google.auth.credentials.Credentials:
+                Credentials that can be passed to any pandas-gbq function or
+                Google API client.
+        """
+        if isinstance(credentials, SharedTokenCredentials):
+            return credentials
+        if key is None:
+            key = _default_key(credentials)
+        return SharedTokenCredentials(credentials, store=self, key=key)
+
+    def clear(self) -> None:
+        """Remove all stored tokens."""
+        with self.locked():
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the store's file lock, excluding other threads and processes."""
+        with self._thread_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._lock_path, "a+b") as lock_file:
+                _lock_file(lock_file)
+                try:
+                    yield
+                finally:
+                    _unlock_file(lock_file)
+
+    def get_token(self, key: str):
+        """Get a stored token that is valid long enough to reuse.
+
+        Call this while holding :meth:`locked`.
+
+        Returns:
+            Optional[Tuple[str, Optional[datetime.datetime]]]:
+                The token and its expiry, or ``None`` if there isn't a token
+                that can be reused.
+        """
+        entry = self._read().get(key)
+        if not isinstance(entry, dict) or not entry.get("token"):
+            return None
+
+        expiry = entry.get("expiry")
+        if expiry is not None:
+            try:
+                expiry = datetime.datetime.fromisoformat(expiry)
+            except (TypeError, ValueError):
+                return None
+            remaining = (expiry - _utcnow()).total_seconds()
+            if remaining < self.min_remaining_seconds:
+                return None
+
+        return entry["token"], expiry
+
+    def put_token(
+        self, key: str, token: str, expiry: Optional[datetime.datetime]
+    ) -> None:
+        """Store a token. Call this while holding :meth:`locked`."""
+        if expiry is not None and expiry.tzinfo is not None:
+            expiry = expiry.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+        entries = self._read()
+        now = _utcnow()
+        # Drop expired tokens, so that the file doesn't grow without bound.
+        entries = {
+            entry_key: entry
+            for entry_key, entry in entries.items()
+            if isinstance(entry, dict) and not _is_expired(entry, now)
+        }
+        entries[key] = {
+            "token": token,
+            "expiry": None if expiry is None else expiry.isoformat(),
+        }
+        self._write(entries)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as token_file:
+                entries = json.load(token_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as ex:
+            logger.debug("Could not read token store %s: %s", self.path, ex)
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries: Dict[str, Any]) -> None:
+        tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with open(fd, "w", encoding="utf-8") as token_file:
+                json.dump(entries, token_file)
+            os.replace(tmp_path, self.path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+
+def _is_expired(entry: Dict[str, Any], now: datetime.datetime) -> bool:
+    expiry = entry.get("expiry")
+    if expiry is None:
+        return False
+    try:
+        return datetime.datetime.fromisoformat(expiry) <= now
+    except (TypeError, ValueError):
+        return True
+
+
+class SharedTokenCredentials(google.auth.credentials.Credentials):
+    """Credentials that get their access token from a :class:`FileTokenStore`.
+
+    Only refreshes the wrapped credentials if no other process has stored a
+    fresh enough token. Create these with :meth:`FileTokenStore.wrap`.
+    """
+
+    def __init__(self, credentials, *, store: FileTokenStore, key: str):
+        super().__init__()
+        self._wrapped = credentials
+        self._store = store
+        self._key = key
+        self.token = credentials.token
+        self.expiry = credentials.expiry
+        self._quota_project_id = credentials.quota_project_id
+        self._universe_domain = credentials.universe_domain
+
+    @property
+    def wrapped(self):
+        """The credentials used to refresh the shared token."""
+        return self._wrapped
+
+    def __getattr__(self, name):
+        # Expose attributes of the wrapped credentials, such as project_id
+        # and service_account_email.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._wrapped, name)
+
+    def refresh(self, request):
+        with self._store.locked():
+            stored = self._store.get_token(self._key)
+            if stored is not None:
+                self.token, self.expiry = stored
+                return
+
+            self._wrapped.refresh(request)
+            self.token = self._wrapped.token
+            self.expiry = self._wrapped.expiry
+            self._store.put_token(self._key, self.token, self.expiry)
@@ -4,8 +4,10 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import copy
-from typing import Any, List
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from google.cloud import bigquery
 import pandas
@@ -68,3 +70,98 @@ def get_query_stats(
         result["totalBytesProcessed"] = int(result["totalBytesProcessed"])
 
     return result
+
+
+def dry_run_many(
+    queries: Iterable[str],
+    *,
+    project_id: Optional[str] = None,
+    location: Optional[str] = None,
+    dialect: Optional[str] = None,
+    configuration: Optional[Dict[str, Any]] = None,
+    credentials=None,
+    max_workers: int = 8,
+    return_exceptions: bool = False,
+) -> List[Union[pandas.Series, Exception]]:
+    """Dry run many queries concurrently.
+
+    Each query is sent as a separate dry run, using up to ``max_workers``
+    threads and a single BigQuery client. If
+    :attr:`pandas_gbq.context.dry_run_cache` is set, statistics for queries
+    whose referenced tables haven't changed are returned from the cache.
+
+    Args:
+        queries:
+            SQL queries to dry run.
+        project_id:
+            Optional. Google Cloud project ID. Optional when available from
+            the environment.
+        location:
+            Optional. Location where the query jobs run.
+        dialect:
+            Optional. SQL dialect, either ``'standard'`` or ``'legacy'``.
+            Defaults to :attr:`pandas_gbq.context.dialect`, or ``'standard'``.
+        configuration:
+            Optional. Query job configuration, as in
+            :func:`pandas_gbq.read_gbq`, applied to every query.
+        credentials:
+            Optional. Credentials for accessing Google APIs.
+        max_workers:
+            Maximum number of dry runs to send at the same time.
+        return_exceptions:
+            If ``True``, return the exception raised for a query in its place
+            in the results, rather than raising it.
+
+    Returns:
+        A list with the statistics of each query, in the same order as
+        ``queries``, in the same format as :func:`pandas_gbq.read_gbq` with
+        ``dry_run=True``.
+    """
+    # Avoid a circular import, since the connector uses this module.
+    import pandas_gbq.contexts
+    import pandas_gbq.gbq
+    from pandas_gbq.gbq_connector import GbqConnector
+
+    queries = list(queries)
+    if not queries:
+        return []
+
+    if dialect is None:
+        dialect = pandas_gbq.contexts.get_context().dialect or "standard"
+    if dialect not in ("legacy", "standard"):
+        raise ValueError("'{0}' is not valid for dialect".format(dialect))
+
+    configuration = pandas_gbq.gbq._transform_read_gbq_configuration(configuration)
+    connector = GbqConnector(
+        project_id,
+        dialect=dialect,
+        location=location,
+        credentials=credentials,
+    )
+
+    def dry_run(query):
+        return connector.run_query(query, configuration=configuration, dry_run=True)
+
+    results: List[Union[pandas.Series, Exception]] = []
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(queries)),
+        thread_name_prefix="pandas_gbq_dry_run",
+    ) as executor:
+        # Executor threads don't inherit context variables, such as the
+        # context used by a pandas_gbq.Session, so run each dry run in a copy
+        # of the caller's.
+        futures = [
+            executor.submit(contextvars.copy_context().run, dry_run, query)
+            for query in queries
+        ]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as ex:
+                if not return_exceptions:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                results.append(ex)
+
+    return results
@@ -3,10 +3,12 @@
 # license that can be found in the LICENSE file.
 
 
+import functools
 import importlib
 import json
 import os
 import pathlib
+from typing import Tuple
 
 Path = pathlib.Path
 
@@ -21,6 +23,11 @@ GOOGLE_CLOUD_CODE_EXTENSION_NAME = "googlecloudtools.cloudcode"
 BIGQUERY_JUPYTER_PLUGIN_NAME = "bigquery_jupyter_plugin"
 
 
+# Set this environment variable to any non-empty value to skip detecting the
+# environment, such as in server deployments where no IDE or notebook is used.
+SKIP_DETECTION_ENV_VAR = "PANDAS_GBQ_SKIP_ENVIRONMENT_DETECTION"
+
+
 def _is_vscode_extension_installed(extension_id: str) -> bool:
     """
     Checks if a given Visual Studio Code extension is installed.
@@ -97,3 +104,32 @@ def is_vscode_google_cloud_code_extension_installed() -> bool:
 
 def is_jupyter_bigquery_plugin_installed() -> bool:
     return _is_package_installed(BIGQUERY_JUPYTER_PLUGIN_NAME)
+
+
+@functools.lru_cache(maxsize=None)
+def get_identities() -> Tuple[str, ...]:
+    """
+    Identifies the IDE or notebook environment for the user agent.
+
+    Detection may scan the filesystem and import packages, so the result is
+    computed once per process.
+
+    Returns:
+        Identities such as ``("vscode", "googlecloudtools.cloudcode")``, or an
+        empty tuple if no environment was detected or detection is disabled
+        by setting the ``PANDAS_GBQ_SKIP_ENVIRONMENT_DETECTION`` environment
+        variable.
+    """
+    if os.getenv(SKIP_DETECTION_ENV_VAR):
+        return ()
+
+    identities = []
+    if is_vscode():
+        identities.append("vscode")
+        if is_vscode_google_cloud_code_extension_installed():
+            identities.append(GOOGLE_CLOUD_CODE_EXTENSION_NAME)
+    elif is_jupyter():
+        identities.append("jupyter")
+        if is_jupyter_bigquery_plugin_installed():
+            identities.append(BIGQUERY_JUPYTER_PLUGIN_NAME)
+    return tuple(identities)
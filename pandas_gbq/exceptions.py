@@ -86,6 +86,13 @@ class ConversionError(GenericGBQException):
     """
 
 
+class BytesBilledLimitExceeded(GenericGBQException):
+    """
+    Raised when a query would bill more bytes than its ``max_bytes_billed``
+    limit.
+    """
+
+
 class InvalidPrivateKeyFormat(ValueError):
     """
     Raised when provided private key has invalid format.
@@ -105,6 +112,13 @@ class PerformanceWarning(RuntimeWarning):
     """
 
 
+class QueryCancelled(ValueError):
+    """
+    Raised when a query job is cancelled with
+    :meth:`pandas_gbq.JobTracker.cancel_all`.
+    """
+
+
 class QueryTimeout(ValueError):
     """
     Raised when the query request exceeds the timeoutMs value specified in the
@@ -126,6 +140,8 @@ def translate_exception(ex):
     elif "schema does not match" in message:
         error_message = ex.errors[0]["message"]
         return InvalidSchema(f"Reason: {error_message}")
+    elif "exceeded limit for bytes billed" in message:
+        return BytesBilledLimitExceeded("Reason: {0}".format(ex))
     elif "already exists: table" in message:
         error_message = ex.errors[0]["message"]
         return TableCreationError(f"Reason: {error_message}")
@@ -4,11 +4,22 @@
 
 """Module for checking dependency versions and supported features."""
 
+import functools
+
 # https://github.com/googleapis/python-bigquery/blob/main/CHANGELOG.md
 BIGQUERY_MINIMUM_VERSION = "3.4.2"
 BIGQUERY_QUERY_AND_WAIT_VERSION = "3.14.0"
 PANDAS_VERBOSITY_DEPRECATION_VERSION = "0.23.0"
 PANDAS_BOOLEAN_DTYPE_VERSION = "1.0.0"
+PANDAS_COPY_ON_WRITE_DEFAULT_VERSION = "3.0.0"
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_version(version: str):
+    # Feature checks run on every API call, so only parse each version once.
+    import packaging.version
+
+    return packaging.version.parse(version)
 
 
 class Features:
@@ -18,22 +29,20 @@ class Features:
 
     @property
     def bigquery_installed_version(self):
-        import google.cloud.bigquery
-        import packaging.version
-
         if self._bigquery_installed_version is not None:
             return self._bigquery_installed_version
 
-        self._bigquery_installed_version = packaging.version.parse(
+        import google.cloud.bigquery
+
+        self._bigquery_installed_version = _parse_version(
             google.cloud.bigquery.__version__
         )
         return self._bigquery_installed_version
 
     def bigquery_try_import(self):
         import google.cloud.bigquery
-        import packaging.version
 
-        bigquery_minimum_version = packaging.version.parse(BIGQUERY_MINIMUM_VERSION)
+        bigquery_minimum_version = _parse_version(BIGQUERY_MINIMUM_VERSION)
 
         if self.bigquery_installed_version < bigquery_minimum_version:
             raise ImportError(
@@ -47,38 +56,36 @@ class Features:
 
     @property
     def bigquery_has_query_and_wait(self):
-        import packaging.version
-
-        min_version = packaging.version.parse(BIGQUERY_QUERY_AND_WAIT_VERSION)
+        min_version = _parse_version(BIGQUERY_QUERY_AND_WAIT_VERSION)
         return self.bigquery_installed_version >= min_version
 
     @property
     def pandas_installed_version(self):
-        import packaging.version
-        import pandas
-
         if self._pandas_installed_version is not None:
             return self._pandas_installed_version
 
-        self._pandas_installed_version = packaging.version.parse(pandas.__version__)
+        import pandas
+
+        self._pandas_installed_version = _parse_version(pandas.__version__)
         return self._pandas_installed_version
 
     @property
     def pandas_has_deprecated_verbose(self):
-        import packaging.version
-
         # Add check for Pandas version before showing deprecation warning.
         # https://github.com/pydata/pandas-gbq/issues/157
-        pandas_verbosity_deprecation = packaging.version.parse(
+        pandas_verbosity_deprecation = _parse_version(
             PANDAS_VERBOSITY_DEPRECATION_VERSION
         )
         return self.pandas_installed_version >= pandas_verbosity_deprecation
 
     @property
     def pandas_has_boolean_dtype(self):
-        import packaging.version
+        desired_version = _parse_version(PANDAS_BOOLEAN_DTYPE_VERSION)
+        return self.pandas_installed_version >= desired_version
 
-        desired_version = packaging.version.parse(PANDAS_BOOLEAN_DTYPE_VERSION)
+    @property
+    def pandas_has_copy_on_write_by_default(self):
+        desired_version = _parse_version(PANDAS_COPY_ON_WRITE_DEFAULT_VERSION)
         return self.pandas_installed_version >= desired_version
 
 
@@ -2,8 +2,8 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-import copy
 from datetime import datetime
+import functools
 import logging
 import re
 import typing
@@ -12,7 +12,8 @@ import warnings
 import pandas
 
 from pandas_gbq.contexts import Context  # noqa - backward compatible export
-from pandas_gbq.contexts import context
+from pandas_gbq.contexts import context  # noqa - backward compatible export
+from pandas_gbq.contexts import get_context
 from pandas_gbq.exceptions import (  # noqa - backward compatible export
     DatasetCreationError,
     GenericGBQException,
@@ -27,12 +28,16 @@ from pandas_gbq.exceptions import QueryTimeout  # noqa - backward compatible exp
 from pandas_gbq.features import FEATURES
 from pandas_gbq.gbq_connector import GbqConnector  # noqa - backward compatible export
 from pandas_gbq.gbq_connector import _get_client  # noqa - backward compatible export
+import pandas_gbq.bigquery_session
+import pandas_gbq.core.metadata_cache
 import pandas_gbq.schema
 import pandas_gbq.schema.pandas_to_bigquery
 
 logger = logging.getLogger(__name__)
 
 
+# Only check once per process, since this runs on every call.
+@functools.lru_cache(maxsize=None)
 def _test_google_api_imports():
     try:
         import packaging  # noqa
@@ -84,15 +89,121 @@ def _transform_read_gbq_configuration(configuration):
     if timeout_ms is not None:
         # Transform timeoutMs to an actual server-side configuration.
         # https://github.com/googleapis/python-bigquery-pandas/issues/479
-        configuration = copy.deepcopy(configuration)
-        del configuration["query"]["timeoutMs"]
+        # Only the modified dictionaries need to be copied.
+        query_configuration = dict(configuration["query"])
+        del query_configuration["timeoutMs"]
+        configuration = dict(configuration, query=query_configuration)
         configuration["jobTimeoutMs"] = timeout_ms
 
     return configuration
 
 
-def read_gbq(
+def _prepare_read_gbq(
     query_or_table,
+    *,
+    dialect,
+    configuration,
+    query_parameters=None,
+    max_bytes_billed=None,
+):
+    """Validate the options of a read, returning the query and configuration."""
+    if dialect not in ("legacy", "standard"):
+        raise ValueError("'{0}' is not valid for dialect".format(dialect))
+
+    configuration = _transform_read_gbq_configuration(configuration)
+
+    if configuration and "query" in configuration and "query" in configuration["query"]:
+        if query_or_table is not None:
+            raise ValueError(
+                "Query statement can't be specified "
+                "inside config while it is specified "
+                "as parameter"
+            )
+        query_or_table = configuration["query"].pop("query")
+
+    if query_or_table is None:
+        raise ValueError("A query or table ID is required.")
+
+    if query_parameters:
+        configuration = _add_query_parameters(
+            query_or_table,
+            dialect=dialect,
+            configuration=configuration,
+            query_parameters=query_parameters,
+        )
+
+    if max_bytes_billed is not None and _is_query(query_or_table):
+        configuration = _add_max_bytes_billed(configuration, max_bytes_billed)
+
+    return query_or_table, configuration
+
+
+def _add_query_parameters(query_or_table, *, dialect, configuration, query_parameters):
+    import pandas_gbq.core.query_parameters
+
+    if not _is_query(query_or_table):
+        raise ValueError("query_parameters can only be used with a query.")
+    if dialect != "standard":
+        raise ValueError("query_parameters require dialect='standard'.")
+
+    # Copy the configuration, rather than modifying the caller's.
+    configuration = dict(configuration or {})
+    query_configuration = dict(configuration.get("query", {}))
+    query_configuration["queryParameters"] = list(
+        query_configuration.get("queryParameters", [])
+    ) + pandas_gbq.core.query_parameters.to_api_repr(query_parameters)
+    configuration["query"] = query_configuration
+    return configuration
+
+
+def _add_max_bytes_billed(configuration, max_bytes_billed):
+    if max_bytes_billed <= 0:
+        raise ValueError(f"max_bytes_billed must be positive, got {max_bytes_billed}.")
+
+    # A limit set in the configuration takes precedence.
+    query_configuration = (configuration or {}).get("query", {})
+    if query_configuration.get("maximumBytesBilled") is not None:
+        return configuration
+
+    configuration = dict(configuration or {})
+    query_configuration = dict(query_configuration)
+    query_configuration["maximumBytesBilled"] = str(int(max_bytes_billed))
+    configuration["query"] = query_configuration
+    return configuration
+
+
+def _finish_read_gbq(final_df, *, index_col, columns, col_order):
+    """Set the index and column order of a DataFrame read from BigQuery."""
+    # Reindex the DataFrame on the provided column
+    if index_col is not None:
+        if index_col in final_df.columns:
+            final_df.set_index(index_col, inplace=True)
+        else:
+            raise InvalidIndexColumn(
+                'Index column "{0}" does not exist in DataFrame.'.format(index_col)
+            )
+
+    # Using columns as an alias for col_order, raising an error if both provided
+    if col_order and not columns:
+        columns = col_order
+    elif col_order and columns:
+        raise ValueError(
+            "Must specify either columns (preferred) or col_order, not both"
+        )
+
+    # Change the order of columns in the DataFrame based on provided list
+    # TODO(kiraksi): allow columns to be a subset of all columns in the table, with follow up PR
+    if columns is not None:
+        if sorted(columns) == sorted(final_df.columns):
+            final_df = final_df[columns]
+        else:
+            raise InvalidColumnOrder("Column order does not match this DataFrame.")
+
+    return final_df
+
+
+def read_gbq(
+    query_or_table=None,
     project_id=None,
     index_col=None,
     columns=None,
@@ -115,6 +226,10 @@ def read_gbq(
     col_order=None,
     bigquery_client=None,
     dry_run: bool = False,
+    query_parameters=None,
+    job_id=None,
+    max_bytes_billed=None,
+    session=None,
 ):
     r"""Read data from Google BigQuery to a pandas DataFrame.
 
@@ -267,6 +382,42 @@ def read_gbq(
         data, while the project and credentials parameters will be ignored.
     dry_run : bool, default False
         If True, run a dry run query.
+    query_parameters : dict or list, optional
+        Values for the named parameters, such as ``@min_date``, of a
+        standard SQL query. Either a dict from parameter name to value, or a
+        list of :class:`google.cloud.bigquery.ScalarQueryParameter` and
+        :class:`google.cloud.bigquery.ArrayQueryParameter` objects. In a dict,
+        the BigQuery type is inferred from the Python type of each value,
+        including NumPy scalars, and lists and NumPy arrays become ``ARRAY``
+        parameters.
+
+        Since the query text stays the same for different values, results
+        can be reused by BigQuery's query cache and by
+        :attr:`pandas_gbq.context.result_cache`.
+    job_id : str, optional
+        ID of an existing query job to read the results of, instead of
+        running ``query_or_table``. The job isn't submitted again: pandas-gbq
+        waits for it to finish, if it's still running, then downloads the
+        table it wrote its results to, which BigQuery keeps for about 24
+        hours. Use ``project_id`` and ``location`` to set where the job ran.
+        Can't be used with ``query_or_table``, ``configuration``,
+        ``query_parameters`` or ``dry_run``.
+    max_bytes_billed : int, optional
+        Maximum number of bytes the query can bill. Defaults to
+        :attr:`pandas_gbq.context.max_bytes_billed`. Before the query runs,
+        a dry run estimates the bytes it will process, and the query is
+        rejected with :class:`pandas_gbq.exceptions.BytesBilledLimitExceeded`
+        if that's over the limit. Set
+        :attr:`pandas_gbq.context.dry_run_cache` to reuse these estimates.
+        The limit is also sent as ``maximumBytesBilled`` in the query job
+        configuration, unless ``configuration`` already sets it, so that
+        BigQuery enforces it too. Ignored when reading a table or a job.
+    session : pandas_gbq.BigQuerySession, optional
+        Run the query in this BigQuery session, where it can use the
+        session's temporary tables and variables. A temporary table ID such
+        as ``_SESSION.my_table`` is read with a ``SELECT *`` query in the
+        session. Results aren't shared through
+        :attr:`pandas_gbq.context.result_cache`.
     Returns
     -------
     df: DataFrame or Series
@@ -274,11 +425,14 @@ def read_gbq(
         a Pandas series that contains job statistics.
     """
     if dialect is None:
-        dialect = context.dialect
+        dialect = get_context().dialect
 
     if dialect is None:
         dialect = "standard"
 
+    if max_bytes_billed is None:
+        max_bytes_billed = get_context().max_bytes_billed
+
     _test_google_api_imports()
 
     if verbose is not None and FEATURES.pandas_has_deprecated_verbose:
@@ -290,19 +444,30 @@ def read_gbq(
             stacklevel=2,
         )
 
-    if dialect not in ("legacy", "standard"):
-        raise ValueError("'{0}' is not valid for dialect".format(dialect))
-
-    configuration = _transform_read_gbq_configuration(configuration)
-
-    if configuration and "query" in configuration and "query" in configuration["query"]:
+    if job_id is not None:
         if query_or_table is not None:
+            raise ValueError("Pass either query_or_table or job_id, not both.")
+        if configuration or query_parameters or dry_run:
             raise ValueError(
-                "Query statement can't be specified "
-                "inside config while it is specified "
-                "as parameter"
+                "job_id can't be used with configuration, query_parameters or "
+                "dry_run, since the job has already been submitted."
             )
-        query_or_table = configuration["query"].pop("query")
+    else:
+        if (
+            session is not None
+            and query_or_table is not None
+            and not _is_query(query_or_table)
+            and pandas_gbq.bigquery_session.is_session_table(query_or_table)
+        ):
+            # Temporary tables can only be read by a query in their session.
+            query_or_table = f"SELECT * FROM {query_or_table}"
+        query_or_table, configuration = _prepare_read_gbq(
+            query_or_table,
+            dialect=dialect,
+            configuration=configuration,
+            query_parameters=query_parameters,
+            max_bytes_billed=max_bytes_billed,
+        )
 
     connector = GbqConnector(
         project_id,
@@ -317,9 +482,17 @@ def read_gbq(
         client_id=client_id,
         client_secret=client_secret,
         bigquery_client=bigquery_client,
+        session=session,
     )
 
-    if _is_query(query_or_table):
+    if job_id is not None:
+        final_df = connector.download_job_results(
+            job_id,
+            max_results=max_results,
+            progress_bar_type=progress_bar_type,
+            dtypes=dtypes,
+        )
+    elif _is_query(query_or_table):
         final_df = connector.run_query(
             query_or_table,
             configuration=configuration,
@@ -327,6 +500,7 @@ def read_gbq(
             progress_bar_type=progress_bar_type,
             dtypes=dtypes,
             dry_run=dry_run,
+            check_bytes_billed=max_bytes_billed is not None,
         )
         # When dry_run=True, run_query returns a Pandas series
         if dry_run:
@@ -339,30 +513,9 @@ def read_gbq(
             dtypes=dtypes,
         )
 
-    # Reindex the DataFrame on the provided column
-    if index_col is not None:
-        if index_col in final_df.columns:
-            final_df.set_index(index_col, inplace=True)
-        else:
-            raise InvalidIndexColumn(
-                'Index column "{0}" does not exist in DataFrame.'.format(index_col)
-            )
-
-    # Using columns as an alias for col_order, raising an error if both provided
-    if col_order and not columns:
-        columns = col_order
-    elif col_order and columns:
-        raise ValueError(
-            "Must specify either columns (preferred) or col_order, not both"
-        )
-
-    # Change the order of columns in the DataFrame based on provided list
-    # TODO(kiraksi): allow columns to be a subset of all columns in the table, with follow up PR
-    if columns is not None:
-        if sorted(columns) == sorted(final_df.columns):
-            final_df = final_df[columns]
-        else:
-            raise InvalidColumnOrder("Column order does not match this DataFrame.")
+    final_df = _finish_read_gbq(
+        final_df, index_col=index_col, columns=columns, col_order=col_order
+    )
 
     connector.log_elapsed_seconds(
         "Total time taken",
@@ -401,6 +554,7 @@ def to_gbq(
     user_agent=None,
     rfc9110_delimiter=False,
     bigquery_client=None,
+    session=None,
 ):
     """Write a DataFrame to a Google BigQuery table.
 
@@ -534,6 +688,13 @@ def to_gbq(
         data, while the project, user_agent, and credentials parameters will be ignored.
 
         .. versionadded:: 0.23.3
+    session : pandas_gbq.BigQuerySession, optional
+        Run the load job in this BigQuery session. With a session,
+        ``destination_table`` can be a temporary table such as
+        ``_SESSION.my_table``, which later queries in the same session can
+        read. Temporary tables are created by the load job itself, so
+        ``clustering_columns`` and the partitioning options don't apply to
+        them.
     """
 
     # If we get a bigframes.pandas.DataFrame object, it may be possible to use
@@ -590,6 +751,12 @@ def to_gbq(
 
     write_disposition = dispositions_dict[if_exists]
 
+    # Without a shared metadata cache, still avoid looking up the same table
+    # and dataset more than once within this call.
+    metadata_cache = get_context().metadata_cache
+    if metadata_cache is None:
+        metadata_cache = pandas_gbq.core.metadata_cache.MetadataCache(ttl_seconds=None)
+
     connector = GbqConnector(
         project_id,
         reauth=reauth,
@@ -603,8 +770,9 @@ def to_gbq(
         user_agent=user_agent,
         rfc9110_delimiter=rfc9110_delimiter,
         bigquery_client=bigquery_client,
+        metadata_cache=metadata_cache,
+        session=session,
     )
-    bqclient = connector.client
 
     destination_table_ref = bigquery.table.TableReference.from_string(
         destination_table, default_project=connector.project_id
@@ -624,37 +792,45 @@ def to_gbq(
             default_schema, dict(fields=table_schema)
         )
 
-    try:
-        # Try to get the table
-        table = bqclient.get_table(destination_table_ref)
-    except google_exceptions.NotFound:
-        # If the table doesn't already exist, create it
-        table_connector = _Table(
-            project_id_table,
-            dataset_id,
-            location=location,
-            credentials=connector.credentials,
-        )
-        table_connector.create(
-            table_id,
-            table_schema,
-            clustering_columns=clustering_columns,
-            time_partitioning_column=time_partitioning_column,
-            time_partitioning_type=time_partitioning_type,
-            time_partitioning_expiration_ms=time_partitioning_expiration_ms,
-            range_partitioning_column=range_partitioning_column,
-            range_partitioning_range=range_partitioning_range,
-        )
+    if session is not None and pandas_gbq.bigquery_session.is_session_table(
+        destination_table
+    ):
+        # Temporary tables can't be looked up or created through the API, so
+        # the load job creates the table in the session.
+        pass
     else:
-        if if_exists == "append":
-            # Convert original schema (the schema that already exists) to pandas-gbq API format
-            original_schema = pandas_gbq.schema.to_pandas_gbq(table.schema)
-
-            # Update the local `table_schema` so mode (NULLABLE/REQUIRED)
-            # matches. See: https://github.com/pydata/pandas-gbq/issues/315
-            table_schema = pandas_gbq.schema.update_schema(
-                table_schema, original_schema
+        try:
+            # Try to get the table
+            table = connector.get_table(destination_table_ref)
+        except google_exceptions.NotFound:
+            # If the table doesn't already exist, create it
+            table_connector = _Table(
+                project_id_table,
+                dataset_id,
+                location=location,
+                credentials=connector.credentials,
+                metadata_cache=metadata_cache,
             )
+            table_connector.create(
+                table_id,
+                table_schema,
+                clustering_columns=clustering_columns,
+                time_partitioning_column=time_partitioning_column,
+                time_partitioning_type=time_partitioning_type,
+                time_partitioning_expiration_ms=time_partitioning_expiration_ms,
+                range_partitioning_column=range_partitioning_column,
+                range_partitioning_range=range_partitioning_range,
+            )
+        else:
+            if if_exists == "append":
+                # Convert original schema (the schema that already exists) to pandas-gbq API format
+                original_schema = pandas_gbq.schema.to_pandas_gbq(table.schema)
+
+                # Update the local `table_schema` so mode (NULLABLE/REQUIRED)
+                # matches. See: https://github.com/pydata/pandas-gbq/issues/315
+                table_schema = pandas_gbq.schema.update_schema(
+                    table_schema, original_schema
+                )
 
     if dataframe.empty:
         # Create the table (if needed), but don't try to run a load job with an
@@ -723,6 +899,7 @@ class _Table(GbqConnector):
         location=None,
         credentials=None,
         private_key=None,
+        metadata_cache=None,
     ):
         self.dataset_id = dataset_id
         super(_Table, self).__init__(
@@ -731,6 +908,7 @@ class _Table(GbqConnector):
             location=location,
             credentials=credentials,
             private_key=private_key,
+            metadata_cache=metadata_cache,
         )
 
     def _table_ref(self, table_id):
@@ -758,7 +936,7 @@ class _Table(GbqConnector):
 
         table_ref = self._table_ref(table_id)
         try:
-            self.client.get_table(table_ref)
+            self.get_table(table_ref)
             return True
         except NotFound:
             return False
@@ -810,14 +988,14 @@ class _Table(GbqConnector):
         if self.exists(table_id):
             raise TableCreationError("Table {0} already exists".format(table_id))
 
-        if not _Dataset(self.project_id, credentials=self.credentials).exists(
-            self.dataset_id
-        ):
-            _Dataset(
-                self.project_id,
-                credentials=self.credentials,
-                location=self.location,
-            ).create(self.dataset_id)
+        dataset_connector = _Dataset(
+            self.project_id,
+            credentials=self.credentials,
+            location=self.location,
+            metadata_cache=self.metadata_cache,
+        )
+        if not dataset_connector.exists(self.dataset_id):
+            dataset_connector.create(self.dataset_id)
 
         table_ref = TableReference(
             DatasetReference(self.project_id, self.dataset_id), table_id
@@ -849,6 +1027,8 @@ class _Table(GbqConnector):
             self.client.create_table(table)
         except self.http_error as ex:
             self.process_http_error(ex)
+        finally:
+            self.invalidate_table(table_ref)
 
     def delete(self, table_id):
         """Delete a table in Google BigQuery
@@ -868,6 +1048,8 @@ class _Table(GbqConnector):
             pass
         except self.http_error as ex:
             self.process_http_error(ex)
+        finally:
+            self.invalidate_table(table_ref)
 
 
 class _Dataset(GbqConnector):
@@ -878,6 +1060,7 @@ class _Dataset(GbqConnector):
         location=None,
         credentials=None,
         private_key=None,
+        metadata_cache=None,
     ):
         super(_Dataset, self).__init__(
             project_id,
@@ -885,6 +1068,7 @@ class _Dataset(GbqConnector):
             credentials=credentials,
             location=location,
             private_key=private_key,
+            metadata_cache=metadata_cache,
         )
 
     def _dataset_ref(self, dataset_id):
@@ -909,7 +1093,7 @@ class _Dataset(GbqConnector):
         from google.api_core.exceptions import NotFound
 
         try:
-            self.client.get_dataset(self._dataset_ref(dataset_id))
+            self.get_dataset(self._dataset_ref(dataset_id))
             return True
         except NotFound:
             return False
@@ -940,3 +1124,5 @@ class _Dataset(GbqConnector):
             self.client.create_dataset(dataset)
         except self.http_error as ex:
             self.process_http_error(ex)
+        finally:
+            self.invalidate_dataset(dataset.reference)
@@ -0,0 +1,312 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Coroutine versions of :func:`pandas_gbq.read_gbq` and :func:`pandas_gbq.to_gbq`.
+
+The BigQuery client library only has a blocking API, so each API request
+still runs in a thread of the event loop's default executor. Threads are
+only held for the duration of a request, though, not while waiting for a
+job to finish, which happens with ``asyncio.sleep`` between polls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import typing
+from typing import Any, Dict, Optional
+
+import pandas_gbq.core.job_tracker
+import pandas_gbq.exceptions
+import pandas_gbq.gbq
+import pandas_gbq.gbq_connector
+import pandas_gbq.query
+from pandas_gbq.contexts import get_context
+from pandas_gbq.gbq_connector import GbqConnector
+
+# Only import at module-level at type checking time to avoid circular
+# dependencies in the pandas package, which has an optional dependency on
+# pandas-gbq.
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    import pandas
+
+
+logger = logging.getLogger(__name__)
+
+
+def _run_blocking(func, *args, **kwargs) -> asyncio.Future:
+    # run_in_executor doesn't copy context variables, such as the context
+    # used by a pandas_gbq.Session, so copy them explicitly.
+    ctx = contextvars.copy_context()
+    return asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(ctx.run, func, *args, **kwargs)
+    )
+
+
+async def _cancel_job(client, query_job) -> None:
+    try:
+        await _run_blocking(
+            client.cancel_job, query_job.job_id, location=query_job.location
+        )
+    except Exception as ex:
+        logger.debug("Could not cancel job %s: %s", query_job.job_id, ex)
+
+
+async def _acquire(scheduler, project_id, *, table_id):
+    # Waiting for the scheduler blocks a thread of the executor.
+    acquire = _run_blocking(scheduler.acquire, project_id, table_id=table_id)
+    try:
+        return await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # The thread keeps waiting after this task is cancelled, so give the
+        # slot back once it's granted.
+        def release(future):
+            if not future.cancelled() and future.exception() is None:
+                scheduler.release(future.result())
+
+        acquire.add_done_callback(release)
+        raise
+
+
+async def _cancel_when_inserted(client, insert: asyncio.Future) -> None:
+    try:
+        query_job = await insert
+    except Exception:
+        # No job was created.
+        return
+    await _cancel_job(client, query_job)
+
+
+async def _wait_for_query_job(connector, query_job, timeout_ms: Optional[int]):
+    last_state = None
+    intervals = pandas_gbq.query._poll_intervals()
+    while True:
+        try:
+            done = await _run_blocking(query_job.done)
+        except connector.http_error as ex:
+            connector.process_http_error(ex)
+        last_state = pandas_gbq.query._report_state(query_job, last_state)
+        if done:
+            return
+
+        elapsed_seconds = connector.get_elapsed_seconds()
+        if timeout_ms and timeout_ms < elapsed_seconds * 1000:
+            await _cancel_job(connector.client, query_job)
+            raise pandas_gbq.exceptions.QueryTimeout(
+                "Query timeout: {} ms".format(timeout_ms)
+            )
+
+        delay = next(intervals)
+        if timeout_ms:
+            delay = max(0.0, min(delay, timeout_ms / 1000.0 - elapsed_seconds))
+        await asyncio.sleep(delay)
+
+
+async def _run_query(
+    connector,
+    query: str,
+    *,
+    configuration: Optional[Dict[str, Any]],
+    max_results: Optional[int],
+    progress_bar_type: Optional[str],
+    dtypes: Optional[Dict[str, Any]],
+) -> pandas.DataFrame:
+    from google.cloud import bigquery
+
+    job_config_dict, timeout_ms = connector._make_query_config(configuration)
+    job_config = bigquery.QueryJobConfig.from_api_repr(job_config_dict)
+    connector._start_timer()
+
+    scheduler = get_context().job_scheduler
+    ticket = None
+    if scheduler is not None:
+        ticket = await _acquire(
+            scheduler,
+            connector.project_id,
+            table_id=pandas_gbq.gbq_connector._destination_table_id(job_config_dict),
+        )
+
+    try:
+        insert = _run_blocking(
+            pandas_gbq.query.try_query,
+            connector,
+            functools.partial(
+                connector.client.query,
+                query,
+                job_config=job_config,
+                location=connector.location,
+                project=connector.project_id,
+            ),
+        )
+        try:
+            query_job = await asyncio.shield(insert)
+        except asyncio.CancelledError:
+            # The job is still being created, so cancel it once it exists.
+            await asyncio.shield(_cancel_when_inserted(connector.client, insert))
+            raise
+        logger.debug("Job ID: %s", query_job.job_id)
+
+        try:
+            await _wait_for_query_job(connector, query_job, timeout_ms)
+        except asyncio.CancelledError:
+            # Shield the cancellation request, so that it's sent even if the
+            # caller cancels this task again while waiting.
+            await asyncio.shield(_cancel_job(connector.client, query_job))
+            raise
+    finally:
+        if ticket is not None:
+            scheduler.release(ticket)
+
+    try:
+        rows_iter = await _run_blocking(query_job.result, max_results=max_results)
+    except connector.http_error as ex:
+        connector.process_http_error(ex)
+
+    # Converting Arrow data to pandas is CPU-bound, so keep it off the event
+    # loop.
+    return await _run_blocking(
+        connector._download_results,
+        rows_iter,
+        max_results=max_results,
+        progress_bar_type=progress_bar_type,
+        user_dtypes=dtypes,
+    )
+
+
+async def read_gbq_async(
+    query_or_table: str,
+    project_id: Optional[str] = None,
+    *,
+    index_col: Optional[str] = None,
+    columns=None,
+    dialect: Optional[str] = None,
+    location: Optional[str] = None,
+    configuration: Optional[Dict[str, Any]] = None,
+    credentials=None,
+    use_bqstorage_api: bool = False,
+    max_results: Optional[int] = None,
+    progress_bar_type: Optional[str] = None,
+    dtypes: Optional[Dict[str, Any]] = None,
+    bigquery_client=None,
+    dry_run: bool = False,
+    query_parameters=None,
+    max_bytes_billed: Optional[int] = None,
+) -> pandas.DataFrame:
+    """Read data from Google BigQuery without blocking the event loop.
+
+    Arguments have the same meaning as in :func:`pandas_gbq.read_gbq`. The
+    query job is polled with increasing intervals, using ``asyncio.sleep``
+    between polls, and the results are converted to a DataFrame in the event
+    loop's default executor.
+
+    Cancelling the task that awaits this coroutine also cancels the query
+    job.
+
+    Dry runs, and queries when :attr:`pandas_gbq.context.result_cache` or
+    :attr:`pandas_gbq.context.coalesce_requests` is set, run as they do in
+    :func:`pandas_gbq.read_gbq`, in the default executor.
+
+    Returns:
+        pandas.DataFrame or pandas.Series:
+            The query results, or job statistics if ``dry_run=True``.
+
+    Examples:
+        >>> import pandas_gbq
+        >>> df = await pandas_gbq.read_gbq_async("SELECT 1 AS x")
+    """
+    if dialect is None:
+        dialect = get_context().dialect
+    if dialect is None:
+        dialect = "standard"
+    if max_bytes_billed is None:
+        max_bytes_billed = get_context().max_bytes_billed
+
+    query_or_table, configuration = pandas_gbq.gbq._prepare_read_gbq(
+        query_or_table,
+        dialect=dialect,
+        configuration=configuration,
+        query_parameters=query_parameters,
+        max_bytes_billed=max_bytes_billed,
+    )
+
+    connector = await _run_blocking(
+        GbqConnector,
+        project_id,
+        dialect=dialect,
+        location=location,
+        credentials=credentials,
+        use_bqstorage_api=use_bqstorage_api,
+        bigquery_client=bigquery_client,
+    )
+
+    check_bytes_billed = max_bytes_billed is not None and not dry_run
+    if not pandas_gbq.gbq._is_query(query_or_table):
+        final_df = await _run_blocking(
+            connector.download_table,
+            query_or_table,
+            max_results=max_results,
+            progress_bar_type=progress_bar_type,
+            dtypes=dtypes,
+        )
+    elif dry_run or connector.result_cache is not None or connector.coalesce_requests:
+        final_df = await _run_blocking(
+            connector.run_query,
+            query_or_table,
+            configuration=configuration,
+            max_results=max_results,
+            progress_bar_type=progress_bar_type,
+            dtypes=dtypes,
+            dry_run=dry_run,
+            check_bytes_billed=check_bytes_billed,
+        )
+        if dry_run:
+            return final_df
+    else:
+        if check_bytes_billed:
+            await _run_blocking(
+                connector._check_bytes_billed, query_or_table, configuration
+            )
+        final_df = await _run_query(
+            connector,
+            query_or_table,
+            configuration=configuration,
+            max_results=max_results,
+            progress_bar_type=progress_bar_type,
+            dtypes=dtypes,
+        )
+
+    return pandas_gbq.gbq._finish_read_gbq(
+        final_df, index_col=index_col, columns=columns, col_order=None
+    )
+
+
+async def to_gbq_async(
+    dataframe: pandas.DataFrame, destination_table: str, **kwargs
+) -> None:
+    """Write a DataFrame to a BigQuery table without blocking the event loop.
+
+    Accepts the same arguments as :func:`pandas_gbq.to_gbq`, which runs in
+    the event loop's default executor. Cancelling the task that awaits this
+    coroutine cancels the load jobs that have started. The data already
+    uploaded for a running load job can't be recalled, and a job that
+    finishes before the cancellation request arrives is not rolled back.
+
+    Examples:
+        >>> import pandas_gbq
+        >>> await pandas_gbq.to_gbq_async(df, "my_dataset.my_table")
+    """
+    tracker = pandas_gbq.core.job_tracker.JobTracker()
+
+    def to_gbq():
+        with pandas_gbq.core.job_tracker.tracking(tracker):
+            return pandas_gbq.gbq.to_gbq(dataframe, destination_table, **kwargs)
+
+    future = _run_blocking(to_gbq)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.shield(_run_blocking(tracker.cancel_all))
+        raise
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import time
 import typing
@@ -18,8 +19,12 @@ if typing.TYPE_CHECKING:  # pragma: NO COVER
 
 from pandas_gbq import dry_runs
 import pandas_gbq.constants
-from pandas_gbq.contexts import context
+from pandas_gbq.contexts import get_context
+import pandas_gbq.core.client_pool
+import pandas_gbq.core.coalesce
 import pandas_gbq.core.read
+import pandas_gbq.core.result_cache
+import pandas_gbq.core.scheduler
 import pandas_gbq.environment as environment
 import pandas_gbq.exceptions
 from pandas_gbq.exceptions import QueryTimeout
@@ -51,12 +56,19 @@ class GbqConnector:
         user_agent=None,
         rfc9110_delimiter=False,
         bigquery_client=None,
+        metadata_cache=None,
+        session=None,
     ):
         from pandas_gbq import auth
 
+        context = get_context()
         self.http_error = pandas_gbq.constants.HTTP_ERRORS
         self.project_id = project_id
         self.location = location
+        self.session = session
+        if location is None and session is not None:
+            # Jobs in a session must run in the session's location.
+            self.location = session.location
         self.reauth = reauth
         self.private_key = private_key
         self.auth_local_webserver = auth_local_webserver
@@ -68,12 +80,19 @@ class GbqConnector:
         self.user_agent = user_agent
         self.rfc9110_delimiter = rfc9110_delimiter
         self.use_bqstorage_api = use_bqstorage_api
+        self.result_cache = context.result_cache
+        self.dry_run_cache = context.dry_run_cache
+        self.coalesce_requests = context.coalesce_requests
+        self.metadata_cache = (
+            metadata_cache if metadata_cache is not None else context.metadata_cache
+        )
 
         if bigquery_client is not None:
             # If a bq client is already provided, use it to populate auth fields.
             self.project_id = bigquery_client.project
             self.credentials = bigquery_client._credentials
             self.client = bigquery_client
+            self._pooled_user_agent = None
             return
 
         default_project = None
@@ -98,6 +117,7 @@ class GbqConnector:
                 auth_redirect_uri=auth_redirect_uri,
                 client_id=client_id,
                 client_secret=client_secret,
+                token_store=context.token_store,
             )
 
         if self.project_id is None:
@@ -112,8 +132,16 @@ class GbqConnector:
         if context.project is None:
             context.project = self.project_id
 
-        self.client = _get_client(
-            self.user_agent, self.rfc9110_delimiter, self.project_id, self.credentials
+        # Reuse clients across connectors, so that HTTP connections are kept
+        # warm between calls.
+        self._pooled_user_agent = create_user_agent(
+            user_agent=self.user_agent, rfc9110_delimiter=self.rfc9110_delimiter
+        )
+        self.client = pandas_gbq.core.client_pool.get_client(
+            project_id=self.project_id,
+            credentials=self.credentials,
+            location=self.location,
+            user_agent=self._pooled_user_agent,
         )
 
     def _start_timer(self):
@@ -128,22 +156,40 @@ class GbqConnector:
             logger.info("{} {} {}".format(prefix, sec, postfix))
 
     def get_client(self):
-        import google.api_core.client_info
+        return self.client
+
+    def get_bqstorage_client(self):
+        """Get a pooled BigQuery Storage Read API client.
+
+        Returns ``None`` if the client should instead be created by the
+        BigQuery client library, such as when the caller provided their own
+        ``bigquery_client``.
+        """
+        if self._pooled_user_agent is None:
+            return None
+        return pandas_gbq.core.client_pool.get_bqstorage_client(
+            credentials=self.credentials, user_agent=self._pooled_user_agent
+        )
 
-        bigquery = FEATURES.bigquery_try_import()
+    def get_table(self, table_ref):
+        """Get table metadata, using the metadata cache if there is one."""
+        if self.metadata_cache is None:
+            return self.client.get_table(table_ref)
+        return self.metadata_cache.get_table(self.client, table_ref)
 
-        user_agent = create_user_agent(
-            user_agent=self.user_agent, rfc9110_delimiter=self.rfc9110_delimiter
-        )
+    def get_dataset(self, dataset_ref):
+        """Get dataset metadata, using the metadata cache if there is one."""
+        if self.metadata_cache is None:
+            return self.client.get_dataset(dataset_ref)
+        return self.metadata_cache.get_dataset(self.client, dataset_ref)
 
-        client_info = google.api_core.client_info.ClientInfo(
-            user_agent=user_agent,
-        )
-        return bigquery.Client(
-            project=self.project_id,
-            credentials=self.credentials,
-            client_info=client_info,
-        )
+    def invalidate_table(self, table_ref):
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate_table(table_ref)
+
+    def invalidate_dataset(self, dataset_ref):
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate_dataset(dataset_ref)
 
     @staticmethod
     def process_http_error(ex):
@@ -162,11 +208,79 @@ class GbqConnector:
 
         self._start_timer()
 
+        def download():
+            try:
+                table_ref = bigquery.TableReference.from_string(
+                    table_id, default_project=self.project_id
+                )
+                rows_iter = self.client.list_rows(table_ref, max_results=max_results)
+            except self.http_error as ex:
+                self.process_http_error(ex)
+
+            return self._download_results(
+                rows_iter,
+                max_results=max_results,
+                progress_bar_type=progress_bar_type,
+                user_dtypes=dtypes,
+            )
+
+        if not self.coalesce_requests:
+            return download()
+
+        dtypes_key = (
+            None
+            if dtypes is None
+            else tuple(sorted((name, str(dtype)) for name, dtype in dtypes.items()))
+        )
+        return pandas_gbq.core.coalesce.run(
+            (
+                "table",
+                id(self.credentials),
+                self.project_id,
+                table_id,
+                max_results,
+                dtypes_key,
+            ),
+            download,
+        )
+
+    def download_job_results(
+        self,
+        job_id: str,
+        max_results: Optional[int] = None,
+        progress_bar_type: Optional[str] = None,
+        dtypes: Optional[Dict[str, Union[str, Any]]] = None,
+    ) -> Optional[pandas.DataFrame]:
+        """Wait for an existing query job, then download its results.
+
+        The job isn't submitted again, so a query that already finished isn't
+        billed twice. Its results are read from the job's destination table,
+        which BigQuery keeps for about 24 hours.
+        """
+        from google.cloud import bigquery
+
+        self._start_timer()
+
         try:
-            table_ref = bigquery.TableReference.from_string(
-                table_id, default_project=self.project_id
+            query_job = self.client.get_job(
+                job_id, project=self.project_id, location=self.location
             )
-            rows_iter = self.client.list_rows(table_ref, max_results=max_results)
+        except self.http_error as ex:
+            self.process_http_error(ex)
+
+        if not isinstance(query_job, bigquery.QueryJob):
+            raise ValueError(
+                f"Job {job_id} is a {query_job.job_type} job, not a query."
+            )
+        logger.debug("Attached to job %s.", job_id)
+
+        # The job may belong to another process or user, so stop waiting on
+        # an interrupt without cancelling it.
+        pandas_gbq.query._wait_for_query_job(
+            self, self.client, query_job, None, cancel_on_exit=False
+        )
+        try:
+            rows_iter = query_job.result(max_results=max_results)
         except self.http_error as ex:
             self.process_http_error(ex)
 
@@ -177,16 +291,14 @@ class GbqConnector:
             user_dtypes=dtypes,
         )
 
-    def run_query(
-        self,
-        query,
-        max_results=None,
-        progress_bar_type=None,
-        dry_run: bool = False,
-        **kwargs,
-    ):
-        from google.cloud import bigquery
+    def _session_connection_properties(self):
+        """Start the session, if needed, and get the properties to join it."""
+        connection_properties = self.session.connection_properties(self)
+        self.location = self.session.location
+        return connection_properties
 
+    def _make_query_config(self, config):
+        """Get the query job configuration and timeout, in milliseconds."""
         job_config_dict = {
             "query": {
                 "useLegacySql": self.dialect
@@ -195,10 +307,18 @@ class GbqConnector:
                 # 'preserveNulls', destinationTable, useQueryCache
             }
         }
-        config = kwargs.get("configuration")
         if config is not None:
             job_config_dict.update(config)
 
+        if self.session is not None:
+            # Copy, rather than modify the caller's configuration.
+            query_config = dict(job_config_dict["query"])
+            query_config["connectionProperties"] = (
+                list(query_config.get("connectionProperties", []))
+                + self._session_connection_properties()
+            )
+            job_config_dict["query"] = query_config
+
         timeout_ms = job_config_dict.get("jobTimeoutMs") or job_config_dict[
             "query"
         ].get("timeoutMs")
@@ -218,43 +338,210 @@ class GbqConnector:
         else:
             timeout_ms = None
 
+        return job_config_dict, timeout_ms
+
+    def _check_bytes_billed(self, query, configuration):
+        """Reject a query that a dry run estimates is over its bytes billed limit.
+
+        Uses :attr:`pandas_gbq.context.dry_run_cache`, if set, so repeated
+        queries aren't dry run again.
+        """
+        limit = int(configuration["query"]["maximumBytesBilled"])
+        stats = self.run_query(query, configuration=configuration, dry_run=True)
+        total_bytes_processed = stats["totalBytesProcessed"]
+        if total_bytes_processed > limit:
+            raise pandas_gbq.exceptions.BytesBilledLimitExceeded(
+                f"Query would process {total_bytes_processed} bytes, which is "
+                f"more than the limit of {limit} bytes billed. Add filters on "
+                "partitioning or clustering columns, select fewer columns, or "
+                "raise max_bytes_billed."
+            )
+
+    def run_query(
+        self,
+        query,
+        max_results=None,
+        progress_bar_type=None,
+        dry_run: bool = False,
+        check_bytes_billed: bool = False,
+        **kwargs,
+    ):
+        job_config_dict, timeout_ms = self._make_query_config(
+            kwargs.get("configuration")
+        )
+
         self._start_timer()
+
+        # Results written to a destination table have side effects, so always
+        # run those queries. Results in a session can depend on its temporary
+        # tables, so don't share those either. The session may come from the
+        # configuration, rather than from self.session.
+        query_config = job_config_dict["query"]
+        has_destination = query_config.get("destinationTable") is not None
+        in_session = any(
+            connection_property.get("key") == "session_id"
+            for connection_property in query_config.get("connectionProperties", [])
+        )
+        shareable = not has_destination and not in_session
+        result_cache = self.dry_run_cache if dry_run else self.result_cache
+        if not shareable:
+            result_cache = None
+        coalesce_requests = self.coalesce_requests and shareable
+
+        execute = functools.partial(
+            self._execute_query,
+            query,
+            job_config_dict,
+            timeout_ms=timeout_ms,
+            max_results=max_results,
+            dry_run=dry_run,
+            dtypes=kwargs.get("dtypes"),
+        )
+        if check_bytes_billed and not dry_run:
+            # Only dry run the query when it's about to run, not when its
+            # results come from the cache or another caller.
+            run = execute
+
+            def execute(**execute_kwargs):
+                self._check_bytes_billed(query, kwargs.get("configuration"))
+                return run(**execute_kwargs)
+
+        if result_cache is None and not coalesce_requests:
+            return execute(progress_bar_type=progress_bar_type)
+
+        request_key = pandas_gbq.core.result_cache.make_key(
+            query,
+            dialect=self.dialect,
+            location=self.location,
+            project_id=self.project_id,
+            configuration=job_config_dict,
+            max_results=max_results,
+            dtypes=kwargs.get("dtypes"),
+        )
+
+        if result_cache is not None:
+            execute = functools.partial(
+                execute, result_cache=result_cache, cache_key=request_key
+            )
+            cached_df = result_cache.get(
+                request_key,
+                bqclient=self.client,
+                # Background refreshes shouldn't draw progress bars.
+                refresh=functools.partial(execute, progress_bar_type=None),
+                metadata_cache=self.metadata_cache,
+            )
+            if cached_df is not None:
+                return cached_df
+
+        if not coalesce_requests:
+            return execute(progress_bar_type=progress_bar_type)
+
+        # Only share the results of read-only statements. DML statements
+        # must run once per caller.
+        finished_rows = []
+
+        def is_shareable():
+            if dry_run:
+                return True
+            if not finished_rows:
+                return False
+            query_job = pandas_gbq.core.result_cache.get_query_job(
+                self.client, finished_rows[0], project_id=self.project_id
+            )
+            return query_job is not None and query_job.statement_type == "SELECT"
+
+        # Only share results between callers with the same credentials, as
+        # they might not have access to the same tables.
+        return pandas_gbq.core.coalesce.run(
+            ("query", id(self.credentials), dry_run, request_key),
+            functools.partial(
+                execute,
+                progress_bar_type=progress_bar_type,
+                on_rows_iter=finished_rows.append,
+            ),
+            is_shareable=is_shareable,
+        )
+
+    def _run_query_job(
+        self, query, job_config_dict, *, timeout_ms, max_results, dry_run=False
+    ):
+        """Run a query and wait for it, returning the rows without downloading them."""
+        from google.cloud import bigquery
+
         job_config = bigquery.QueryJobConfig.from_api_repr(job_config_dict)
         job_config.dry_run = dry_run
 
         if FEATURES.bigquery_has_query_and_wait:
-            rows_iter = pandas_gbq.query.query_and_wait_via_client_library(
-                self,
-                self.client,
-                query,
-                location=self.location,
-                project_id=self.project_id,
-                job_config=job_config,
-                max_results=max_results,
-                timeout_ms=timeout_ms,
-            )
+            query_and_wait = pandas_gbq.query.query_and_wait_via_client_library
         else:
-            rows_iter = pandas_gbq.query.query_and_wait(
-                self,
-                self.client,
-                query,
-                location=self.location,
-                project_id=self.project_id,
-                job_config=job_config,
-                max_results=max_results,
-                timeout_ms=timeout_ms,
-            )
+            query_and_wait = pandas_gbq.query.query_and_wait
+
+        run = functools.partial(
+            query_and_wait,
+            self,
+            self.client,
+            query,
+            location=self.location,
+            project_id=self.project_id,
+            job_config=job_config,
+            max_results=max_results,
+            timeout_ms=timeout_ms,
+        )
+        if dry_run:
+            # Dry runs don't create jobs, so they don't count toward quotas.
+            return run()
+
+        with pandas_gbq.core.scheduler.job_slot(
+            self.project_id, table_id=_destination_table_id(job_config_dict)
+        ):
+            return run()
+
+    def _execute_query(
+        self,
+        query,
+        job_config_dict,
+        *,
+        timeout_ms,
+        max_results,
+        progress_bar_type,
+        dry_run,
+        dtypes,
+        result_cache=None,
+        cache_key=None,
+        on_rows_iter=None,
+    ):
+        rows_iter = self._run_query_job(
+            query,
+            job_config_dict,
+            timeout_ms=timeout_ms,
+            max_results=max_results,
+            dry_run=dry_run,
+        )
+
+        if on_rows_iter is not None:
+            on_rows_iter(rows_iter)
 
         if dry_run:
-            return dry_runs.get_query_stats(rows_iter.job)
+            stats = dry_runs.get_query_stats(rows_iter.job)
+            if result_cache is not None:
+                result_cache.put(cache_key, stats, query_job=rows_iter.job)
+            return stats
 
-        return self._download_results(
+        df = self._download_results(
             rows_iter,
             max_results=max_results,
             progress_bar_type=progress_bar_type,
-            user_dtypes=kwargs.get("dtypes"),
+            user_dtypes=dtypes,
         )
 
+        if result_cache is not None:
+            query_job = pandas_gbq.core.result_cache.get_query_job(
+                self.client, rows_iter, project_id=self.project_id
+            )
+            result_cache.put(cache_key, df, query_job=query_job)
+
+        return df
+
     def _download_results(
         self,
         rows_iter,
@@ -264,12 +551,18 @@ class GbqConnector:
     ):
         return pandas_gbq.core.read.download_results(
             rows_iter,
-            bqclient=self.get_client(),
+            bqclient=self.client,
             progress_bar_type=progress_bar_type,
             warn_on_large_results=True,
             max_results=max_results,
             user_dtypes=user_dtypes,
             use_bqstorage_api=self.use_bqstorage_api,
+            bqstorage_client=(
+                self.get_bqstorage_client()
+                if self.use_bqstorage_api and max_results is None
+                else None
+            ),
+            metadata_cache=self.metadata_cache,
         )
 
     def load_data(
@@ -283,9 +576,17 @@ class GbqConnector:
         api_method: str = "load_parquet",
         billing_project: Optional[str] = None,
     ):
+        from google.cloud import bigquery
+
         from pandas_gbq import load
 
         total_rows = len(dataframe)
+        connection_properties = None
+        if self.session is not None:
+            connection_properties = [
+                bigquery.ConnectionProperty(prop["key"], prop["value"])
+                for prop in self._session_connection_properties()
+            ]
 
         try:
             chunks = load.load_chunks(
@@ -298,6 +599,7 @@ class GbqConnector:
                 api_method=api_method,
                 write_disposition=write_disposition,
                 billing_project=billing_project,
+                connection_properties=connection_properties,
             )
             if progress_bar and tqdm:
                 chunks = tqdm.tqdm(chunks)
@@ -309,6 +611,16 @@ class GbqConnector:
                 )
         except self.http_error as ex:
             self.process_http_error(ex)
+        finally:
+            # Loading data changes the table's size and possibly its schema.
+            self.invalidate_table(destination_table_ref)
+
+
+def _destination_table_id(job_config_dict) -> Optional[str]:
+    destination = job_config_dict["query"].get("destinationTable")
+    if destination is None:
+        return None
+    return "{projectId}.{datasetId}.{tableId}".format(**destination)
 
 
 def _get_client(user_agent, rfc9110_delimiter, project_id, credentials):
@@ -347,6 +659,11 @@ def create_user_agent(
     rfc9110_delimiter to True. This setting does not depend on whether a
     user_agent is also supplied.
 
+    Identifiers for the IDE or notebook environment, such as `vscode` or
+    `jupyter`, are detected once per process and appended. Set the
+    `PANDAS_GBQ_SKIP_ENVIRONMENT_DETECTION` environment variable to skip
+    detection, such as in server deployments.
+
     Reference:
         https://www.rfc-editor.org/info/rfc9110
 
@@ -379,13 +696,6 @@ def create_user_agent(
     identities = [] if user_agent is None else [user_agent]
     identities.append(f"pandas{delimiter}{pd.__version__}")
 
-    if environment.is_vscode():
-        identities.append("vscode")
-        if environment.is_vscode_google_cloud_code_extension_installed():
-            identities.append(environment.GOOGLE_CLOUD_CODE_EXTENSION_NAME)
-    elif environment.is_jupyter():
-        identities.append("jupyter")
-        if environment.is_jupyter_bigquery_plugin_installed():
-            identities.append(environment.BIGQUERY_JUPYTER_PLUGIN_NAME)
+    identities.extend(environment.get_identities())
 
     return " ".join(identities)
@@ -0,0 +1,191 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Join a local DataFrame with a BigQuery table, without downloading the table."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import google.cloud.bigquery
+import pandas
+
+import pandas_gbq.core.job_tracker
+import pandas_gbq.core.scheduler
+import pandas_gbq.gbq
+from pandas_gbq.bigquery_session import _abort_session, _session_config
+from pandas_gbq.gbq_connector import GbqConnector
+from pandas_gbq.lookups import _quote_identifier
+
+logger = logging.getLogger(__name__)
+
+_HOW_VALUES = ("semi", "inner")
+
+
+def _join_query(
+    table_or_query: str,
+    keys_table: Optional[str],
+    on: List[str],
+    columns: Optional[List[str]],
+) -> str:
+    if pandas_gbq.gbq._is_query(table_or_query):
+        source = f"({table_or_query})"
+    else:
+        source = _quote_identifier(table_or_query)
+
+    select_list = (
+        "t.*"
+        if columns is None
+        else ", ".join(f"t.{_quote_identifier(column)}" for column in columns)
+    )
+    if keys_table is None:
+        # Nothing can match, but still query to get the columns.
+        return f"SELECT {select_list} FROM {source} AS t WHERE FALSE"
+
+    conditions = " AND ".join(
+        f"t.{_quote_identifier(column)} = k.{_quote_identifier(column)}"
+        for column in on
+    )
+    return (
+        f"SELECT {select_list} FROM {source} AS t "
+        f"WHERE EXISTS (SELECT 1 FROM _SESSION.{keys_table} AS k WHERE {conditions})"
+    )
+
+
+def read_gbq_join(
+    local_df: pandas.DataFrame,
+    table_or_query: str,
+    on: Union[str, Sequence[str]],
+    *,
+    how: str = "semi",
+    columns: Optional[Sequence[str]] = None,
+    project_id: Optional[str] = None,
+    location: Optional[str] = None,
+    credentials=None,
+    dtypes: Optional[Dict[str, Any]] = None,
+    progress_bar_type: Optional[str] = None,
+) -> pandas.DataFrame:
+    """Join a local DataFrame with a BigQuery table or query, in BigQuery.
+
+    Only the distinct, non-null values of the ``on`` columns of ``local_df``
+    are uploaded, with a Parquet load job, to a temporary table in a new
+    BigQuery session. The table or query is then filtered by those keys in
+    BigQuery, so only the matching rows are downloaded. The session, and
+    its temporary table, are removed afterwards.
+
+    Args:
+        local_df:
+            DataFrame with the keys to join on.
+        table_or_query:
+            Table ID, in the format ``dataset.table`` or
+            ``project.dataset.table``, or a standard SQL query.
+        on:
+            Names of the columns to join on. They must have the same names in
+            ``local_df`` and in the table or query results.
+        how:
+            ``"semi"`` returns the rows of the table or query that match a key
+            in ``local_df``. ``"inner"`` also merges those rows with
+            ``local_df``, as in :meth:`pandas.DataFrame.merge`.
+        columns:
+            Optional. Names of the columns to read from the table or query.
+            Defaults to all columns.
+        project_id:
+            Optional. Google Cloud project ID to run the jobs in.
+        location:
+            Optional. Location of the table, where the jobs run. Looked up from
+            the table if not set and ``table_or_query`` is a table ID.
+        credentials:
+            Optional. Credentials for accessing Google APIs.
+        dtypes:
+            Optional. Column dtypes, as in :func:`pandas_gbq.read_gbq`.
+        progress_bar_type:
+            Optional. Progress bar for the download, as in
+            :func:`pandas_gbq.read_gbq`.
+
+    Returns:
+        pandas.DataFrame:
+            The matching rows of the table or query, for ``how="semi"``, or
+            the merged rows, for ``how="inner"``.
+    """
+    if how not in _HOW_VALUES:
+        raise ValueError(f"how must be one of {_HOW_VALUES}, got {how!r}.")
+    on = [on] if isinstance(on, str) else list(on)
+    if not on:
+        raise ValueError("on must name at least one column.")
+    missing = [column for column in on if column not in local_df.columns]
+    if missing:
+        raise ValueError(f"Columns {missing} aren't in local_df.")
+
+    columns = None if columns is None else list(columns)
+    if columns is not None and how == "inner":
+        # The key columns are needed to merge with local_df.
+        columns = columns + [column for column in on if column not in columns]
+
+    keys = local_df[on].dropna().drop_duplicates().reset_index(drop=True)
+
+    connector = GbqConnector(project_id, location=location, credentials=credentials)
+    if location is None and not pandas_gbq.gbq._is_query(table_or_query):
+        try:
+            table = connector.get_table(table_or_query)
+        except connector.http_error as ex:
+            connector.process_http_error(ex)
+        location = table.location
+
+    keys_table = f"_pandas_gbq_join_keys_{uuid.uuid4().hex}"
+    session_id = None
+    try:
+        if len(keys.index):
+            job_config = google.cloud.bigquery.LoadJobConfig(
+                create_session=True,
+                source_format="PARQUET",
+                write_disposition="WRITE_TRUNCATE",
+            )
+            with pandas_gbq.core.scheduler.job_slot(connector.project_id):
+                load_job = pandas_gbq.core.job_tracker.track(
+                    connector.client.load_table_from_dataframe(
+                        keys,
+                        f"_SESSION.{keys_table}",
+                        job_config=job_config,
+                        location=location,
+                        project=connector.project_id,
+                    )
+                )
+                try:
+                    load_job.result()
+                except connector.http_error as ex:
+                    connector.process_http_error(ex)
+                finally:
+                    # The session exists even if the load fails, so make sure
+                    # it's aborted.
+                    if load_job.session_info is not None:
+                        session_id = load_job.session_info.session_id
+                        location = load_job.location
+
+        if session_id is None:
+            query = _join_query(table_or_query, None, on, columns)
+            configuration = None
+        else:
+            query = _join_query(table_or_query, keys_table, on, columns)
+            configuration = _session_config(session_id)
+
+        # Copy the connector, since queries in a session must run in the
+        # session's location.
+        query_connector = copy.copy(connector)
+        query_connector.location = location
+        remote_df = query_connector.run_query(
+            query,
+            configuration=configuration,
+            progress_bar_type=progress_bar_type,
+            dtypes=dtypes,
+        )
+    finally:
+        if session_id is not None:
+            _abort_session(connector, session_id, location)
+
+    if how == "semi":
+        return remote_df
+    return local_df.merge(remote_df, on=on, how="inner")
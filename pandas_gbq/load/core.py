@@ -4,6 +4,7 @@
 
 """Helper methods for loading data into BigQuery"""
 
+import contextlib
 import decimal
 import io
 from typing import Any, Callable, Dict, List, Optional
@@ -14,6 +15,9 @@ import pandas
 import pyarrow.lib
 
 from pandas_gbq import exceptions
+import pandas_gbq.contexts
+import pandas_gbq.core.job_tracker
+import pandas_gbq.core.scheduler
 import pandas_gbq.schema
 import pandas_gbq.schema.bigquery
 import pandas_gbq.schema.pandas_to_bigquery
@@ -163,6 +167,15 @@ def cast_dataframe_for_csv(
     return dataframe
 
 
+def _job_slot(client, destination_table_ref, billing_project):
+    if pandas_gbq.contexts.get_context().job_scheduler is None:
+        return contextlib.nullcontext()
+    return pandas_gbq.core.scheduler.job_slot(
+        billing_project or client.project,
+        table_id=str(destination_table_ref),
+    )
+
+
 def load_parquet(
     client: bigquery.Client,
     dataframe: pandas.DataFrame,
@@ -171,10 +184,13 @@ def load_parquet(
     location: Optional[str],
     schema: Optional[Dict[str, Any]],
     billing_project: Optional[str] = None,
+    connection_properties: Optional[List[bigquery.ConnectionProperty]] = None,
 ):
     job_config = bigquery.LoadJobConfig()
     job_config.write_disposition = write_disposition
     job_config.source_format = "PARQUET"
+    if connection_properties:
+        job_config.connection_properties = connection_properties
 
     if schema is not None:
         schema = pandas_gbq.schema.remove_policy_tags(schema)
@@ -182,13 +198,16 @@ def load_parquet(
         dataframe = cast_dataframe_for_parquet(dataframe, schema)
 
     try:
-        client.load_table_from_dataframe(
-            dataframe,
-            destination_table_ref,
-            job_config=job_config,
-            location=location,
-            project=billing_project,
-        ).result()
+        with _job_slot(client, destination_table_ref, billing_project):
+            pandas_gbq.core.job_tracker.track(
+                client.load_table_from_dataframe(
+                    dataframe,
+                    destination_table_ref,
+                    job_config=job_config,
+                    location=location,
+                    project=billing_project,
+                )
+            ).result()
     except pyarrow.lib.ArrowInvalid as exc:
         raise exceptions.ConversionError(
             "Could not convert DataFrame to Parquet."
@@ -201,11 +220,14 @@ def load_csv(
     chunksize: Optional[int],
     bq_schema: Optional[List[bigquery.SchemaField]],
     load_chunk: Callable,
+    connection_properties: Optional[List[bigquery.ConnectionProperty]] = None,
 ):
     job_config = bigquery.LoadJobConfig()
     job_config.write_disposition = write_disposition
     job_config.source_format = "CSV"
     job_config.allow_quoted_newlines = True
+    if connection_properties:
+        job_config.connection_properties = connection_properties
 
     if bq_schema is not None:
         job_config.schema = bq_schema
@@ -226,6 +248,7 @@ def load_csv_from_dataframe(
     chunksize: Optional[int],
     schema: Optional[Dict[str, Any]],
     billing_project: Optional[str] = None,
+    connection_properties: Optional[List[bigquery.ConnectionProperty]] = None,
 ):
     bq_schema = None
 
@@ -237,15 +260,25 @@ def load_csv_from_dataframe(
         if schema is not None:
             chunk = cast_dataframe_for_csv(chunk, schema)
 
-        client.load_table_from_dataframe(
-            chunk,
-            destination_table_ref,
-            job_config=job_config,
-            location=location,
-            project=billing_project,
-        ).result()
+        with _job_slot(client, destination_table_ref, billing_project):
+            pandas_gbq.core.job_tracker.track(
+                client.load_table_from_dataframe(
+                    chunk,
+                    destination_table_ref,
+                    job_config=job_config,
+                    location=location,
+                    project=billing_project,
+                )
+            ).result()
 
-    return load_csv(dataframe, write_disposition, chunksize, bq_schema, load_chunk)
+    return load_csv(
+        dataframe,
+        write_disposition,
+        chunksize,
+        bq_schema,
+        load_chunk,
+        connection_properties=connection_properties,
+    )
 
 
 def load_csv_from_file(
@@ -257,6 +290,7 @@ def load_csv_from_file(
     chunksize: Optional[int],
     schema: Optional[Dict[str, Any]],
     billing_project: Optional[str] = None,
+    connection_properties: Optional[List[bigquery.ConnectionProperty]] = None,
 ):
     """Manually encode a DataFrame to CSV and use the buffer in a load job.
 
@@ -270,17 +304,27 @@ def load_csv_from_file(
     def load_chunk(chunk, job_config):
         try:
             chunk_buffer = encode_chunk(chunk)
-            client.load_table_from_file(
-                chunk_buffer,
-                destination_table_ref,
-                job_config=job_config,
-                location=location,
-                project=billing_project,
-            ).result()
+            with _job_slot(client, destination_table_ref, billing_project):
+                pandas_gbq.core.job_tracker.track(
+                    client.load_table_from_file(
+                        chunk_buffer,
+                        destination_table_ref,
+                        job_config=job_config,
+                        location=location,
+                        project=billing_project,
+                    )
+                ).result()
         finally:
             chunk_buffer.close()
 
-    return load_csv(dataframe, write_disposition, chunksize, bq_schema, load_chunk)
+    return load_csv(
+        dataframe,
+        write_disposition,
+        chunksize,
+        bq_schema,
+        load_chunk,
+        connection_properties=connection_properties,
+    )
 
 
 def load_chunks(
@@ -293,6 +337,7 @@ def load_chunks(
     api_method="load_parquet",
     write_disposition="WRITE_EMPTY",
     billing_project: Optional[str] = None,
+    connection_properties: Optional[List[bigquery.ConnectionProperty]] = None,
 ):
     if api_method == "load_parquet":
         load_parquet(
@@ -303,6 +348,7 @@ def load_chunks(
             location,
             schema,
             billing_project=billing_project,
+            connection_properties=connection_properties,
         )
         # TODO: yield progress depending on result() with timeout
         return [0]
@@ -316,6 +362,7 @@ def load_chunks(
             chunksize,
             schema,
             billing_project=billing_project,
+            connection_properties=connection_properties,
         )
     else:
         raise ValueError(
@@ -0,0 +1,245 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Read the rows of a table that match a list of keys."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+from typing import Any, Dict, List, Optional, Sequence
+
+import google.cloud.bigquery
+import pandas
+
+import pandas_gbq.contexts
+import pandas_gbq.core.job_tracker
+import pandas_gbq.core.query_parameters
+from pandas_gbq.gbq_connector import GbqConnector
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def _infer_key_type(keys: Sequence[Any]) -> str:
+    key_types = set()
+    for key in keys:
+        key_type = pandas_gbq.core.query_parameters.parameter_type(key)
+        if key_type is None:
+            raise ValueError(
+                f"Can't infer the BigQuery type of key {key!r}. Set key_type."
+            )
+        key_types.add(key_type)
+
+    if len(key_types) != 1:
+        raise ValueError(
+            f"Keys have more than one type: {sorted(key_types)}. Set key_type."
+        )
+    return key_types.pop()
+
+
+def _quote_identifier(name: str) -> str:
+    if "`" in name:
+        raise ValueError(f"Got unexpected backtick in identifier {name!r}.")
+    return f"`{name}`"
+
+
+def _split_by_key(
+    df: pandas.DataFrame, key_column: str, keys: Sequence[Any]
+) -> Dict[Any, pandas.DataFrame]:
+    rows_by_key = {
+        key: rows.reset_index(drop=True)
+        for key, rows in df.groupby(key_column, sort=False)
+    }
+    requested = set(keys)
+    if any(key not in requested for key in rows_by_key):
+        # The keys don't compare equal to the column's values, such as string
+        # keys for an INT64 column, so a key without rows here may still have
+        # some. Only keep the keys that were found.
+        return rows_by_key
+
+    empty = df.iloc[0:0]
+    return {key: rows_by_key.get(key, empty) for key in keys}
+
+
+def read_gbq_by_keys(
+    table_id: str,
+    key_column: str,
+    keys: Sequence[Any],
+    *,
+    columns: Optional[Sequence[str]] = None,
+    key_type: Optional[str] = None,
+    project_id: Optional[str] = None,
+    location: Optional[str] = None,
+    credentials=None,
+    dtypes: Optional[Dict[str, Any]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_workers: int = 8,
+) -> pandas.DataFrame:
+    """Read the rows of a table whose key column matches one of ``keys``.
+
+    Keys are sent as an array query parameter, in batches of up to
+    ``batch_size`` keys, with ``WHERE key_column IN UNNEST(@keys)``. This
+    avoids building long SQL strings, which can exceed the maximum query
+    length. Batches run concurrently, using up to ``max_workers`` threads and
+    a single BigQuery client.
+
+    If :attr:`pandas_gbq.context.key_cache` is set, rows already read for a
+    key by an earlier call are reused, and only the other keys are queried.
+    Keys without any rows are cached too, unless the keys don't compare equal
+    to the key column's values, such as string keys for an ``INT64`` column.
+
+    Args:
+        table_id:
+            Table to read, in the format ``dataset.table`` or
+            ``project.dataset.table``.
+        key_column:
+            Name of the column to match keys against.
+        keys:
+            Key values to look up. Duplicate and ``None`` keys are ignored.
+        columns:
+            Optional. Names of the columns to read. Defaults to all columns.
+        key_type:
+            Optional. BigQuery type of the key column, such as ``"INT64"`` or
+            ``"STRING"``. Inferred from the Python type of the keys if not set.
+        project_id:
+            Optional. Google Cloud project ID to run the queries in.
+        location:
+            Optional. Location where the query jobs run.
+        credentials:
+            Optional. Credentials for accessing Google APIs.
+        dtypes:
+            Optional. Column dtypes, as in :func:`pandas_gbq.read_gbq`.
+        batch_size:
+            Maximum number of keys per query.
+        max_workers:
+            Maximum number of queries to run at the same time.
+
+    Returns:
+        pandas.DataFrame:
+            The matching rows, in no particular order.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}.")
+
+    unique_keys = list(
+        dict.fromkeys(
+            pandas_gbq.core.query_parameters.to_python_value(key)
+            for key in keys
+            if key is not None
+        )
+    )
+    if key_type is None and unique_keys:
+        key_type = _infer_key_type(unique_keys)
+
+    selected = None if columns is None else list(columns)
+    query_columns = selected
+    if query_columns is not None and key_column not in query_columns:
+        # The key column is needed to know which rows belong to which key.
+        query_columns = query_columns + [key_column]
+    select_list = (
+        "*"
+        if query_columns is None
+        else ", ".join(_quote_identifier(column) for column in query_columns)
+    )
+    query = (
+        f"SELECT {select_list} FROM {_quote_identifier(table_id)} "
+        f"WHERE {_quote_identifier(key_column)} IN UNNEST(@keys)"
+    )
+
+    cache = pandas_gbq.contexts.get_context().key_cache
+    namespace = (
+        project_id,
+        table_id,
+        key_column,
+        None if query_columns is None else tuple(query_columns),
+        None if dtypes is None else tuple(sorted(map(str, dtypes.items()))),
+    )
+    cached: Dict[Any, pandas.DataFrame] = {}
+    if cache is not None:
+        cached = cache.get_many(namespace, unique_keys)
+    missing = [key for key in unique_keys if key not in cached]
+    batches = [
+        missing[start : start + batch_size]
+        for start in range(0, len(missing), batch_size)
+    ]
+    frames: List[pandas.DataFrame] = [rows for rows in cached.values() if len(rows)]
+    if batches:
+        frames.extend(
+            _read_batches(
+                batches,
+                query=query,
+                key_column=key_column,
+                key_type=key_type,
+                dtypes=dtypes,
+                connector=GbqConnector(
+                    project_id, location=location, credentials=credentials
+                ),
+                max_workers=max_workers,
+                cache=cache,
+                namespace=namespace,
+            )
+        )
+
+    # Keep the columns of an empty result.
+    frames = [df for df in frames if len(df)] or frames[:1]
+    if not frames and cached:
+        frames = [next(iter(cached.values()))]
+    if not frames:
+        frames = [pandas.DataFrame(columns=query_columns or [key_column])]
+
+    result = pandas.concat(frames, ignore_index=True)
+    if selected is not None:
+        result = result[selected]
+    return result
+
+
+def _read_batches(
+    batches,
+    *,
+    query,
+    key_column,
+    key_type,
+    dtypes,
+    connector,
+    max_workers,
+    cache,
+    namespace,
+) -> List[pandas.DataFrame]:
+    # Track the batch queries, so that they can be cancelled if one fails.
+    tracker = pandas_gbq.core.job_tracker.JobTracker()
+
+    def read_batch(batch):
+        parameter = google.cloud.bigquery.ArrayQueryParameter("keys", key_type, batch)
+        with pandas_gbq.core.job_tracker.tracking(tracker):
+            return connector.run_query(
+                query,
+                configuration={"query": {"queryParameters": [parameter.to_api_repr()]}},
+                progress_bar_type=None,
+                dtypes=dtypes,
+            )
+
+    frames = []
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(batches))),
+        thread_name_prefix="pandas_gbq_read_by_keys",
+    ) as executor:
+        # Executor threads don't inherit context variables, such as the
+        # context used by a pandas_gbq.Session or the caller's JobTracker, so
+        # run each batch in a copy of the caller's.
+        futures = [
+            executor.submit(contextvars.copy_context().run, read_batch, batch)
+            for batch in batches
+        ]
+        for batch, future in zip(batches, futures):
+            try:
+                df = future.result()
+            except BaseException:
+                for pending in futures:
+                    pending.cancel()
+                tracker.cancel_all()
+                raise
+            frames.append(df)
+            if cache is not None:
+                cache.put_many(namespace, _split_by_key(df, key_column, batch).items())
+    return frames
@@ -7,11 +7,14 @@ from __future__ import annotations
 import concurrent.futures
 import functools
 import logging
-from typing import Optional
+import time
+from typing import Iterator, Optional
 
 import google.auth.exceptions
 from google.cloud import bigquery
 
+import pandas_gbq.contexts
+import pandas_gbq.core.job_tracker
 import pandas_gbq.exceptions
 
 logger = logging.getLogger(__name__)
@@ -32,13 +35,57 @@ def sizeof_fmt(num, suffix="B"):
     return fmt % (num, "Y", suffix)
 
 
+_INITIAL_POLL_SECONDS = 0.1
+_MAX_POLL_SECONDS = 5.0
+_POLL_MULTIPLIER = 1.5
+
+# Log the elapsed time at most this often while waiting.
+_LOG_INTERVAL_SECONDS = 10.0
+
+
+def _poll_intervals() -> Iterator[float]:
+    """Yield the time to wait before each status check of a running job.
+
+    Starts short, so that quick queries aren't slowed down, then backs off
+    exponentially to avoid sending too many requests for long ones.
+    """
+    delay = _INITIAL_POLL_SECONDS
+    while True:
+        yield delay
+        delay = min(delay * _POLL_MULTIPLIER, _MAX_POLL_SECONDS)
+
+
+def _report_state(query_job, last_state: Optional[str]) -> Optional[str]:
+    """Call the progress callback, if any, when the job's state changes."""
+    state = query_job.state
+    if state != last_state:
+        logger.debug("Job %s is %s.", query_job.job_id, state)
+        callback = pandas_gbq.contexts.get_context().query_progress_callback
+        if callback is not None:
+            callback(query_job)
+    return state
+
+
+def _cancel_query_job(client: bigquery.Client, query_job: bigquery.QueryJob) -> None:
+    """Request cancellation of a job, without hiding why it's cancelled."""
+    if query_job.job_id is None:
+        # Dry runs don't create a job.
+        return
+    try:
+        client.cancel_job(query_job.job_id, location=query_job.location)
+    except Exception as ex:
+        logger.debug("Could not cancel job %s: %s", query_job.job_id, ex)
+
+
 def _wait_for_query_job(
     connector,
     client: bigquery.Client,
     query_reply: bigquery.QueryJob,
     timeout_ms: Optional[float],
+    *,
+    cancel_on_exit: bool = True,
 ):
-    """Wait for query to complete, pausing occasionally to update progress.
+    """Wait for query to complete, checking its state with increasing intervals.
 
     Args:
         connector (GbqConnector):
@@ -53,30 +100,58 @@ def _wait_for_query_job(
 
         timeout_ms (Optional[int]):
             How long to wait before cancelling the query.
+
+        cancel_on_exit (bool):
+            Whether to cancel the job if waiting stops early, such as on a
+            timeout or a KeyboardInterrupt. Set to ``False`` for jobs this
+            caller didn't start.
     """
-    # Wait at most 10 seconds so we can show progress.
     # TODO(https://github.com/googleapis/python-bigquery-pandas/issues/327):
     # Include a tqdm progress bar here instead of a stream of log messages.
-    timeout_sec = 10.0
-    if timeout_ms:
-        timeout_sec = min(timeout_sec, timeout_ms / 1000.0)
+    last_state = None
+    last_log_seconds = None
+    intervals = _poll_intervals()
 
-    while query_reply.state != "DONE":
-        connector.log_elapsed_seconds("  Elapsed", "s. Waiting...")
-
-        if timeout_ms and timeout_ms < connector.get_elapsed_seconds() * 1000:
-            client.cancel_job(query_reply.job_id, location=query_reply.location)
-            raise pandas_gbq.exceptions.QueryTimeout(
-                "Query timeout: {} ms".format(timeout_ms)
-            )
-
-        try:
-            query_reply.result(timeout=timeout_sec)
-        except concurrent.futures.TimeoutError:
-            # Use our own timeout logic
-            pass
-        except connector.http_error as ex:
-            connector.process_http_error(ex)
+    try:
+        while True:
+            try:
+                done = query_reply.done()
+            except connector.http_error as ex:
+                connector.process_http_error(ex)
+            last_state = _report_state(query_reply, last_state)
+            if done:
+                return
+
+            if pandas_gbq.core.job_tracker.cancelled():
+                raise pandas_gbq.exceptions.QueryCancelled(
+                    "Query job {} was cancelled.".format(query_reply.job_id)
+                )
+
+            elapsed_seconds = connector.get_elapsed_seconds()
+            if timeout_ms and timeout_ms < elapsed_seconds * 1000:
+                raise pandas_gbq.exceptions.QueryTimeout(
+                    "Query timeout: {} ms".format(timeout_ms)
+                )
+
+            if (
+                last_log_seconds is None
+                or elapsed_seconds - last_log_seconds >= _LOG_INTERVAL_SECONDS
+            ):
+                connector.log_elapsed_seconds("  Elapsed", "s. Waiting...")
+                last_log_seconds = elapsed_seconds
+
+            delay = next(intervals)
+            if timeout_ms:
+                # Wake up in time to cancel the job when the timeout expires.
+                remaining_seconds = timeout_ms / 1000.0 - elapsed_seconds
+                delay = max(0.0, min(delay, remaining_seconds))
+            time.sleep(delay)
+    except BaseException:
+        # Don't leave the job running, using slots, once nothing waits for
+        # it, such as after a timeout or a KeyboardInterrupt.
+        if cancel_on_exit:
+            _cancel_query_job(client, query_reply)
+        raise
 
 
 def try_query(connector, query_fn):
@@ -153,6 +228,7 @@ def query_and_wait(
             project=project_id,
         ),
     )
+    pandas_gbq.core.job_tracker.track(query_reply)
     logger.debug("Query running...")
 
     job_id = query_reply.job_id
@@ -214,29 +290,24 @@ def query_and_wait_via_client_library(
             ),
         )
         # Wait for the dry run to complete
-        query_job.result(timeout=timeout_ms / 1000.0 if timeout_ms else None)
+        _wait_for_query_job(connector, client, query_job, timeout_ms)
         # Get the result iterator and ensure job attribute is set
         rows_iter = query_job.result(max_results=max_results)
         if not hasattr(rows_iter, "job") or rows_iter.job is None:
             rows_iter.job = query_job
         return rows_iter
 
-    rows_iter = try_query(
+    # The job created by client.query_and_wait isn't available until it
+    # finishes, so it can't be cancelled if waiting stops early, such as on a
+    # timeout, a cancelled JobTracker, or a KeyboardInterrupt. Create the job
+    # first, then wait for it, so it never keeps running unattended.
+    return query_and_wait(
         connector,
-        functools.partial(
-            client.query_and_wait,
-            query,
-            job_config=job_config,
-            location=location,
-            project=project_id,
-            max_results=max_results,
-            wait_timeout=timeout_ms / 1000.0 if timeout_ms else None,
-        ),
+        client,
+        query,
+        job_config=job_config,
+        location=location,
+        project_id=project_id,
+        max_results=max_results,
+        timeout_ms=timeout_ms,
     )
-    # Ensure job attribute is set for consistency
-    if hasattr(rows_iter, "job") and rows_iter.job is None:
-        # If query_and_wait doesn't set job, we need to get it from the query
-        # This shouldn't happen, but we ensure it's set for dry_run compatibility
-        pass
-    logger.debug("Query done.\n")
-    return rows_iter
@@ -0,0 +1,446 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Run a query once, then read its results table as many times as needed."""
+
+from __future__ import annotations
+
+import typing
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import google.cloud.bigquery
+import pyarrow
+import pyarrow.ipc
+import pyarrow.parquet
+
+import pandas_gbq.core.read
+import pandas_gbq.core.scheduler
+import pandas_gbq.gbq
+import pandas_gbq.query
+from pandas_gbq.contexts import get_context
+from pandas_gbq.core.query_parameters import QueryParameters
+from pandas_gbq.gbq_connector import GbqConnector, _destination_table_id
+
+# Only import at module-level at type checking time to avoid circular
+# dependencies in the pandas package, which has an optional dependency on
+# pandas-gbq.
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    import pandas
+
+
+class QueryResult:
+    """The results of a finished query job, returned by :func:`execute_query`.
+
+    BigQuery writes the results of every query to a destination table, which
+    is kept for about 24 hours. The methods of this class read from that
+    table, with ``tabledata.list`` or the BigQuery Storage Read API, so the
+    query doesn't run again, no matter how many times the results are read.
+
+    Args:
+        connector:
+            Connector to BigQuery, used for API requests.
+        query_job:
+            A finished query job.
+    """
+
+    def __init__(
+        self, connector: GbqConnector, query_job: google.cloud.bigquery.QueryJob
+    ):
+        self._connector = connector
+        self._job = query_job
+        self._table: Optional[google.cloud.bigquery.Table] = None
+
+    def __repr__(self) -> str:
+        return f"QueryResult(job_id={self.job_id!r}, destination={self.destination!r})"
+
+    @property
+    def job(self) -> google.cloud.bigquery.QueryJob:
+        """The finished query job."""
+        return self._job
+
+    @property
+    def job_id(self) -> str:
+        """ID of the query job."""
+        return self._job.job_id
+
+    @property
+    def location(self) -> Optional[str]:
+        """Location where the query job ran."""
+        return self._job.location
+
+    @property
+    def destination(self) -> Optional[google.cloud.bigquery.TableReference]:
+        """Table with the query results, or ``None`` if there are none."""
+        return self._job.destination
+
+    @property
+    def schema(self) -> List[google.cloud.bigquery.SchemaField]:
+        """Columns of the query results."""
+        return list(self._get_table().schema)
+
+    @property
+    def total_rows(self) -> Optional[int]:
+        """Number of rows in the query results."""
+        return self._get_table().num_rows
+
+    def to_dataframe(
+        self,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        row_filter: Optional[str] = None,
+        max_results: Optional[int] = None,
+        dtypes: Optional[Dict[str, Any]] = None,
+        progress_bar_type: Optional[str] = None,
+    ) -> pandas.DataFrame:
+        """Download the query results to a DataFrame.
+
+        Args:
+            columns:
+                Optional. Names of the columns to download. Defaults to all
+                columns.
+            row_filter:
+                Optional. A SQL boolean expression, such as ``"x > 10"``,
+                which rows must match to be downloaded. It's applied by the
+                BigQuery Storage Read API, which requires the
+                ``google-cloud-bigquery-storage`` package.
+            max_results:
+                Optional. Maximum number of rows to download.
+            dtypes:
+                Optional. Column dtypes, as in :func:`pandas_gbq.read_gbq`.
+            progress_bar_type:
+                Optional. Progress bar for the download, as in
+                :func:`pandas_gbq.read_gbq`. Not used with ``row_filter``.
+
+        Returns:
+            pandas.DataFrame: The query results.
+        """
+        import pandas
+
+        selected_fields = self._selected_fields(columns)
+        if row_filter is None:
+            rows_iter = self._list_rows(selected_fields, max_results=max_results)
+            df = self._connector._download_results(
+                rows_iter,
+                max_results=max_results,
+                progress_bar_type=progress_bar_type,
+                user_dtypes=dtypes,
+            )
+            if df is None:
+                df = _empty_dataframe(selected_fields)
+            return df
+
+        frames = []
+        num_rows = 0
+        for frame in self._read_filtered(selected_fields, row_filter, dtypes=dtypes):
+            if max_results is not None and num_rows + len(frame.index) >= max_results:
+                # Stop reading the streams once there are enough rows.
+                frames.append(frame.iloc[: max_results - num_rows])
+                break
+            frames.append(frame)
+            num_rows += len(frame.index)
+
+        if not frames:
+            return _empty_dataframe(selected_fields)
+        return pandas.concat(frames, ignore_index=True)
+
+    def iter_batches(
+        self,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        row_filter: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        dtypes: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[pandas.DataFrame]:
+        """Download the query results one DataFrame at a time.
+
+        Only one batch at a time needs to fit in memory, so this can process
+        results that are too large to download all at once.
+
+        Args:
+            columns:
+                Optional. Names of the columns to download. Defaults to all
+                columns.
+            row_filter:
+                Optional. A SQL boolean expression which rows must match, as
+                in :meth:`to_dataframe`.
+            batch_size:
+                Optional. Number of rows in each batch, except the last. When
+                set, rows are downloaded with ``tabledata.list``, in pages of
+                this size. Otherwise, the batch size is chosen by the BigQuery
+                Storage Read API, if it's available. Can't be used with
+                ``row_filter``.
+            dtypes:
+                Optional. Column dtypes, as in :func:`pandas_gbq.read_gbq`.
+
+        Yields:
+            pandas.DataFrame: Consecutive batches of the query results.
+        """
+        selected_fields = self._selected_fields(columns)
+        if row_filter is not None:
+            if batch_size is not None:
+                raise ValueError("batch_size can't be used with row_filter.")
+            yield from self._read_filtered(selected_fields, row_filter, dtypes=dtypes)
+            return
+
+        rows_iter = self._list_rows(selected_fields, page_size=batch_size)
+        schema_fields = [field.to_api_repr() for field in selected_fields]
+        conversion_dtypes = _conversion_dtypes(selected_fields, dtypes)
+        bqstorage_client = None
+        if batch_size is None and self._connector.use_bqstorage_api:
+            bqstorage_client = self._connector.get_bqstorage_client()
+
+        try:
+            for frame in rows_iter.to_dataframe_iterable(
+                bqstorage_client=bqstorage_client, dtypes=conversion_dtypes
+            ):
+                yield pandas_gbq.core.read._finalize_dtypes(frame, schema_fields)
+        except self._connector.http_error as ex:
+            self._connector.process_http_error(ex)
+
+    def to_parquet(
+        self,
+        path: str,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        row_filter: Optional[str] = None,
+    ) -> None:
+        """Write the query results to a Parquet file.
+
+        The results are downloaded as Arrow record batches and written
+        without converting them to a DataFrame first.
+
+        Args:
+            path:
+                Path of the Parquet file to write.
+            columns:
+                Optional. Names of the columns to write. Defaults to all
+                columns.
+            row_filter:
+                Optional. A SQL boolean expression which rows must match, as
+                in :meth:`to_dataframe`.
+        """
+        selected_fields = self._selected_fields(columns)
+        if row_filter is None:
+            rows_iter = self._list_rows(selected_fields)
+            bqstorage_client = None
+            if self._connector.use_bqstorage_api:
+                bqstorage_client = self._connector.get_bqstorage_client()
+            try:
+                table = rows_iter.to_arrow(
+                    bqstorage_client=bqstorage_client,
+                    create_bqstorage_client=self._connector.use_bqstorage_api,
+                )
+            except self._connector.http_error as ex:
+                self._connector.process_http_error(ex)
+        else:
+            bqstorage_client, session = self._create_read_session(
+                selected_fields, row_filter
+            )
+            tables = [
+                bqstorage_client.read_rows(stream.name).to_arrow(session)
+                for stream in session.streams
+            ]
+            if tables:
+                table = pyarrow.concat_tables(tables)
+            else:
+                # There are no streams when no rows match the filter.
+                table = pyarrow.ipc.read_schema(
+                    pyarrow.py_buffer(session.arrow_schema.serialized_schema)
+                ).empty_table()
+
+        pyarrow.parquet.write_table(table, path)
+
+    def _get_table(self) -> google.cloud.bigquery.Table:
+        if self.destination is None:
+            raise ValueError(
+                f"Query job {self.job_id} has no results table. Statements "
+                "such as DML, DDL and scripts don't return rows."
+            )
+        if self._table is None:
+            self._table = self._connector.get_table(self.destination)
+        return self._table
+
+    def _selected_fields(
+        self, columns: Optional[Sequence[str]]
+    ) -> List[google.cloud.bigquery.SchemaField]:
+        schema = self.schema
+        if columns is None:
+            return schema
+
+        fields_by_name = {field.name: field for field in schema}
+        missing = [column for column in columns if column not in fields_by_name]
+        if missing:
+            raise ValueError(f"Columns {missing} aren't in the query results.")
+        return [fields_by_name[column] for column in columns]
+
+    def _list_rows(self, selected_fields, **kwargs):
+        try:
+            return self._connector.client.list_rows(
+                self.destination, selected_fields=selected_fields, **kwargs
+            )
+        except self._connector.http_error as ex:
+            self._connector.process_http_error(ex)
+
+    def _create_read_session(self, selected_fields, row_filter: str):
+        """Start a BigQuery Storage Read API session filtered by ``row_filter``."""
+        try:
+            from google.cloud import bigquery_storage
+        except ImportError as ex:
+            raise ImportError(
+                "row_filter requires the google-cloud-bigquery-storage package."
+            ) from ex
+
+        bqstorage_client = self._connector.get_bqstorage_client()
+        if bqstorage_client is None:
+            bqstorage_client = bigquery_storage.BigQueryReadClient(
+                credentials=self._connector.credentials
+            )
+
+        destination = self.destination
+        requested_session = bigquery_storage.types.ReadSession(
+            table=(
+                f"projects/{destination.project}/datasets/{destination.dataset_id}"
+                f"/tables/{destination.table_id}"
+            ),
+            data_format=bigquery_storage.types.DataFormat.ARROW,
+            read_options=bigquery_storage.types.ReadSession.TableReadOptions(
+                selected_fields=[field.name for field in selected_fields],
+                row_restriction=row_filter,
+            ),
+        )
+        try:
+            session = bqstorage_client.create_read_session(
+                parent=f"projects/{self._connector.project_id}",
+                read_session=requested_session,
+                max_stream_count=0,
+            )
+        except self._connector.http_error as ex:
+            self._connector.process_http_error(ex)
+        return bqstorage_client, session
+
+    def _read_filtered(
+        self, selected_fields, row_filter: str, *, dtypes: Optional[Dict[str, Any]]
+    ) -> Iterator[pandas.DataFrame]:
+        bqstorage_client, session = self._create_read_session(
+            selected_fields, row_filter
+        )
+        schema_fields = [field.to_api_repr() for field in selected_fields]
+        conversion_dtypes = _conversion_dtypes(selected_fields, dtypes)
+        for stream in session.streams:
+            reader = bqstorage_client.read_rows(stream.name)
+            for page in reader.rows(session).pages:
+                frame = page.to_dataframe(dtypes=conversion_dtypes)
+                yield pandas_gbq.core.read._finalize_dtypes(frame, schema_fields)
+
+
+def _conversion_dtypes(selected_fields, dtypes: Optional[Dict[str, Any]]):
+    conversion_dtypes = pandas_gbq.core.read._bqschema_to_nullsafe_dtypes(
+        [field.to_api_repr() for field in selected_fields]
+    )
+    conversion_dtypes.update(dtypes or {})
+    return conversion_dtypes
+
+
+def _empty_dataframe(selected_fields) -> pandas.DataFrame:
+    import pandas
+
+    return pandas.DataFrame(columns=[field.name for field in selected_fields])
+
+
+def execute_query(
+    query: str,
+    *,
+    project_id: Optional[str] = None,
+    location: Optional[str] = None,
+    dialect: Optional[str] = None,
+    configuration: Optional[Dict[str, Any]] = None,
+    credentials=None,
+    query_parameters: Optional[QueryParameters] = None,
+    use_bqstorage_api: bool = True,
+    bigquery_client: Optional[google.cloud.bigquery.Client] = None,
+) -> QueryResult:
+    """Run a query, without downloading its results.
+
+    Unlike :func:`pandas_gbq.read_gbq`, which downloads all the results at
+    once, this returns a :class:`QueryResult`, from which the results can be
+    read as needed. For example, read only some of the columns, only the rows
+    matching a filter, or one batch at a time. Each read uses the table that
+    the query wrote its results to, so the query only runs, and is billed,
+    once.
+
+    Args:
+        query:
+            SQL query to run.
+        project_id:
+            Optional. Google Cloud project ID to run the query in.
+        location:
+            Optional. Location where the query job runs.
+        dialect:
+            Optional. SQL dialect, either ``'standard'`` or ``'legacy'``.
+            Defaults to :attr:`pandas_gbq.context.dialect`, or ``'standard'``.
+        configuration:
+            Optional. Query job configuration, as in
+            :func:`pandas_gbq.read_gbq`.
+        credentials:
+            Optional. Credentials for accessing Google APIs.
+        query_parameters:
+            Optional. Query parameters, as in :func:`pandas_gbq.read_gbq`.
+        use_bqstorage_api:
+            Use the BigQuery Storage Read API to download the results, when
+            it's available.
+        bigquery_client:
+            Optional. A BigQuery client to use for API requests.
+
+    Returns:
+        QueryResult: A handle to the finished query job and its results.
+
+    Examples:
+        >>> import pandas_gbq
+        >>> result = pandas_gbq.execute_query("SELECT * FROM my_dataset.events")
+        >>> errors = result.to_dataframe(row_filter="severity = 'ERROR'")
+        >>> for batch in result.iter_batches(columns=["event_id"]):
+        ...     process(batch)
+    """
+    if dialect is None:
+        dialect = get_context().dialect
+    if dialect is None:
+        dialect = "standard"
+
+    query, configuration = pandas_gbq.gbq._prepare_read_gbq(
+        query,
+        dialect=dialect,
+        configuration=configuration,
+        query_parameters=query_parameters,
+    )
+    if not pandas_gbq.gbq._is_query(query):
+        raise ValueError("execute_query requires a query, not a table ID.")
+
+    connector = GbqConnector(
+        project_id,
+        dialect=dialect,
+        location=location,
+        credentials=credentials,
+        use_bqstorage_api=use_bqstorage_api,
+        bigquery_client=bigquery_client,
+    )
+    job_config_dict, timeout_ms = connector._make_query_config(configuration)
+    job_config = google.cloud.bigquery.QueryJobConfig.from_api_repr(job_config_dict)
+    connector._start_timer()
+
+    # Always create a job, rather than use the jobs.query API, since the
+    # results are read from the job's destination table.
+    with pandas_gbq.core.scheduler.job_slot(
+        connector.project_id, table_id=_destination_table_id(job_config_dict)
+    ):
+        rows_iter = pandas_gbq.query.query_and_wait(
+            connector,
+            connector.client,
+            query,
+            job_config=job_config,
+            location=connector.location,
+            project_id=connector.project_id,
+            max_results=0,
+            timeout_ms=timeout_ms,
+        )
+    return QueryResult(connector, rows_iter.job)
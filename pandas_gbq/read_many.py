@@ -0,0 +1,193 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Run many queries concurrently, downloading each result when it's ready."""
+
+from __future__ import annotations
+
+import collections.abc
+import concurrent.futures
+import contextvars
+import copy
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import pandas_gbq.contexts
+import pandas_gbq.core.job_tracker
+import pandas_gbq.gbq
+from pandas_gbq.gbq_connector import GbqConnector
+
+
+def read_gbq_many(
+    queries: Union[Sequence[str], Mapping[Any, str]],
+    *,
+    project_id: Optional[str] = None,
+    location: Optional[str] = None,
+    dialect: Optional[str] = None,
+    configuration: Optional[Dict[str, Any]] = None,
+    credentials=None,
+    dtypes: Optional[Dict[str, Any]] = None,
+    max_results: Optional[int] = None,
+    max_concurrent_jobs: int = 20,
+    max_concurrent_downloads: int = 4,
+    return_exceptions: bool = False,
+) -> Union[List[Any], Dict[Any, Any]]:
+    """Run many independent queries concurrently.
+
+    Up to ``max_concurrent_jobs`` query jobs run at the same time. As soon as
+    a job finishes, its results start downloading, while the other jobs are
+    still running, and the next query is submitted. Up to
+    ``max_concurrent_downloads`` results download at the same time. The total
+    time is then closer to that of the slowest query than to the sum of all
+    of them.
+
+    If :attr:`pandas_gbq.context.result_cache` or
+    :attr:`pandas_gbq.context.coalesce_requests` is set, each query runs as
+    in :func:`pandas_gbq.read_gbq`, and its download isn't counted towards
+    ``max_concurrent_downloads``.
+
+    Args:
+        queries:
+            SQL queries to run, either as a sequence, or as a mapping from
+            any key, such as a report section name, to a query.
+        project_id:
+            Optional. Google Cloud project ID to run the queries in.
+        location:
+            Optional. Location where the query jobs run.
+        dialect:
+            Optional. SQL dialect, either ``'standard'`` or ``'legacy'``.
+            Defaults to :attr:`pandas_gbq.context.dialect`, or ``'standard'``.
+        configuration:
+            Optional. Query job configuration, as in
+            :func:`pandas_gbq.read_gbq`, applied to every query.
+        credentials:
+            Optional. Credentials for accessing Google APIs.
+        dtypes:
+            Optional. Column dtypes, as in :func:`pandas_gbq.read_gbq`,
+            applied to every result.
+        max_results:
+            Optional. Maximum number of rows to read from each result.
+        max_concurrent_jobs:
+            Maximum number of query jobs to run at the same time.
+        max_concurrent_downloads:
+            Maximum number of results to download at the same time.
+        return_exceptions:
+            If ``True``, return the exception raised for a query in its place
+            in the results, rather than raising it.
+
+    Returns:
+        A list of DataFrames, in the same order as ``queries``, or, if
+        ``queries`` is a mapping, a dict with the same keys.
+    """
+    if max_concurrent_jobs < 1:
+        raise ValueError(
+            f"max_concurrent_jobs must be positive, got {max_concurrent_jobs}."
+        )
+    if max_concurrent_downloads < 1:
+        raise ValueError(
+            "max_concurrent_downloads must be positive, "
+            f"got {max_concurrent_downloads}."
+        )
+
+    if isinstance(queries, collections.abc.Mapping):
+        keys = list(queries.keys())
+        query_list = list(queries.values())
+    else:
+        keys = None
+        query_list = list(queries)
+
+    if not query_list:
+        return [] if keys is None else {}
+
+    if dialect is None:
+        dialect = pandas_gbq.contexts.get_context().dialect or "standard"
+    if dialect not in ("legacy", "standard"):
+        raise ValueError("'{0}' is not valid for dialect".format(dialect))
+
+    configuration = pandas_gbq.gbq._transform_read_gbq_configuration(configuration)
+    connector = GbqConnector(
+        project_id,
+        dialect=dialect,
+        location=location,
+        credentials=credentials,
+    )
+    job_config_dict, timeout_ms = connector._make_query_config(configuration)
+    use_run_query = connector.result_cache is not None or connector.coalesce_requests
+
+    def download(rows_iter):
+        return connector._download_results(
+            rows_iter,
+            max_results=max_results,
+            progress_bar_type=None,
+            user_dtypes=dtypes,
+        )
+
+    # Track the queries, so that they can be cancelled if one fails.
+    tracker = pandas_gbq.core.job_tracker.JobTracker()
+
+    results: List[Any] = []
+    # Exit the jobs executor first, since its tasks submit downloads.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_concurrent_downloads,
+        thread_name_prefix="pandas_gbq_read_many_download",
+    ) as downloads, concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_concurrent_jobs, len(query_list)),
+        thread_name_prefix="pandas_gbq_read_many_job",
+    ) as jobs:
+
+        def run(query) -> concurrent.futures.Future:
+            with pandas_gbq.core.job_tracker.tracking(tracker):
+                return run_tracked(query)
+
+        def run_tracked(query) -> concurrent.futures.Future:
+            if use_run_query:
+                future: concurrent.futures.Future = concurrent.futures.Future()
+                future.set_result(
+                    connector.run_query(
+                        query,
+                        configuration=configuration,
+                        max_results=max_results,
+                        progress_bar_type=None,
+                        dtypes=dtypes,
+                    )
+                )
+                return future
+
+            # Copy the connector so that each query's timeout is measured
+            # from when it starts, not from when the first query started.
+            query_connector = copy.copy(connector)
+            query_connector._start_timer()
+            rows_iter = query_connector._run_query_job(
+                query,
+                job_config_dict,
+                timeout_ms=timeout_ms,
+                max_results=max_results,
+            )
+            return downloads.submit(contextvars.copy_context().run, download, rows_iter)
+
+        # Executor threads don't inherit context variables, such as the
+        # context used by a pandas_gbq.Session or the caller's JobTracker, so
+        # run each query in a copy of the caller's.
+        futures = [
+            jobs.submit(contextvars.copy_context().run, run, query)
+            for query in query_list
+        ]
+        try:
+            for future in futures:
+                try:
+                    results.append(future.result().result())
+                except Exception as ex:
+                    if not return_exceptions:
+                        raise
+                    results.append(ex)
+        except BaseException:
+            # Stop the jobs still running in BigQuery, rather than waiting
+            # for them when leaving the executors.
+            for pending in futures:
+                pending.cancel()
+            tracker.cancel_all()
+            raise
+
+    if keys is None:
+        return results
+    return dict(zip(keys, results))
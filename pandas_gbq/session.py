@@ -0,0 +1,192 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+"""Reusable state for many calls to pandas-gbq from a long-running process."""
+
+from __future__ import annotations
+
+import copy
+import typing
+from typing import Any, Dict, Optional
+
+import pandas_gbq.contexts
+import pandas_gbq.core.metadata_cache
+import pandas_gbq.core.sample
+import pandas_gbq.gbq
+import pandas_gbq.gbq_connector
+
+# Only import at module-level at type checking time to avoid circular
+# dependencies in the pandas package, which has an optional dependency on
+# pandas-gbq.
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    import pandas
+
+
+class Session:
+    """Credentials, clients, caches and defaults shared by many API calls.
+
+    A session authenticates once, when it is created, and its calls to
+    :meth:`read_gbq`, :meth:`to_gbq` and :meth:`sample` reuse the same
+    BigQuery and BigQuery Storage API clients. Table and dataset metadata is
+    cached across calls.
+
+    A session starts from a copy of :attr:`pandas_gbq.context`, so settings
+    such as :attr:`~pandas_gbq.Context.dry_run_cache`,
+    :attr:`~pandas_gbq.Context.token_store` and
+    :attr:`~pandas_gbq.Context.query_progress_callback` apply to its calls,
+    too, unless they're overridden by the arguments below. Later changes to
+    :attr:`pandas_gbq.context` don't affect the session, and the session
+    doesn't modify it. Sessions are safe to share across threads.
+
+    Args:
+        project_id:
+            Optional. Google Cloud project ID to use for billing. Defaults to
+            the project of the credentials or environment.
+        credentials:
+            Optional. Credentials for Google APIs. If not set, they are found
+            the same way as in :func:`pandas_gbq.read_gbq`.
+        location:
+            Optional. Default location for query jobs and new datasets.
+        dialect:
+            Default SQL dialect for :meth:`read_gbq`.
+        use_bqstorage_api:
+            Optional. Default for whether to download results with the
+            BigQuery Storage Read API.
+        dtypes:
+            Optional. Default column dtypes for :meth:`read_gbq`. The
+            ``dtypes`` passed to each call take precedence.
+        progress_bar_type:
+            Optional. Default progress bar for :meth:`read_gbq` and
+            :meth:`sample`.
+        metadata_cache:
+            Optional. Cache for table and dataset metadata. Defaults to a new
+            :class:`pandas_gbq.MetadataCache`.
+        result_cache:
+            Optional. Cache for query results. See
+            :attr:`pandas_gbq.Context.result_cache`.
+        coalesce_requests:
+            Optional. If ``True``, share jobs among identical concurrent
+            requests. See :attr:`pandas_gbq.Context.coalesce_requests`.
+        job_scheduler:
+            Optional. Queue for the jobs started by this session. See
+            :attr:`pandas_gbq.Context.job_scheduler`. Pass the same scheduler
+            to several sessions to apply its limits to all of them.
+        max_bytes_billed:
+            Optional. Maximum number of bytes each query can bill. See
+            :attr:`pandas_gbq.Context.max_bytes_billed`.
+
+        ``result_cache``, ``coalesce_requests``, ``job_scheduler`` and
+        ``max_bytes_billed`` default to their values in
+        :attr:`pandas_gbq.context` when the session is created.
+
+    Examples:
+        >>> import pandas_gbq
+        >>> session = pandas_gbq.Session(project_id="my-project", location="US")
+        >>> df = session.read_gbq("SELECT 1 AS x")
+    """
+
+    def __init__(
+        self,
+        project_id: Optional[str] = None,
+        *,
+        credentials=None,
+        location: Optional[str] = None,
+        dialect: str = "standard",
+        use_bqstorage_api: Optional[bool] = None,
+        dtypes: Optional[Dict[str, Any]] = None,
+        progress_bar_type: Optional[str] = None,
+        metadata_cache: Optional[pandas_gbq.core.metadata_cache.MetadataCache] = None,
+        result_cache=None,
+        coalesce_requests: Optional[bool] = None,
+        job_scheduler=None,
+        max_bytes_billed: Optional[int] = None,
+    ):
+        if metadata_cache is None:
+            metadata_cache = pandas_gbq.core.metadata_cache.MetadataCache()
+
+        # Start from the global settings, then apply this session's own.
+        self._context = copy.copy(pandas_gbq.contexts.context)
+        self._context.dialect = dialect
+        self._context.metadata_cache = metadata_cache
+        if result_cache is not None:
+            self._context.result_cache = result_cache
+        if coalesce_requests is not None:
+            self._context.coalesce_requests = coalesce_requests
+        if job_scheduler is not None:
+            self._context.job_scheduler = job_scheduler
+        if max_bytes_billed is not None:
+            self._context.max_bytes_billed = max_bytes_billed
+
+        # Authenticate now, rather than on the first call.
+        with pandas_gbq.contexts.use_context(self._context):
+            connector = pandas_gbq.gbq_connector.GbqConnector(
+                project_id,
+                credentials=credentials,
+                location=location,
+            )
+
+        self.project_id: str = connector.project_id
+        self.credentials = connector.credentials
+        self.location = location
+        self.use_bqstorage_api = use_bqstorage_api
+        self.dtypes = dict(dtypes) if dtypes else {}
+        self.progress_bar_type = progress_bar_type
+        self.metadata_cache = metadata_cache
+        self._context.credentials = self.credentials
+        self._context.project = self.project_id
+        self._client = connector.client
+
+    @property
+    def client(self):
+        """The ``google.cloud.bigquery.Client`` used by this session."""
+        return self._client
+
+    def read_gbq(self, query_or_table: str, **kwargs) -> pandas.DataFrame:
+        """Read data from BigQuery, using this session's defaults.
+
+        Accepts the same arguments as :func:`pandas_gbq.read_gbq`.
+        """
+        self._set_defaults(kwargs)
+        if self.progress_bar_type is not None:
+            kwargs.setdefault("progress_bar_type", self.progress_bar_type)
+        if self.dtypes:
+            kwargs["dtypes"] = {**self.dtypes, **(kwargs.get("dtypes") or {})}
+        if self.use_bqstorage_api is not None:
+            kwargs.setdefault("use_bqstorage_api", self.use_bqstorage_api)
+
+        with pandas_gbq.contexts.use_context(self._context):
+            return pandas_gbq.gbq.read_gbq(query_or_table, **kwargs)
+
+    def to_gbq(
+        self, dataframe: pandas.DataFrame, destination_table: str, **kwargs
+    ) -> None:
+        """Write a DataFrame to a BigQuery table, using this session's defaults.
+
+        Accepts the same arguments as :func:`pandas_gbq.to_gbq`.
+        """
+        self._set_defaults(kwargs)
+
+        with pandas_gbq.contexts.use_context(self._context):
+            return pandas_gbq.gbq.to_gbq(dataframe, destination_table, **kwargs)
+
+    def sample(self, table_id: str, **kwargs) -> Optional[pandas.DataFrame]:
+        """Sample a BigQuery table, using this session's credentials.
+
+        Accepts the same arguments as :func:`pandas_gbq.sample`.
+        """
+        kwargs.setdefault("credentials", self.credentials)
+        kwargs.setdefault("billing_project_id", self.project_id)
+        if self.progress_bar_type is not None:
+            kwargs.setdefault("progress_bar_type", self.progress_bar_type)
+        if self.use_bqstorage_api is not None:
+            kwargs.setdefault("use_bqstorage_api", self.use_bqstorage_api)
+
+        with pandas_gbq.contexts.use_context(self._context):
+            return pandas_gbq.core.sample.sample(table_id, **kwargs)
+
+    def _set_defaults(self, kwargs: Dict[str, Any]):
+        kwargs.setdefault("project_id", self.project_id)
+        kwargs.setdefault("credentials", self.credentials)
+        if self.location is not None:
+            kwargs.setdefault("location", self.location)
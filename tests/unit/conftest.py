@@ -42,9 +42,30 @@ def no_auth(monkeypatch):
 @pytest.fixture(autouse=True, scope="function")
 def reset_context():
     import pandas_gbq
+    import pandas_gbq.core.client_pool
+
+    pandas_gbq.core.client_pool.clear()
 
     pandas_gbq.context.credentials = None
     pandas_gbq.context.project = None
+    pandas_gbq.context.result_cache = None
+    pandas_gbq.context.coalesce_requests = False
+    pandas_gbq.context.metadata_cache = None
+    pandas_gbq.context.dry_run_cache = None
+    pandas_gbq.context.token_store = None
+    pandas_gbq.context.sample_cache = None
+    pandas_gbq.context.key_cache = None
+    pandas_gbq.context.job_scheduler = None
+    pandas_gbq.context.query_progress_callback = None
+    pandas_gbq.context.max_bytes_billed = None
+
+
+@pytest.fixture(autouse=True)
+def reset_environment_identities():
+    import pandas_gbq.environment
+
+    # Tests patch environment variables, so detect the environment again.
+    pandas_gbq.environment.get_identities.cache_clear()
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,107 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from unittest import mock
+
+import google.auth.credentials
+import pytest
+
+import pandas_gbq.core.client_pool as client_pool
+
+
+@pytest.fixture
+def credentials():
+    return mock.create_autospec(google.auth.credentials.Credentials)
+
+
+def _get_client(pool, credentials, **kwargs):
+    options = dict(
+        project_id="my-project",
+        credentials=credentials,
+        location=None,
+        user_agent="pandas-gbq-test",
+    )
+    options.update(kwargs)
+    return pool.get_client(**options)
+
+
+def test_get_client_reuses_client(mock_bigquery_client, credentials):
+    pool = client_pool.ClientPool()
+    _get_client(pool, credentials)
+    _get_client(pool, credentials)
+
+    mock_bigquery_client.assert_called_once()
+    _, kwargs = mock_bigquery_client.call_args
+    assert kwargs["project"] == "my-project"
+    assert kwargs["credentials"] is credentials
+    assert kwargs["client_info"].user_agent == "pandas-gbq-test"
+
+
+@pytest.mark.parametrize(
+    ("key", "value"),
+    [
+        ("project_id", "other-project"),
+        ("location", "EU"),
+        ("user_agent", "other-user-agent"),
+    ],
+)
+def test_get_client_with_different_options_creates_client(
+    mock_bigquery_client, credentials, key, value
+):
+    pool = client_pool.ClientPool()
+    _get_client(pool, credentials)
+    _get_client(pool, credentials, **{key: value})
+
+    assert mock_bigquery_client.call_count == 2
+    assert len(pool) == 2
+
+
+def test_get_client_with_different_credentials_creates_client(
+    mock_bigquery_client, credentials
+):
+    pool = client_pool.ClientPool()
+    _get_client(pool, credentials)
+    _get_client(pool, mock.create_autospec(google.auth.credentials.Credentials))
+
+    assert mock_bigquery_client.call_count == 2
+
+
+def test_get_client_evicts_least_recently_used(mock_bigquery_client, credentials):
+    pool = client_pool.ClientPool(max_clients=2)
+    _get_client(pool, credentials, project_id="first")
+    _get_client(pool, credentials, project_id="second")
+    _get_client(pool, credentials, project_id="first")
+    _get_client(pool, credentials, project_id="third")
+    assert len(pool) == 2
+    assert mock_bigquery_client.call_count == 3
+
+    _get_client(pool, credentials, project_id="first")
+    assert mock_bigquery_client.call_count == 3
+    _get_client(pool, credentials, project_id="second")
+    assert mock_bigquery_client.call_count == 4
+
+
+def test_get_bqstorage_client_reuses_client(monkeypatch, credentials):
+    bigquery_storage = pytest.importorskip("google.cloud.bigquery_storage")
+    mock_read_client_class = mock.create_autospec(bigquery_storage.BigQueryReadClient)
+    monkeypatch.setattr(bigquery_storage, "BigQueryReadClient", mock_read_client_class)
+    pool = client_pool.ClientPool()
+
+    first = pool.get_bqstorage_client(credentials=credentials, user_agent="test")
+    second = pool.get_bqstorage_client(credentials=credentials, user_agent="test")
+
+    assert first is second
+    mock_read_client_class.assert_called_once()
+    _, kwargs = mock_read_client_class.call_args
+    assert kwargs["credentials"] is credentials
+    assert kwargs["client_info"].user_agent == "test"
+
+
+def test_clear(mock_bigquery_client, credentials):
+    pool = client_pool.ClientPool()
+    _get_client(pool, credentials)
+    pool.clear()
+    _get_client(pool, credentials)
+
+    assert mock_bigquery_client.call_count == 2
@@ -0,0 +1,158 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import concurrent.futures
+import threading
+import time
+from unittest import mock
+
+import pandas
+import pytest
+
+import pandas_gbq.core.coalesce as coalesce
+
+
+def _run_concurrently(coalescer, key, fn, num_followers, **kwargs):
+    """Start a leader, then followers once the leader is running."""
+    leader_started = threading.Event()
+    release_leader = threading.Event()
+
+    def leader_fn():
+        leader_started.set()
+        release_leader.wait(timeout=5)
+        return fn()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_followers + 1) as pool:
+        leader = pool.submit(coalescer.run, key, leader_fn, **kwargs)
+        assert leader_started.wait(timeout=5)
+        followers = [
+            pool.submit(coalescer.run, key, fn, **kwargs) for _ in range(num_followers)
+        ]
+
+        deadline = time.monotonic() + 5
+        while coalescer._in_flight[key].waiters < num_followers:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        release_leader.set()
+
+        return leader.result(), [future.result() for future in followers]
+
+
+def test_run_shares_result_with_copies():
+    coalescer = coalesce.RequestCoalescer()
+    fn = mock.Mock(return_value=pandas.DataFrame({"x": [1, 2]}))
+
+    leader_result, follower_results = _run_concurrently(
+        coalescer, "key", fn, num_followers=3
+    )
+
+    fn.assert_called_once()
+    assert leader_result is fn.return_value
+    for result in follower_results:
+        assert result is not leader_result
+        pandas.testing.assert_frame_equal(result, leader_result)
+    assert coalescer._in_flight == {}
+
+
+def test_run_leader_modifying_result_doesnt_affect_followers(monkeypatch):
+    coalescer = coalesce.RequestCoalescer()
+    leader_modified = threading.Event()
+    original_copy_result = coalesce.copy_result
+
+    def slow_copy_result(result):
+        # Followers copy only after the leader has set the index in place, like
+        # read_gbq does with index_col.
+        if threading.current_thread().name.startswith("follower"):
+            assert leader_modified.wait(timeout=5)
+        return original_copy_result(result)
+
+    monkeypatch.setattr(coalesce, "copy_result", slow_copy_result)
+
+    def read_with_index_col(fn):
+        df = coalescer.run("key", fn)
+        df.set_index("x", inplace=True)
+        return df
+
+    def leader():
+        df = read_with_index_col(leader_fn)
+        leader_modified.set()
+        return df
+
+    leader_started = threading.Event()
+    release_leader = threading.Event()
+
+    def leader_fn():
+        leader_started.set()
+        release_leader.wait(timeout=5)
+        return pandas.DataFrame({"x": [1, 2], "y": ["a", "b"]})
+
+    leader_thread = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="leader")
+    follower_threads = concurrent.futures.ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="follower"
+    )
+    with leader_thread, follower_threads:
+        leader_future = leader_thread.submit(leader)
+        assert leader_started.wait(timeout=5)
+        followers = [
+            follower_threads.submit(read_with_index_col, mock.Mock()) for _ in range(2)
+        ]
+        deadline = time.monotonic() + 5
+        while coalescer._in_flight["key"].waiters < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        release_leader.set()
+
+        expected = pandas.DataFrame(
+            {"y": ["a", "b"]}, index=pandas.Index([1, 2], name="x")
+        )
+        pandas.testing.assert_frame_equal(leader_future.result(), expected)
+        for future in followers:
+            pandas.testing.assert_frame_equal(future.result(), expected)
+
+
+def test_run_shares_exception():
+    coalescer = coalesce.RequestCoalescer()
+    fn = mock.Mock(side_effect=ValueError("boom"))
+
+    with pytest.raises(ValueError, match="boom"):
+        _run_concurrently(coalescer, "key", fn, num_followers=2)
+
+    fn.assert_called_once()
+    assert coalescer._in_flight == {}
+
+
+def test_run_not_shareable_runs_each_caller():
+    coalescer = coalesce.RequestCoalescer()
+    fn = mock.Mock(return_value=pandas.DataFrame())
+    is_shareable = mock.Mock(return_value=False)
+
+    _run_concurrently(coalescer, "key", fn, num_followers=2, is_shareable=is_shareable)
+
+    assert fn.call_count == 3
+    is_shareable.assert_called_once()
+
+
+def test_run_without_waiters_skips_is_shareable():
+    coalescer = coalesce.RequestCoalescer()
+    is_shareable = mock.Mock(return_value=True)
+
+    assert coalescer.run("key", lambda: 1, is_shareable=is_shareable) == 1
+    is_shareable.assert_not_called()
+
+
+def test_run_different_keys_not_shared():
+    coalescer = coalesce.RequestCoalescer()
+    assert coalescer.run("a", lambda: 1) == 1
+    assert coalescer.run("b", lambda: 2) == 2
+
+
+def test_copy_result_without_copy_on_write(monkeypatch):
+    monkeypatch.setattr(coalesce, "_copy_on_write_enabled", lambda: False)
+    df = pandas.DataFrame({"x": [1, 2]})
+
+    result = coalesce.copy_result(df)
+    result.loc[0, "x"] = 100
+
+    assert df.loc[0, "x"] == 1
+    assert coalesce.copy_result(None) is None
@@ -2,6 +2,7 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
+import datetime
 from typing import Sequence
 from unittest import mock
 
@@ -441,3 +442,107 @@ def test_sample_uses_limit_fallback_no_bytes(
         pandas_gbq.core.sample.sample("my-project.my_dataset.my_table")
 
     mock_sample_with_limit.assert_called_once()
+
+
+def _make_cacheable_table(modified):
+    mock_table = mock.Mock(spec=google.cloud.bigquery.Table)
+    mock_table.project = "my-project"
+    mock_table.dataset_id = "my_dataset"
+    mock_table.table_id = "my_table"
+    mock_table.table_type = "TABLE"
+    mock_table.num_bytes = 1_000_000_000_000
+    mock_table.num_rows = 1_000
+    mock_table.modified = modified
+    mock_table.streaming_buffer = None
+    mock_table.schema = [google.cloud.bigquery.SchemaField("col1", "INT64")]
+    return mock_table
+
+
+@pytest.fixture
+def sample_cache(tmp_path):
+    import pandas_gbq
+
+    cache = pandas_gbq.ResultCache(tmp_path)
+    pandas_gbq.context.sample_cache = cache
+    return cache
+
+
+@mock.patch("pandas_gbq.core.sample._sample_with_tablesample")
+def test_sample_with_cache_reuses_sample_of_unmodified_table(
+    mock_sample_with_tablesample,
+    mock_gbq_connector,
+    mock_bigquery_client,
+    sample_cache,
+):
+    import pandas
+
+    modified = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    mock_bigquery_client.get_table.return_value = _make_cacheable_table(modified)
+    mock_sample_with_tablesample.return_value = pandas.DataFrame({"col1": [1, 2]})
+
+    first = pandas_gbq.core.sample.sample("my-project.my_dataset.my_table", target_mb=1)
+    second = pandas_gbq.core.sample.sample(
+        "my-project.my_dataset.my_table", target_mb=1
+    )
+
+    mock_sample_with_tablesample.assert_called_once()
+    pandas.testing.assert_frame_equal(first, second)
+
+
+@mock.patch("pandas_gbq.core.sample._sample_with_tablesample")
+def test_sample_with_cache_resamples_modified_table(
+    mock_sample_with_tablesample,
+    mock_gbq_connector,
+    mock_bigquery_client,
+    sample_cache,
+):
+    import pandas
+
+    mock_sample_with_tablesample.return_value = pandas.DataFrame({"col1": [1, 2]})
+    for day in (1, 2):
+        modified = datetime.datetime(2026, 1, day, tzinfo=datetime.timezone.utc)
+        mock_bigquery_client.get_table.return_value = _make_cacheable_table(modified)
+        pandas_gbq.core.sample.sample("my-project.my_dataset.my_table", target_mb=1)
+
+    assert mock_sample_with_tablesample.call_count == 2
+
+
+@mock.patch("pandas_gbq.core.sample._sample_with_tablesample")
+def test_sample_with_cache_keys_by_target_mb(
+    mock_sample_with_tablesample,
+    mock_gbq_connector,
+    mock_bigquery_client,
+    sample_cache,
+):
+    import pandas
+
+    modified = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    mock_bigquery_client.get_table.return_value = _make_cacheable_table(modified)
+    mock_sample_with_tablesample.return_value = pandas.DataFrame({"col1": [1, 2]})
+
+    pandas_gbq.core.sample.sample("my-project.my_dataset.my_table", target_mb=1)
+    pandas_gbq.core.sample.sample("my-project.my_dataset.my_table", target_mb=2)
+
+    assert mock_sample_with_tablesample.call_count == 2
+
+
+@mock.patch("pandas_gbq.core.sample._sample_with_limit")
+def test_sample_with_cache_does_not_cache_views(
+    mock_sample_with_limit,
+    mock_gbq_connector,
+    mock_bigquery_client,
+    sample_cache,
+):
+    import pandas
+
+    modified = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    mock_table = _make_cacheable_table(modified)
+    mock_table.table_type = "VIEW"
+    mock_bigquery_client.get_table.return_value = mock_table
+    mock_sample_with_limit.return_value = pandas.DataFrame({"col1": [1, 2]})
+
+    pandas_gbq.core.sample.sample("my-project.my_dataset.my_table", target_mb=1)
+    pandas_gbq.core.sample.sample("my-project.my_dataset.my_table", target_mb=1)
+
+    assert mock_sample_with_limit.call_count == 2
+    assert len(list(sample_cache.directory.iterdir())) == 0
@@ -0,0 +1,167 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import datetime
+import threading
+from unittest import mock
+
+import google.auth.credentials
+import google.auth.exceptions
+import pytest
+
+from pandas_gbq.core import credentials_manager
+
+NOW = datetime.datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def fixed_now(monkeypatch):
+    monkeypatch.setattr(credentials_manager, "_utcnow", lambda: NOW)
+
+
+def _make_credentials(expires_in_seconds=None, *, email=None):
+    credentials = mock.create_autospec(
+        google.auth.credentials.Credentials, instance=True
+    )
+    credentials.expiry = (
+        None
+        if expires_in_seconds is None
+        else NOW + datetime.timedelta(seconds=expires_in_seconds)
+    )
+    credentials.valid = expires_in_seconds is not None
+    if email is not None:
+        credentials.service_account_email = email
+
+    def refresh(request):
+        credentials.expiry = NOW + datetime.timedelta(hours=1)
+        credentials.valid = True
+
+    credentials.refresh.side_effect = refresh
+    return credentials
+
+
+def test_refresh_only_refreshes_credentials_close_to_expiry():
+    manager = credentials_manager.CredentialsManager(
+        refresh_margin_seconds=300, background=False
+    )
+    expiring = manager.manage(_make_credentials(60, email="a@example.com"))
+    fresh = manager.manage(_make_credentials(3600, email="b@example.com"))
+
+    manager.refresh()
+
+    expiring.refresh.assert_called_once()
+    fresh.refresh.assert_not_called()
+    assert expiring.expiry == NOW + datetime.timedelta(hours=1)
+
+
+def test_refresh_force_refreshes_all_credentials():
+    manager = credentials_manager.CredentialsManager(background=False)
+    credentials = manager.manage(_make_credentials(3600))
+
+    manager.refresh(force=True)
+
+    credentials.refresh.assert_called_once()
+
+
+def test_refresh_skips_credentials_that_never_expire():
+    manager = credentials_manager.CredentialsManager(background=False)
+    credentials = _make_credentials()
+    credentials.valid = True
+    manager.manage(credentials)
+
+    manager.refresh()
+
+    credentials.refresh.assert_not_called()
+
+
+def test_refresh_failure_waits_before_retrying(monkeypatch):
+    manager = credentials_manager.CredentialsManager(retry_seconds=30, background=False)
+    credentials = manager.manage(_make_credentials(60))
+    credentials.refresh.side_effect = google.auth.exceptions.TransportError("down")
+
+    manager.refresh()
+    manager.refresh()
+    assert credentials.refresh.call_count == 1
+
+    later = NOW + datetime.timedelta(seconds=31)
+    monkeypatch.setattr(credentials_manager, "_utcnow", lambda: later)
+    manager.refresh()
+    assert credentials.refresh.call_count == 2
+
+
+def test_get_credentials_loads_default_credentials_once(monkeypatch):
+    default_credentials = _make_credentials(3600)
+    get_credentials = mock.Mock(return_value=(default_credentials, "my-project"))
+    monkeypatch.setattr(
+        credentials_manager.pandas_gbq.auth, "get_credentials", get_credentials
+    )
+    manager = credentials_manager.CredentialsManager(background=False)
+
+    first = manager.get_credentials()
+    second = manager.get_credentials(["https://www.googleapis.com/auth/bigquery"])
+
+    assert first == (default_credentials, "my-project")
+    assert second == first
+    get_credentials.assert_called_once_with(scopes=None)
+    assert len(manager) == 1
+
+
+def test_get_credentials_keys_by_scopes(monkeypatch):
+    get_credentials = mock.Mock(
+        side_effect=lambda scopes: (_make_credentials(3600), "my-project")
+    )
+    monkeypatch.setattr(
+        credentials_manager.pandas_gbq.auth, "get_credentials", get_credentials
+    )
+    manager = credentials_manager.CredentialsManager(background=False)
+
+    bigquery, _ = manager.get_credentials()
+    drive, _ = manager.get_credentials(["https://www.googleapis.com/auth/drive"])
+
+    assert bigquery is not drive
+    assert len(manager) == 2
+
+
+def test_get_credentials_returns_managed_account():
+    manager = credentials_manager.CredentialsManager(background=False)
+    credentials = manager.manage(
+        _make_credentials(3600, email="sa@example.com"), project_id="sa-project"
+    )
+
+    assert manager.get_credentials(account="sa@example.com") == (
+        credentials,
+        "sa-project",
+    )
+
+
+def test_get_credentials_with_other_account_raises(monkeypatch):
+    monkeypatch.setattr(
+        credentials_manager.pandas_gbq.auth,
+        "get_credentials",
+        lambda scopes: (_make_credentials(3600, email="a@example.com"), None),
+    )
+    manager = credentials_manager.CredentialsManager(background=False)
+
+    with pytest.raises(ValueError, match="b@example.com"):
+        manager.get_credentials(account="b@example.com")
+
+
+def test_manage_returns_existing_credentials_for_same_account():
+    manager = credentials_manager.CredentialsManager(background=False)
+    first = manager.manage(_make_credentials(3600, email="sa@example.com"))
+    second = manager.manage(_make_credentials(3600, email="sa@example.com"))
+
+    assert second is first
+
+
+def test_background_thread_refreshes_new_credentials():
+    refreshed = threading.Event()
+    credentials = _make_credentials()
+    credentials.refresh.side_effect = lambda request: refreshed.set()
+
+    with credentials_manager.CredentialsManager(retry_seconds=60) as manager:
+        manager.manage(credentials)
+        assert refreshed.wait(timeout=5)
+
+    assert manager._thread is None
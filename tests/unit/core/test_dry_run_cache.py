@@ -0,0 +1,105 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import datetime
+from unittest import mock
+
+import freezegun
+import google.cloud.bigquery
+import pandas
+import pandas.testing
+import pytest
+
+import pandas_gbq.core.dry_run_cache as dry_run_cache
+
+CREATED = datetime.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc)
+
+
+def _make_query_job(referenced_tables=("my-project.ds.tbl",)):
+    query_job = mock.create_autospec(google.cloud.bigquery.QueryJob, instance=True)
+    query_job.created = CREATED
+    query_job.referenced_tables = [
+        google.cloud.bigquery.TableReference.from_string(table_id)
+        for table_id in referenced_tables
+    ]
+    return query_job
+
+
+@pytest.fixture
+def stats():
+    return pandas.Series({"totalBytesProcessed": 123, "statementType": "SELECT"})
+
+
+@pytest.fixture
+def bqclient(mock_bigquery_client):
+    mock_bigquery_client.modified = CREATED - datetime.timedelta(days=1)
+
+    def get_table(table_id, **kwargs):
+        table = google.cloud.bigquery.Table(table_id)
+        table._properties["lastModifiedTime"] = str(
+            int(mock_bigquery_client.modified.timestamp() * 1000)
+        )
+        return table
+
+    mock_bigquery_client.get_table.side_effect = get_table
+    return mock_bigquery_client
+
+
+def test_get_returns_copy_when_tables_unmodified(bqclient, stats):
+    cache = dry_run_cache.DryRunCache()
+    cache.put("key", stats, query_job=_make_query_job())
+
+    got = cache.get("key", bqclient=bqclient)
+    got["totalBytesProcessed"] = 0
+
+    pandas.testing.assert_series_equal(cache.get("key", bqclient=bqclient), stats)
+
+
+def test_get_when_table_modified_returns_none(bqclient, stats):
+    cache = dry_run_cache.DryRunCache()
+    cache.put("key", stats, query_job=_make_query_job())
+    bqclient.modified = CREATED + datetime.timedelta(seconds=1)
+
+    assert cache.get("key", bqclient=bqclient) is None
+    assert len(cache) == 0
+
+
+def test_get_uses_metadata_cache(bqclient, stats):
+    metadata_cache = mock.Mock()
+    metadata_cache.get_table.side_effect = lambda client, table_id: (
+        client.get_table(table_id)
+    )
+    cache = dry_run_cache.DryRunCache()
+    cache.put("key", stats, query_job=_make_query_job())
+
+    assert (
+        cache.get("key", bqclient=bqclient, metadata_cache=metadata_cache) is not None
+    )
+    metadata_cache.get_table.assert_called_once_with(bqclient, "my-project.ds.tbl")
+
+
+def test_put_without_referenced_tables_skipped(stats):
+    cache = dry_run_cache.DryRunCache()
+    cache.put("key", stats, query_job=_make_query_job(referenced_tables=()))
+    assert len(cache) == 0
+
+
+def test_get_after_ttl_returns_none(bqclient, stats):
+    with freezegun.freeze_time("2026-01-03 00:00:00") as frozen_datetime:
+        cache = dry_run_cache.DryRunCache(ttl_seconds=10)
+        cache.put("key", stats, query_job=_make_query_job())
+        frozen_datetime.tick(datetime.timedelta(seconds=10))
+
+        assert cache.get("key", bqclient=bqclient) is None
+
+
+def test_put_evicts_least_recently_used(bqclient, stats):
+    cache = dry_run_cache.DryRunCache(max_entries=2)
+    cache.put("first", stats, query_job=_make_query_job())
+    cache.put("second", stats, query_job=_make_query_job())
+    cache.get("first", bqclient=bqclient)
+    cache.put("third", stats, query_job=_make_query_job())
+
+    assert cache.get("first", bqclient=bqclient) is not None
+    assert cache.get("second", bqclient=bqclient) is None
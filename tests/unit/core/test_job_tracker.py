@@ -0,0 +1,95 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from unittest import mock
+
+import google.api_core.exceptions
+import google.cloud.bigquery
+import pytest
+
+from pandas_gbq.core import job_tracker
+
+
+def _mock_job(state):
+    job = mock.create_autospec(google.cloud.bigquery.QueryJob)
+    job.job_id = f"job-{state.lower()}"
+    job.state = state
+    return job
+
+
+def test_track_without_tracker_returns_job():
+    job = _mock_job("RUNNING")
+
+    assert job_tracker.track(job) is job
+
+
+def test_tracking_records_jobs_within_block():
+    tracker = job_tracker.JobTracker()
+    inside = _mock_job("RUNNING")
+    outside = _mock_job("RUNNING")
+
+    with job_tracker.tracking(tracker):
+        job_tracker.track(inside)
+    job_tracker.track(outside)
+
+    assert tracker.jobs == [inside]
+
+
+def test_nested_tracking_records_jobs_with_all_trackers():
+    outer = job_tracker.JobTracker()
+    inner = job_tracker.JobTracker()
+    job = _mock_job("RUNNING")
+
+    with job_tracker.tracking(outer), job_tracker.tracking(inner):
+        assert job_tracker.current() is inner
+        job_tracker.track(job)
+        assert not job_tracker.cancelled()
+        outer.cancel_all()
+        # Waiting for the job stops when any active tracker is cancelled.
+        assert job_tracker.cancelled()
+
+    assert outer.jobs == [job]
+    assert inner.jobs == [job]
+    assert not job_tracker.cancelled()
+
+
+def test_cancel_all_skips_done_jobs_and_ignores_errors():
+    tracker = job_tracker.JobTracker()
+    done = _mock_job("DONE")
+    running = _mock_job("RUNNING")
+    failing = _mock_job("PENDING")
+    failing.cancel.side_effect = google.api_core.exceptions.NotFound("gone")
+    for job in (done, failing, running):
+        tracker.add(job)
+
+    tracker.cancel_all()
+
+    done.cancel.assert_not_called()
+    failing.cancel.assert_called_once_with()
+    running.cancel.assert_called_once_with()
+
+
+def test_add_after_cancel_all_cancels_job():
+    tracker = job_tracker.JobTracker()
+    tracker.cancel_all()
+    job = _mock_job("PENDING")
+
+    tracker.add(job)
+
+    assert tracker.cancelled
+    job.cancel.assert_called_once_with()
+
+
+def test_tracking_method_cancels_jobs_on_error():
+    tracker = job_tracker.JobTracker()
+    job = _mock_job("RUNNING")
+
+    with pytest.raises(KeyboardInterrupt):
+        with tracker.tracking():
+            assert job_tracker.current() is tracker
+            job_tracker.track(job)
+            raise KeyboardInterrupt()
+
+    assert job_tracker.current() is None
+    job.cancel.assert_called_once_with()
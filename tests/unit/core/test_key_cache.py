@@ -0,0 +1,49 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from unittest import mock
+
+import pandas
+
+from pandas_gbq.core import key_cache
+
+ROWS = pandas.DataFrame({"id": [1], "name": ["a"]})
+
+
+def test_get_many_returns_cached_keys_only():
+    cache = key_cache.KeyCache()
+    cache.put_many("ns", [(1, ROWS), (2, ROWS.iloc[0:0])])
+
+    found = cache.get_many("ns", [1, 2, 3])
+
+    assert set(found) == {1, 2}
+    assert len(found[2].index) == 0
+
+
+def test_get_many_separates_namespaces():
+    cache = key_cache.KeyCache()
+    cache.put_many("ns", [(1, ROWS)])
+
+    assert cache.get_many("other", [1]) == {}
+
+
+def test_put_many_evicts_least_recently_used():
+    cache = key_cache.KeyCache(max_keys=2)
+
+    cache.put_many("ns", [(1, ROWS), (2, ROWS)])
+    cache.get_many("ns", [1])
+    cache.put_many("ns", [(3, ROWS)])
+
+    assert set(cache.get_many("ns", [1, 2, 3])) == {1, 3}
+    assert len(cache) == 2
+
+
+def test_get_many_drops_expired_entries():
+    cache = key_cache.KeyCache(ttl_seconds=10)
+    with mock.patch("time.monotonic", return_value=100.0):
+        cache.put_many("ns", [(1, ROWS)])
+    with mock.patch("time.monotonic", return_value=111.0):
+        assert cache.get_many("ns", [1]) == {}
+
+    assert len(cache) == 0
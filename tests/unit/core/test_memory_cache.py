@@ -0,0 +1,180 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import contextvars
+import datetime
+import threading
+from unittest import mock
+
+import freezegun
+import google.cloud.bigquery
+import pandas
+import pandas.testing
+import pytest
+
+import pandas_gbq.core.memory_cache as memory_cache
+
+
+def _make_query_job(statement_type="SELECT"):
+    query_job = mock.create_autospec(google.cloud.bigquery.QueryJob, instance=True)
+    query_job.statement_type = statement_type
+    return query_job
+
+
+@pytest.fixture
+def df():
+    return pandas.DataFrame({"x": [1, 2, 3]})
+
+
+def test_get_missing_returns_none():
+    cache = memory_cache.MemoryCache()
+    assert cache.get("missing") is None
+
+
+def test_get_returns_copy(df):
+    cache = memory_cache.MemoryCache()
+    cache.put("key", df, query_job=_make_query_job())
+
+    # Neither the original nor returned DataFrame shares state with the cache.
+    df.set_index("x", inplace=True)
+    first = cache.get("key")
+    first.loc[0, "x"] = 100
+
+    pandas.testing.assert_frame_equal(
+        cache.get("key"), pandas.DataFrame({"x": [1, 2, 3]})
+    )
+
+
+@pytest.mark.parametrize("statement_type", ["INSERT", "CREATE_TABLE", "SCRIPT"])
+def test_put_skips_non_select(df, statement_type):
+    cache = memory_cache.MemoryCache()
+    cache.put("key", df, query_job=_make_query_job(statement_type))
+    assert len(cache) == 0
+
+
+def test_get_after_ttl_returns_none(df):
+    with freezegun.freeze_time("2026-01-01 00:00:00") as frozen_datetime:
+        cache = memory_cache.MemoryCache(ttl_seconds=10)
+        cache.put("key", df, query_job=_make_query_job())
+
+        frozen_datetime.tick(datetime.timedelta(seconds=9))
+        assert cache.get("key") is not None
+
+        frozen_datetime.tick(datetime.timedelta(seconds=1))
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+
+def test_get_stale_while_revalidate_refreshes_in_background(df):
+    refreshed = threading.Event()
+    release_refresh = threading.Event()
+
+    with freezegun.freeze_time("2026-01-01 00:00:00") as frozen_datetime:
+        cache = memory_cache.MemoryCache(
+            ttl_seconds=10, stale_while_revalidate=True, stale_seconds=5
+        )
+        cache.put("key", df, query_job=_make_query_job())
+
+        def refresh():
+            release_refresh.wait(timeout=5)
+            cache.put("key", pandas.DataFrame({"x": [4]}), query_job=_make_query_job())
+            refreshed.set()
+
+        refresh_mock = mock.Mock(side_effect=refresh)
+        frozen_datetime.tick(datetime.timedelta(seconds=12))
+
+        # Stale results are returned right away, with only one refresh.
+        pandas.testing.assert_frame_equal(cache.get("key", refresh=refresh_mock), df)
+        pandas.testing.assert_frame_equal(cache.get("key", refresh=refresh_mock), df)
+        release_refresh.set()
+        assert refreshed.wait(timeout=5)
+        refresh_mock.assert_called_once()
+
+        pandas.testing.assert_frame_equal(
+            cache.get("key", refresh=refresh_mock), pandas.DataFrame({"x": [4]})
+        )
+
+
+def test_get_stale_while_revalidate_too_old_returns_none(df):
+    with freezegun.freeze_time("2026-01-01 00:00:00") as frozen_datetime:
+        cache = memory_cache.MemoryCache(
+            ttl_seconds=10, stale_while_revalidate=True, stale_seconds=5
+        )
+        cache.put("key", df, query_job=_make_query_job())
+        refresh = mock.Mock()
+
+        frozen_datetime.tick(datetime.timedelta(seconds=15))
+
+        assert cache.get("key", refresh=refresh) is None
+        refresh.assert_not_called()
+
+
+def test_refresh_error_keeps_stale_entry(df):
+    with freezegun.freeze_time("2026-01-01 00:00:00") as frozen_datetime:
+        cache = memory_cache.MemoryCache(ttl_seconds=10, stale_while_revalidate=True)
+        cache.put("key", df, query_job=_make_query_job())
+        frozen_datetime.tick(datetime.timedelta(seconds=11))
+
+        refresh = mock.Mock(side_effect=RuntimeError("boom"))
+        assert cache.get("key", refresh=refresh) is not None
+        cache._executor.shutdown(wait=True)
+
+        refresh.assert_called_once()
+        assert len(cache) == 1
+
+
+def test_refresh_runs_in_callers_context(df):
+    var = contextvars.ContextVar("var", default="global")
+    seen = []
+
+    with freezegun.freeze_time("2026-01-01 00:00:00") as frozen_datetime:
+        cache = memory_cache.MemoryCache(ttl_seconds=10, stale_while_revalidate=True)
+        cache.put("key", df, query_job=_make_query_job())
+        frozen_datetime.tick(datetime.timedelta(seconds=11))
+
+        token = var.set("caller")
+        try:
+            cache.get("key", refresh=lambda: seen.append(var.get()))
+        finally:
+            var.reset(token)
+        cache._executor.shutdown(wait=True)
+
+    assert seen == ["caller"]
+
+
+def test_put_evicts_least_recently_used(df):
+    cache = memory_cache.MemoryCache(max_entries=2)
+    cache.put("first", df, query_job=_make_query_job())
+    cache.put("second", df, query_job=_make_query_job())
+    assert cache.get("first") is not None
+
+    cache.put("third", df, query_job=_make_query_job())
+
+    assert cache.get("first") is not None
+    assert cache.get("second") is None
+    assert cache.get("third") is not None
+
+
+def test_put_evicts_by_size(df):
+    entry_bytes = int(df.memory_usage(index=True, deep=True).sum())
+    cache = memory_cache.MemoryCache(max_bytes=entry_bytes * 2)
+    cache.put("first", df, query_job=_make_query_job())
+    cache.put("second", df, query_job=_make_query_job())
+    cache.put("third", df, query_job=_make_query_job())
+
+    assert len(cache) == 2
+    assert cache.get("first") is None
+
+
+def test_put_larger_than_max_bytes_skipped(df):
+    cache = memory_cache.MemoryCache(max_bytes=1)
+    cache.put("key", df, query_job=_make_query_job())
+    assert len(cache) == 0
+
+
+def test_clear(df):
+    cache = memory_cache.MemoryCache()
+    cache.put("key", df, query_job=_make_query_job())
+    cache.clear()
+    assert cache.get("key") is None
@@ -0,0 +1,94 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import datetime
+
+import freezegun
+import google.api_core.exceptions
+import google.cloud.bigquery
+import pytest
+
+import pandas_gbq.core.metadata_cache as metadata_cache
+
+
+@pytest.fixture
+def bqclient(mock_bigquery_client):
+    mock_bigquery_client.get_table.side_effect = (
+        lambda table: google.cloud.bigquery.Table(table)
+    )
+    mock_bigquery_client.get_dataset.side_effect = (
+        lambda dataset: google.cloud.bigquery.Dataset(dataset)
+    )
+    return mock_bigquery_client
+
+
+def test_get_table_caches_until_ttl(bqclient):
+    with freezegun.freeze_time("2026-01-01 00:00:00") as frozen_datetime:
+        cache = metadata_cache.MetadataCache(ttl_seconds=10)
+        cache.get_table(bqclient, "my-project.my_dataset.my_table")
+        frozen_datetime.tick(datetime.timedelta(seconds=9))
+        table = cache.get_table(bqclient, "my-project.my_dataset.my_table")
+        assert bqclient.get_table.call_count == 1
+        assert table.table_id == "my_table"
+
+        frozen_datetime.tick(datetime.timedelta(seconds=1))
+        cache.get_table(bqclient, "my-project.my_dataset.my_table")
+        assert bqclient.get_table.call_count == 2
+
+
+def test_get_table_returns_copy(bqclient):
+    cache = metadata_cache.MetadataCache()
+    table = cache.get_table(bqclient, "my-project.my_dataset.my_table")
+    table.description = "modified"
+
+    table = cache.get_table(bqclient, "my-project.my_dataset.my_table")
+    assert table.description is None
+
+
+def test_get_table_caches_not_found(bqclient):
+    bqclient.get_table.side_effect = google.api_core.exceptions.NotFound("nope")
+    cache = metadata_cache.MetadataCache()
+
+    for _ in range(2):
+        with pytest.raises(google.api_core.exceptions.NotFound):
+            cache.get_table(bqclient, "my-project.my_dataset.my_table")
+
+    assert bqclient.get_table.call_count == 1
+
+
+def test_invalidate_table(bqclient):
+    cache = metadata_cache.MetadataCache(ttl_seconds=None)
+    cache.get_table(bqclient, "my-project.my_dataset.my_table")
+    cache.invalidate_table(
+        google.cloud.bigquery.TableReference.from_string(
+            "my-project.my_dataset.my_table"
+        )
+    )
+    cache.get_table(bqclient, "my-project.my_dataset.my_table")
+    assert bqclient.get_table.call_count == 2
+
+
+def test_get_dataset_and_invalidate(bqclient):
+    cache = metadata_cache.MetadataCache()
+    cache.get_dataset(bqclient, "my-project.my_dataset")
+    cache.get_dataset(bqclient, "my-project.my_dataset")
+    assert bqclient.get_dataset.call_count == 1
+
+    cache.invalidate_dataset("my-project.my_dataset")
+    cache.get_dataset(bqclient, "my-project.my_dataset")
+    assert bqclient.get_dataset.call_count == 2
+
+
+def test_evicts_least_recently_used(bqclient):
+    cache = metadata_cache.MetadataCache(max_entries=2)
+    cache.get_table(bqclient, "p.d.first")
+    cache.get_table(bqclient, "p.d.second")
+    cache.get_table(bqclient, "p.d.first")
+    cache.get_table(bqclient, "p.d.third")
+    assert len(cache) == 2
+
+    cache.get_table(bqclient, "p.d.first")
+    assert bqclient.get_table.call_count == 3
+    cache.get_table(bqclient, "p.d.second")
+    assert bqclient.get_table.call_count == 4
@@ -0,0 +1,98 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import datetime
+import decimal
+
+import google.cloud.bigquery
+import numpy as np
+import pandas
+import pytest
+
+from pandas_gbq.core import query_parameters
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (True, "BOOL"),
+        (1, "INT64"),
+        (1.5, "FLOAT64"),
+        (decimal.Decimal("1.5"), "NUMERIC"),
+        ("a", "STRING"),
+        (b"a", "BYTES"),
+        (datetime.date(2026, 1, 1), "DATE"),
+        (datetime.datetime(2026, 1, 1), "DATETIME"),
+        (datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc), "TIMESTAMP"),
+        (datetime.time(12, 30), "TIME"),
+        (np.bool_(True), "BOOL"),
+        (np.int64(3), "INT64"),
+        (pandas.Series([1, 2]).unique()[0], "INT64"),
+        (np.float32(1.5), "FLOAT64"),
+        (np.str_("a"), "STRING"),
+        (np.datetime64("2026-01-01T12:00:00.000000001"), "DATETIME"),
+        (pandas.Timestamp("2026-01-01"), "DATETIME"),
+        (pandas.Timestamp("2026-01-01", tz="UTC"), "TIMESTAMP"),
+        (object(), None),
+    ],
+)
+def test_parameter_type(value, expected):
+    assert query_parameters.parameter_type(value) == expected
+
+
+def test_to_api_repr_from_dict():
+    parameters = query_parameters.to_api_repr(
+        {
+            "x": 1,
+            "names": ("a", "b"),
+            "d": google.cloud.bigquery.ScalarQueryParameter("d", "DATE", None),
+        }
+    )
+
+    assert parameters == [
+        google.cloud.bigquery.ScalarQueryParameter("x", "INT64", 1).to_api_repr(),
+        google.cloud.bigquery.ArrayQueryParameter(
+            "names", "STRING", ["a", "b"]
+        ).to_api_repr(),
+        google.cloud.bigquery.ScalarQueryParameter("d", "DATE", None).to_api_repr(),
+    ]
+
+
+def test_to_api_repr_with_numpy_values():
+    ids = pandas.Series([1, 2, 2]).unique()
+    parameters = query_parameters.to_api_repr(
+        {
+            "ids": ids,
+            "id_list": list(ids),
+            "x": np.int64(3),
+            "ts": pandas.Timestamp("2026-01-01", tz="UTC"),
+        }
+    )
+
+    assert parameters == [
+        google.cloud.bigquery.ArrayQueryParameter("ids", "INT64", [1, 2]).to_api_repr(),
+        google.cloud.bigquery.ArrayQueryParameter(
+            "id_list", "INT64", [1, 2]
+        ).to_api_repr(),
+        google.cloud.bigquery.ScalarQueryParameter("x", "INT64", 3).to_api_repr(),
+        google.cloud.bigquery.ScalarQueryParameter(
+            "ts",
+            "TIMESTAMP",
+            datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc),
+        ).to_api_repr(),
+    ]
+
+
+def test_to_api_repr_from_list():
+    parameter = google.cloud.bigquery.ArrayQueryParameter("ids", "INT64", [1, 2])
+
+    assert query_parameters.to_api_repr([parameter]) == [parameter.to_api_repr()]
+
+
+@pytest.mark.parametrize(
+    "value", [None, object(), [], [1, "a"]], ids=["none", "object", "empty", "mixed"]
+)
+def test_to_api_repr_with_uninferrable_value_raises(value):
+    with pytest.raises(ValueError, match="'x'"):
+        query_parameters.to_api_repr({"x": value})
@@ -0,0 +1,192 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import datetime
+import os
+from unittest import mock
+
+import db_dtypes  # noqa
+import google.api_core.exceptions
+import google.cloud.bigquery
+import pandas
+import pandas.testing
+import pytest
+
+import pandas_gbq.core.result_cache as result_cache
+
+QUERY_CREATED = datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+def _make_query_job(
+    statement_type="SELECT",
+    referenced_tables=("my-project.ds.tbl",),
+    query="SELECT * FROM ds.tbl",
+):
+    query_job = mock.create_autospec(google.cloud.bigquery.QueryJob, instance=True)
+    query_job.query = query
+    query_job.statement_type = statement_type
+    query_job.referenced_tables = [
+        google.cloud.bigquery.TableReference.from_string(table_id)
+        for table_id in referenced_tables
+    ]
+    query_job.created = QUERY_CREATED
+    return query_job
+
+
+@pytest.fixture
+def bqclient(mock_bigquery_client):
+    return _set_modified(
+        mock_bigquery_client, QUERY_CREATED - datetime.timedelta(days=1)
+    )
+
+
+def _set_modified(bqclient, modified):
+    def get_table(table_id):
+        table = google.cloud.bigquery.Table(table_id)
+        table._properties["type"] = "TABLE"
+        table._properties["lastModifiedTime"] = str(int(modified.timestamp() * 1000))
+        return table
+
+    bqclient.get_table.side_effect = get_table
+    return bqclient
+
+
+@pytest.fixture
+def df():
+    return pandas.DataFrame(
+        {
+            "int_col": pandas.Series([1, None, 3], dtype="Int64"),
+            "bool_col": pandas.Series([True, None, False], dtype="boolean"),
+            "date_col": pandas.Series(
+                [datetime.date(2026, 1, 1), None, datetime.date(2026, 1, 3)],
+                dtype="dbdate",
+            ),
+            "str_col": ["a", "b", None],
+        }
+    )
+
+
+def test_make_key_ignores_surrounding_whitespace():
+    kwargs = dict(dialect="standard", location="US", project_id="my-project")
+    assert result_cache.make_key("SELECT 1", **kwargs) == result_cache.make_key(
+        "\n  SELECT 1  \n", **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    ("changed_kwargs"),
+    [
+        {"dialect": "legacy"},
+        {"location": "EU"},
+        {"project_id": "other-project"},
+        {"configuration": {"query": {"queryParameters": [{"name": "x"}]}}},
+        {"max_results": 10},
+        {"dtypes": {"int_col": "float64"}},
+    ],
+)
+def test_make_key_depends_on_options(changed_kwargs):
+    kwargs = dict(dialect="standard", location="US", project_id="my-project")
+    original = result_cache.make_key("SELECT 1", **kwargs)
+    kwargs.update(changed_kwargs)
+    assert result_cache.make_key("SELECT 1", **kwargs) != original
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_put_then_get_roundtrips_dtypes(tmp_path, df, file_format, bqclient):
+    cache = result_cache.ResultCache(tmp_path, file_format=file_format)
+    cache.put("some-key", df, query_job=_make_query_job())
+
+    result = cache.get("some-key", bqclient=bqclient)
+
+    pandas.testing.assert_frame_equal(result, df)
+
+
+def test_get_missing_returns_none(tmp_path, bqclient):
+    cache = result_cache.ResultCache(tmp_path)
+    assert cache.get("missing", bqclient=bqclient) is None
+
+
+def test_get_with_modified_table_invalidates(tmp_path, df, bqclient):
+    cache = result_cache.ResultCache(tmp_path)
+    cache.put("some-key", df, query_job=_make_query_job())
+
+    _set_modified(bqclient, QUERY_CREATED + datetime.timedelta(seconds=1))
+    assert cache.get("some-key", bqclient=bqclient) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_get_with_deleted_table_invalidates(tmp_path, df, bqclient):
+    cache = result_cache.ResultCache(tmp_path)
+    cache.put("some-key", df, query_job=_make_query_job())
+
+    bqclient.get_table.side_effect = google.api_core.exceptions.NotFound("gone")
+    assert cache.get("some-key", bqclient=bqclient) is None
+
+
+@pytest.mark.parametrize(
+    ("query_job",),
+    [
+        (None,),
+        (_make_query_job(statement_type="INSERT"),),
+        (_make_query_job(referenced_tables=()),),
+        (_make_query_job(query="SELECT *, CURRENT_TIMESTAMP() AS ts FROM ds.tbl"),),
+        (_make_query_job(query="SELECT * FROM ds.tbl WHERE rand() < 0.1"),),
+        (_make_query_job(query="SELECT GENERATE_UUID() AS id, * FROM ds.tbl"),),
+        (_make_query_job(query="SELECT * FROM ds.tbl WHERE d = current_date"),),
+    ],
+)
+def test_put_skips_ineligible_queries(tmp_path, df, query_job):
+    cache = result_cache.ResultCache(tmp_path)
+    cache.put("some-key", df, query_job=query_job)
+    assert not tmp_path.exists() or list(tmp_path.iterdir()) == []
+
+
+def test_put_evicts_least_recently_used(tmp_path, df, bqclient):
+    cache = result_cache.ResultCache(tmp_path)
+    cache.put("first", df, query_job=_make_query_job())
+    entry_size = cache._data_path("first").stat().st_size
+    os.utime(cache._data_path("first"), (1, 1))
+    cache.put("second", df, query_job=_make_query_job())
+    os.utime(cache._data_path("second"), (2, 2))
+
+    # Reading "first" marks it as recently used.
+    assert cache.get("first", bqclient=bqclient) is not None
+
+    cache.max_bytes = entry_size * 2
+    cache.put("third", df, query_job=_make_query_job())
+
+    assert cache._data_path("first").exists()
+    assert not cache._data_path("second").exists()
+    assert not cache._metadata_path("second").exists()
+    assert cache._data_path("third").exists()
+
+
+def test_clear_removes_all_entries(tmp_path, df):
+    cache = result_cache.ResultCache(tmp_path)
+    cache.put("first", df, query_job=_make_query_job())
+    cache.put("second", df, query_job=_make_query_job())
+
+    cache.clear()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_invalid_file_format_raises(tmp_path):
+    with pytest.raises(ValueError, match="file_format"):
+        result_cache.ResultCache(tmp_path, file_format="csv")
+
+
+def test_get_query_job_fetches_job_by_id(bqclient):
+    rows_iter = mock.create_autospec(
+        google.cloud.bigquery.table.RowIterator, instance=True
+    )
+    rows_iter.job = None
+    rows_iter.job_id = "some-job"
+    rows_iter.location = "EU"
+
+    result_cache.get_query_job(bqclient, rows_iter, project_id="my-project")
+
+    bqclient.get_job.assert_called_once_with(
+        "some-job", project="my-project", location="EU"
+    )
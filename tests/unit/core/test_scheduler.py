@@ -0,0 +1,178 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import threading
+import time
+
+import pytest
+
+import pandas_gbq
+from pandas_gbq.core import scheduler
+
+
+def _wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def _start_thread(job_scheduler, order, name, project_id="my-project", **kwargs):
+    def run():
+        with job_scheduler.slot(project_id, **kwargs):
+            order.append(name)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_job_scheduler_limits_concurrent_jobs_per_project():
+    job_scheduler = scheduler.JobScheduler(max_concurrent_jobs_per_project=1)
+    order = []
+    ticket = job_scheduler.acquire("my-project")
+
+    thread = _start_thread(job_scheduler, order, "second")
+    _wait_until(lambda: job_scheduler.waiting == 1)
+    assert order == []
+
+    job_scheduler.release(ticket)
+    thread.join(5)
+    assert order == ["second"]
+
+
+def test_job_scheduler_limits_concurrent_jobs_per_table():
+    job_scheduler = scheduler.JobScheduler(max_concurrent_jobs_per_table=1)
+    ticket = job_scheduler.acquire("my-project", table_id="p.d.t1")
+
+    # Jobs writing to other tables, or to no table, aren't limited.
+    job_scheduler.release(job_scheduler.acquire("my-project", table_id="p.d.t2"))
+    job_scheduler.release(job_scheduler.acquire("my-project"))
+
+    with pytest.raises(TimeoutError):
+        job_scheduler.acquire("my-project", table_id="p.d.t1", timeout=0.01)
+    assert job_scheduler.waiting == 0
+
+    job_scheduler.release(ticket)
+    job_scheduler.release(job_scheduler.acquire("my-project", table_id="p.d.t1"))
+
+
+def test_job_scheduler_starts_higher_priority_first():
+    job_scheduler = scheduler.JobScheduler(max_concurrent_jobs_per_project=1)
+    order = []
+    ticket = job_scheduler.acquire("my-project")
+
+    low = _start_thread(job_scheduler, order, "low", priority=0)
+    _wait_until(lambda: job_scheduler.waiting == 1)
+    high = _start_thread(job_scheduler, order, "high", priority=5)
+    _wait_until(lambda: job_scheduler.waiting == 2)
+
+    job_scheduler.release(ticket)
+    low.join(5)
+    high.join(5)
+    assert order == ["high", "low"]
+
+
+def test_job_scheduler_priority_context_manager():
+    job_scheduler = scheduler.JobScheduler()
+
+    with pandas_gbq.JobScheduler.priority(3):
+        ticket = job_scheduler.acquire("my-project")
+    job_scheduler.release(ticket)
+
+    assert ticket.priority == 3
+    assert job_scheduler.acquire("my-project").priority == 0
+
+
+def test_job_scheduler_other_projects_skip_blocked_jobs():
+    job_scheduler = scheduler.JobScheduler(max_concurrent_jobs_per_project=1)
+    order = []
+    ticket = job_scheduler.acquire("busy-project")
+
+    blocked = _start_thread(job_scheduler, order, "blocked", "busy-project", priority=5)
+    _wait_until(lambda: job_scheduler.waiting == 1)
+    other = _start_thread(job_scheduler, order, "other", "other-project")
+    other.join(5)
+    assert order == ["other"]
+
+    job_scheduler.release(ticket)
+    blocked.join(5)
+    assert order == ["other", "blocked"]
+
+
+def test_job_scheduler_other_tables_skip_table_limited_jobs():
+    job_scheduler = scheduler.JobScheduler(max_concurrent_jobs_per_table=1)
+    order = []
+    ticket = job_scheduler.acquire("my-project", table_id="p.d.t1")
+
+    blocked = _start_thread(
+        job_scheduler, order, "blocked", table_id="p.d.t1", priority=5
+    )
+    _wait_until(lambda: job_scheduler.waiting == 1)
+    # Only the table is busy, so jobs for other tables in the project can start.
+    other = _start_thread(job_scheduler, order, "other", table_id="p.d.t2")
+    other.join(5)
+    assert order == ["other"]
+
+    job_scheduler.release(ticket)
+    blocked.join(5)
+    assert order == ["other", "blocked"]
+
+
+def test_job_scheduler_limits_job_rate():
+    job_scheduler = scheduler.JobScheduler(jobs_per_second=20, job_burst=2)
+
+    start = time.monotonic()
+    for _ in range(4):
+        job_scheduler.release(job_scheduler.acquire("my-project"))
+    elapsed = time.monotonic() - start
+
+    # The first two jobs use the burst, the others wait 1/20 s each.
+    assert elapsed >= 0.09
+
+
+def test_job_scheduler_limits_table_update_rate():
+    job_scheduler = scheduler.JobScheduler(table_updates_per_second=1)
+    job_scheduler.release(job_scheduler.acquire("my-project", table_id="p.d.t"))
+
+    with pytest.raises(TimeoutError):
+        job_scheduler.acquire("my-project", table_id="p.d.t", timeout=0.05)
+    job_scheduler.release(job_scheduler.acquire("my-project", table_id="p.d.u"))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_concurrent_jobs_per_project": 0},
+        {"jobs_per_second": -1},
+        {"table_update_burst": 0.5},
+    ],
+)
+def test_job_scheduler_with_invalid_limits_raises(kwargs):
+    with pytest.raises(ValueError):
+        scheduler.JobScheduler(**kwargs)
+
+
+def test_job_slot_without_scheduler_does_nothing():
+    with scheduler.job_slot("my-project", table_id="p.d.t"):
+        pass
+
+
+def test_read_gbq_waits_for_context_scheduler(mock_bigquery_client):
+    job_scheduler = scheduler.JobScheduler(max_concurrent_jobs_per_project=1)
+    pandas_gbq.context.job_scheduler = job_scheduler
+    ticket = job_scheduler.acquire("my-project")
+    thread = threading.Thread(
+        target=pandas_gbq.read_gbq,
+        args=("SELECT 1",),
+        kwargs={"project_id": "my-project"},
+    )
+    thread.start()
+
+    _wait_until(lambda: job_scheduler.waiting == 1)
+    mock_bigquery_client.query.assert_not_called()
+
+    job_scheduler.release(ticket)
+    thread.join(5)
+    mock_bigquery_client.query.assert_called_once()
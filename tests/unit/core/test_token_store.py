@@ -0,0 +1,158 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import concurrent.futures
+import datetime
+import json
+import os
+import sys
+from unittest import mock
+
+import google.auth.credentials
+import pytest
+
+from pandas_gbq.core import token_store
+
+NOW = datetime.datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def fixed_now(monkeypatch):
+    monkeypatch.setattr(token_store, "_utcnow", lambda: NOW)
+
+
+def _make_credentials(token="token-1"):
+    credentials = mock.create_autospec(
+        google.auth.credentials.Credentials, instance=True
+    )
+    credentials.token = None
+    credentials.expiry = None
+    credentials.quota_project_id = None
+    credentials.universe_domain = "googleapis.com"
+    credentials.service_account_email = "sa@example.com"
+
+    def refresh(request):
+        credentials.token = token
+        credentials.expiry = NOW + datetime.timedelta(hours=1)
+
+    credentials.refresh.side_effect = refresh
+    return credentials
+
+
+def test_refresh_stores_token(tmp_path):
+    store = token_store.FileTokenStore(tmp_path / "tokens.json")
+    underlying = _make_credentials()
+    credentials = store.wrap(underlying, key="my-key")
+
+    credentials.refresh(mock.sentinel.request)
+
+    underlying.refresh.assert_called_once_with(mock.sentinel.request)
+    assert credentials.token == "token-1"
+    assert credentials.expiry == NOW + datetime.timedelta(hours=1)
+    with open(tmp_path / "tokens.json") as token_file:
+        assert json.load(token_file) == {
+            "my-key": {"token": "token-1", "expiry": "2026-01-01T13:00:00"}
+        }
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file permissions")
+def test_token_file_is_private(tmp_path):
+    store = token_store.FileTokenStore(tmp_path / "tokens.json")
+    store.wrap(_make_credentials()).refresh(mock.sentinel.request)
+
+    assert os.stat(tmp_path / "tokens.json").st_mode & 0o077 == 0
+
+
+def test_refresh_reuses_token_from_other_process(tmp_path):
+    # Separate store objects share nothing but the file, like two processes.
+    first = token_store.FileTokenStore(tmp_path / "tokens.json").wrap(
+        _make_credentials("token-1")
+    )
+    second_underlying = _make_credentials("token-2")
+    second = token_store.FileTokenStore(tmp_path / "tokens.json").wrap(
+        second_underlying
+    )
+
+    first.refresh(mock.sentinel.request)
+    second.refresh(mock.sentinel.request)
+
+    second_underlying.refresh.assert_not_called()
+    assert second.token == "token-1"
+    assert second.expiry == first.expiry
+
+
+def test_refresh_ignores_token_close_to_expiry(tmp_path, monkeypatch):
+    path = tmp_path / "tokens.json"
+    token_store.FileTokenStore(path).wrap(_make_credentials("token-1")).refresh(
+        mock.sentinel.request
+    )
+    later = NOW + datetime.timedelta(minutes=58)
+    monkeypatch.setattr(token_store, "_utcnow", lambda: later)
+    underlying = _make_credentials("token-2")
+    credentials = token_store.FileTokenStore(path, min_remaining_seconds=300).wrap(
+        underlying
+    )
+
+    credentials.refresh(mock.sentinel.request)
+
+    underlying.refresh.assert_called_once()
+    assert credentials.token == "token-2"
+
+
+def test_refresh_with_different_keys_does_not_share(tmp_path):
+    store = token_store.FileTokenStore(tmp_path / "tokens.json")
+    store.wrap(_make_credentials("token-1"), key="a").refresh(mock.sentinel.request)
+    underlying = _make_credentials("token-2")
+    credentials = store.wrap(underlying, key="b")
+
+    credentials.refresh(mock.sentinel.request)
+
+    underlying.refresh.assert_called_once()
+    assert credentials.token == "token-2"
+
+
+def test_refresh_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text("not json")
+    credentials = token_store.FileTokenStore(path).wrap(_make_credentials())
+
+    credentials.refresh(mock.sentinel.request)
+
+    assert credentials.token == "token-1"
+
+
+def test_concurrent_refreshes_refresh_once(tmp_path):
+    underlying = [_make_credentials(f"token-{i}") for i in range(8)]
+    wrapped = [
+        token_store.FileTokenStore(tmp_path / "tokens.json").wrap(
+            credentials, key="shared"
+        )
+        for credentials in underlying
+    ]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda creds: creds.refresh(mock.sentinel.request), wrapped))
+
+    assert sum(creds.refresh.call_count for creds in underlying) == 1
+    assert len({creds.token for creds in wrapped}) == 1
+
+
+def test_wrap_exposes_wrapped_attributes(tmp_path):
+    store = token_store.FileTokenStore(tmp_path / "tokens.json")
+    underlying = _make_credentials()
+    credentials = store.wrap(underlying)
+
+    assert isinstance(credentials, google.auth.credentials.Credentials)
+    assert credentials.wrapped is underlying
+    assert credentials.service_account_email == "sa@example.com"
+    assert store.wrap(credentials) is credentials
+
+
+def test_clear_removes_tokens(tmp_path):
+    store = token_store.FileTokenStore(tmp_path / "tokens.json")
+    store.wrap(_make_credentials()).refresh(mock.sentinel.request)
+
+    store.clear()
+
+    assert not (tmp_path / "tokens.json").exists()
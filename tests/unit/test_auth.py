@@ -65,3 +65,27 @@ def test_get_credentials_cache_w_reauth():
 
     cache = auth.get_credentials_cache(True)
     assert isinstance(cache, pydata_google_auth.cache.WriteOnlyCredentialsCache)
+
+
+def test_get_credentials_with_token_store_wraps_credentials(monkeypatch, tmp_path):
+    import google.auth.credentials
+    import pydata_google_auth
+
+    from pandas_gbq.core import token_store
+
+    mock_user_credentials = mock.create_autospec(
+        google.auth.credentials.Credentials, instance=True
+    )
+    mock_user_credentials.token = None
+    mock_user_credentials.expiry = None
+    monkeypatch.setattr(
+        pydata_google_auth,
+        "default",
+        lambda scopes, **kwargs: (mock_user_credentials, "test-project"),
+    )
+    store = token_store.FileTokenStore(tmp_path / "tokens.json")
+
+    credentials, _ = auth.get_credentials(token_store=store)
+
+    assert isinstance(credentials, token_store.SharedTokenCredentials)
+    assert credentials.wrapped is mock_user_credentials
@@ -0,0 +1,124 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from unittest import mock
+
+import google.cloud.bigquery
+import pandas
+import pytest
+
+import pandas_gbq
+
+SESSION_PROPERTIES = [{"key": "session_id", "value": "my-session"}]
+
+
+@pytest.fixture
+def start_job(mock_bigquery_client):
+    start_job = mock.create_autospec(google.cloud.bigquery.QueryJob, instance=True)
+    start_job.session_info.session_id = "my-session"
+    start_job.location = "EU"
+    mock_bigquery_client.query.return_value = start_job
+    return start_job
+
+
+@pytest.fixture
+def mock_rows(start_job):
+    mock_rows = mock.create_autospec(
+        google.cloud.bigquery.table.RowIterator, instance=True
+    )
+    mock_rows.total_rows = 1
+    mock_rows.schema = [google.cloud.bigquery.SchemaField("total", "INTEGER")]
+    mock_rows.to_dataframe.return_value = pandas.DataFrame({"total": [3]})
+    # Queries in the session get the same mock job as the one starting it.
+    start_job.result.return_value = mock_rows
+    return mock_rows
+
+
+def test_read_gbq_runs_queries_in_session(mock_bigquery_client, start_job, mock_rows):
+    session = pandas_gbq.BigQuerySession()
+
+    for _ in range(2):
+        pandas_gbq.read_gbq(
+            "SELECT COUNT(*) AS total FROM _SESSION.orders",
+            project_id="my-project",
+            session=session,
+        )
+
+    # The session only started once, in the location of the first query.
+    start_call, *query_calls = mock_bigquery_client.query.call_args_list
+    assert start_call.args == ("SELECT 1",)
+    assert start_call.kwargs["job_config"].create_session is True
+    assert session.session_id == "my-session"
+    assert session.location == "EU"
+
+    # Both queries ran, rather than reusing the first result.
+    assert len(query_calls) == 2
+    kwargs = query_calls[-1].kwargs
+    assert not kwargs["job_config"].create_session
+    assert kwargs["location"] == "EU"
+    job_config = kwargs["job_config"]
+    assert job_config.to_api_repr()["query"]["connectionProperties"] == (
+        SESSION_PROPERTIES
+    )
+
+
+def test_read_gbq_reads_session_table_with_query(
+    mock_bigquery_client, start_job, mock_rows
+):
+    configuration = {"query": {"useQueryCache": False}}
+    session = pandas_gbq.BigQuerySession(location="EU")
+
+    df = pandas_gbq.read_gbq(
+        "_SESSION.totals",
+        project_id="my-project",
+        configuration=configuration,
+        session=session,
+    )
+
+    assert df["total"].tolist() == [3]
+    mock_bigquery_client.list_rows.assert_not_called()
+    (query,), _ = mock_bigquery_client.query.call_args
+    assert query == "SELECT * FROM _SESSION.totals"
+    # The caller's configuration is left as it was.
+    assert configuration == {"query": {"useQueryCache": False}}
+
+
+def test_to_gbq_loads_session_table(mock_bigquery_client, start_job):
+    with pandas_gbq.BigQuerySession() as session:
+        pandas_gbq.to_gbq(
+            pandas.DataFrame({"amount": [1.5]}),
+            "_SESSION.orders",
+            project_id="my-project",
+            session=session,
+        )
+
+    # Temporary tables can't be looked up, so the load job creates it.
+    mock_bigquery_client.get_table.assert_not_called()
+    mock_bigquery_client.create_table.assert_not_called()
+    _, kwargs = mock_bigquery_client.load_table_from_dataframe.call_args
+    assert kwargs["location"] == "EU"
+    (connection_property,) = kwargs["job_config"].connection_properties
+    assert connection_property.key == "session_id"
+    assert connection_property.value == "my-session"
+
+
+def test_close_aborts_session(mock_bigquery_client, start_job):
+    session = pandas_gbq.BigQuerySession()
+    # Closing a session that never started doesn't run any jobs.
+    session.close()
+    mock_bigquery_client.query.assert_not_called()
+
+    pandas_gbq.to_gbq(
+        pandas.DataFrame({"amount": [1.5]}),
+        "_SESSION.orders",
+        project_id="my-project",
+        session=session,
+    )
+    session.close()
+
+    (query,), kwargs = mock_bigquery_client.query.call_args
+    assert query == "CALL BQ.ABORT_SESSION()"
+    assert kwargs["location"] == "EU"
+    assert kwargs["job_config"].connection_properties[0].value == "my-session"
+    assert session.session_id is None
@@ -103,12 +103,12 @@ def test_read_gbq_should_use_dialect_with_query_and_wait(
     pandas_gbq.context.dialect = "legacy"
     pandas_gbq.read_gbq("SELECT 1")
 
-    _, kwargs = mock_bigquery_client.query_and_wait.call_args
+    _, kwargs = mock_bigquery_client.query.call_args
     assert kwargs["job_config"].use_legacy_sql
 
     pandas_gbq.context.dialect = "standard"
     pandas_gbq.read_gbq("SELECT 1")
 
-    _, kwargs = mock_bigquery_client.query_and_wait.call_args
+    _, kwargs = mock_bigquery_client.query.call_args
     assert not kwargs["job_config"].use_legacy_sql
     pandas_gbq.context.dialect = None  # Reset the global state.
@@ -2,13 +2,19 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
+import datetime
 from unittest import mock
 
+import google.api_core.exceptions
 from google.cloud import bigquery
 import pandas
 import pandas.testing
+import pytest
 
+import pandas_gbq
 from pandas_gbq import dry_runs
+import pandas_gbq.contexts
+import pandas_gbq.exceptions
 
 
 def test_get_query_stats():
@@ -149,3 +155,118 @@ def test_get_query_stats_missing_bytes_use_zero():
     assert isinstance(result, pandas.Series)
     pandas.testing.assert_index_equal(expected_index, result.index)
     assert result["totalBytesProcessed"] == 0
+
+
+def _make_dry_run_job(query, total_bytes_processed, referenced_tables=()):
+    created = datetime.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc)
+    query_job = mock.create_autospec(bigquery.QueryJob, instance=True)
+    query_job._properties = {
+        "configuration": {"query": {"query": query}, "jobType": "QUERY"},
+        "statistics": {
+            "creationTime": created.timestamp() * 1000,
+            "query": {
+                "totalBytesProcessed": str(total_bytes_processed),
+                "statementType": "SELECT",
+            },
+        },
+    }
+    query_job.created = created
+    query_job.statement_type = "SELECT"
+    query_job.referenced_tables = [
+        bigquery.TableReference.from_string(table_id) for table_id in referenced_tables
+    ]
+    query_job.result.return_value.job = query_job
+    return query_job
+
+
+@pytest.fixture
+def dry_run_jobs(mock_bigquery_client):
+    jobs = {
+        "SELECT a FROM ds.t": _make_dry_run_job(
+            "SELECT a FROM ds.t", 100, ["my-project.ds.t"]
+        ),
+        "SELECT b FROM ds.t": _make_dry_run_job(
+            "SELECT b FROM ds.t", 200, ["my-project.ds.t"]
+        ),
+    }
+
+    def query(sql, **kwargs):
+        if sql not in jobs:
+            raise google.api_core.exceptions.BadRequest("Syntax error")
+        return jobs[sql]
+
+    def get_table(table_id, **kwargs):
+        table = bigquery.Table(table_id)
+        table._properties["lastModifiedTime"] = "0"
+        return table
+
+    mock_bigquery_client.query.side_effect = query
+    mock_bigquery_client.get_table.side_effect = get_table
+    return jobs
+
+
+def test_dry_run_many_returns_results_in_order(mock_bigquery_client, dry_run_jobs):
+    results = pandas_gbq.dry_run_many(
+        ["SELECT b FROM ds.t", "SELECT a FROM ds.t"], project_id="my-project"
+    )
+
+    assert [result["totalBytesProcessed"] for result in results] == [200, 100]
+    assert mock_bigquery_client.query.call_count == 2
+    for _, kwargs in mock_bigquery_client.query.call_args_list:
+        assert kwargs["job_config"].dry_run is True
+
+
+def test_dry_run_many_raises_first_error(dry_run_jobs):
+    with pytest.raises(pandas_gbq.exceptions.GenericGBQException):
+        pandas_gbq.dry_run_many(
+            ["SELECT a FROM ds.t", "SELECT syntax error"], project_id="my-project"
+        )
+
+
+def test_dry_run_many_return_exceptions(dry_run_jobs):
+    results = pandas_gbq.dry_run_many(
+        ["SELECT syntax error", "SELECT a FROM ds.t"],
+        project_id="my-project",
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], pandas_gbq.exceptions.GenericGBQException)
+    assert results[1]["totalBytesProcessed"] == 100
+
+
+def test_dry_run_many_empty():
+    assert pandas_gbq.dry_run_many([]) == []
+
+
+def test_dry_run_many_with_cache_skips_unchanged_queries(
+    mock_bigquery_client, dry_run_jobs
+):
+    pandas_gbq.context.dry_run_cache = pandas_gbq.DryRunCache()
+    queries = ["SELECT a FROM ds.t", "SELECT b FROM ds.t"]
+
+    first = pandas_gbq.dry_run_many(queries, project_id="my-project")
+    second = pandas_gbq.dry_run_many(queries, project_id="my-project")
+
+    assert mock_bigquery_client.query.call_count == 2
+    for first_result, second_result in zip(first, second):
+        pandas.testing.assert_series_equal(first_result, second_result)
+
+
+def test_dry_run_many_uses_current_context(monkeypatch, mock_bigquery_client):
+    from pandas_gbq.gbq_connector import GbqConnector
+
+    seen = []
+
+    def run_query(self, query, **kwargs):
+        seen.append(pandas_gbq.contexts.get_context())
+        return pandas.Series({"totalBytesProcessed": 0})
+
+    monkeypatch.setattr(GbqConnector, "run_query", run_query)
+    context = pandas_gbq.contexts.Context()
+
+    with pandas_gbq.contexts.use_context(context):
+        pandas_gbq.dry_run_many(
+            ["SELECT a FROM ds.t", "SELECT b FROM ds.t"], project_id="my-project"
+        )
+
+    assert seen == [context, context]
@@ -326,6 +326,30 @@ def test_to_gbq_w_default_project(mock_bigquery_client):
     assert table.project == "default-project"
 
 
+def test_to_gbq_looks_up_table_once(mock_bigquery_client):
+    import google.api_core.exceptions
+
+    mock_bigquery_client.get_table.side_effect = google.api_core.exceptions.NotFound(
+        "my_table"
+    )
+    gbq.to_gbq(DataFrame({"x": [1]}), "my_dataset.my_table")
+
+    mock_bigquery_client.get_table.assert_called_once()
+    mock_bigquery_client.get_dataset.assert_called_once()
+
+
+def test_to_gbq_with_metadata_cache_invalidates_after_load(mock_bigquery_client):
+    import pandas_gbq
+
+    pandas_gbq.context.metadata_cache = pandas_gbq.MetadataCache()
+    gbq.to_gbq(DataFrame({"x": [1]}), "my_dataset.my_table", if_exists="append")
+    gbq.to_gbq(DataFrame({"x": [1]}), "my_dataset.my_table", if_exists="append")
+
+    # Loading data changes the table, so the second call can't use the cached
+    # metadata.
+    assert mock_bigquery_client.get_table.call_count == 2
+
+
 def test_to_gbq_w_project_table(mock_bigquery_client):
     """If a project is included in the table ID, use that instead of the client
     project. See: https://github.com/pydata/pandas-gbq/issues/321
@@ -510,7 +534,9 @@ def test_read_gbq_with_inferred_project_id_with_query_and_wait(
 
     df = gbq.read_gbq("SELECT 1", dialect="standard")
     assert df is not None
-    mock_bigquery_client.query_and_wait.assert_called_once()
+    # The job is created first, so it can be cancelled if waiting stops early.
+    mock_bigquery_client.query.assert_called_once()
+    mock_bigquery_client.query_and_wait.assert_not_called()
 
 
 def test_read_gbq_with_inferred_project_id_from_service_account_credentials_with_query(
@@ -558,14 +584,13 @@ def test_read_gbq_with_inferred_project_id_from_service_account_credentials_with
         credentials=mock_service_account_credentials,
     )
     assert df is not None
-    mock_bigquery_client.query_and_wait.assert_called_once_with(
+    mock_bigquery_client.query.assert_called_once_with(
         "SELECT 1",
         job_config=mock.ANY,
         location=None,
         project="service_account_project_id",
-        max_results=None,
-        wait_timeout=None,
     )
+    mock_bigquery_client.query_and_wait.assert_not_called()
 
 
 def test_read_gbq_without_inferred_project_id_from_compute_engine_credentials(
@@ -596,7 +621,7 @@ def test_read_gbq_with_max_results_ten_query(monkeypatch, mock_query_job):
 
 
 def test_read_gbq_with_max_results_ten_query_and_wait(
-    monkeypatch, mock_bigquery_client
+    monkeypatch, mock_bigquery_client, mock_query_job
 ):
     if not hasattr(mock_bigquery_client, "query_and_wait"):
         pytest.skip(
@@ -610,14 +635,8 @@ def test_read_gbq_with_max_results_ten_query_and_wait(
     )
     df = gbq.read_gbq("SELECT 1", dialect="standard", max_results=10)
     assert df is not None
-    mock_bigquery_client.query_and_wait.assert_called_with(
-        "SELECT 1",
-        job_config=mock.ANY,
-        location=mock.ANY,
-        project=mock.ANY,
-        max_results=10,
-        wait_timeout=None,
-    )
+    mock_query_job.result.assert_called_with(max_results=10)
+    mock_bigquery_client.query_and_wait.assert_not_called()
 
 
 @pytest.mark.parametrize(["verbose"], [(True,), (False,)])
@@ -827,9 +846,45 @@ def test_read_gbq_passes_dtypes(mock_service_account_credentials, mock_row_itera
 
 
 def test_read_gbq_use_bqstorage_api(
+    monkeypatch,
+    mock_service_account_credentials,
+    mock_row_iterator,
+):
+    bigquery_storage = pytest.importorskip("google.cloud.bigquery_storage")
+    mock_read_client_class = mock.create_autospec(bigquery_storage.BigQueryReadClient)
+    monkeypatch.setattr(bigquery_storage, "BigQueryReadClient", mock_read_client_class)
+    mock_service_account_credentials.project_id = "service_account_project_id"
+
+    for _ in range(2):
+        df = gbq.read_gbq(
+            "SELECT 1 AS int_col",
+            dialect="standard",
+            credentials=mock_service_account_credentials,
+            use_bqstorage_api=True,
+        )
+        assert df is not None
+
+    # The BigQuery Storage client is reused across calls.
+    mock_read_client_class.assert_called_once()
+    mock_row_iterator.to_dataframe.assert_called_with(
+        bqstorage_client=mock_read_client_class.return_value,
+        dtypes=mock.ANY,
+        progress_bar_type=mock.ANY,
+    )
+
+
+def test_read_gbq_use_bqstorage_api_without_package(
+    monkeypatch,
     mock_service_account_credentials,
     mock_row_iterator,
 ):
+    import sys
+
+    import google.cloud
+
+    # Importing a module set to None raises ImportError.
+    monkeypatch.setitem(sys.modules, "google.cloud.bigquery_storage", None)
+    monkeypatch.delattr(google.cloud, "bigquery_storage", raising=False)
     mock_service_account_credentials.project_id = "service_account_project_id"
     df = gbq.read_gbq(
         "SELECT 1 AS int_col",
@@ -846,6 +901,18 @@ def test_read_gbq_use_bqstorage_api(
     )
 
 
+def test_read_gbq_reuses_bigquery_client(
+    mock_bigquery_client, mock_service_account_credentials
+):
+    mock_service_account_credentials.project_id = "service_account_project_id"
+    for _ in range(2):
+        gbq.read_gbq(
+            "SELECT 1 AS int_col", credentials=mock_service_account_credentials
+        )
+
+    mock_bigquery_client.assert_called_once()
+
+
 def test_read_gbq_calls_tqdm(mock_service_account_credentials, mock_row_iterator):
     mock_service_account_credentials.project_id = "service_account_project_id"
     df = gbq.read_gbq(
@@ -978,3 +1045,332 @@ def test_read_gbq_with_dry_run(mock_bigquery_client, mock_query_job):
         job_config = kwargs["job_config"]
     assert job_config.dry_run is True
     assert dry_run_result["totalBytesProcessed"] == total_bytes_processed
+
+
+def test_read_gbq_with_result_cache_skips_query_on_hit(
+    tmp_path, mock_bigquery_client, mock_query_job, mock_row_iterator
+):
+    import pandas_gbq
+
+    created = datetime.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc)
+    mock_query_job.query = "SELECT * FROM ds.tbl"
+    mock_query_job.statement_type = "SELECT"
+    mock_query_job.referenced_tables = [
+        google.cloud.bigquery.TableReference.from_string("my-project.ds.tbl")
+    ]
+    mock_query_job.created = created
+    mock_row_iterator.to_dataframe.return_value = DataFrame({"_f0": [1]})
+
+    def get_table(table_ref_or_id, **kwargs):
+        table = google.cloud.bigquery.Table(table_ref_or_id)
+        table._properties["lastModifiedTime"] = str(
+            int((created - datetime.timedelta(days=1)).timestamp() * 1000)
+        )
+        return table
+
+    mock_bigquery_client.get_table.side_effect = get_table
+    pandas_gbq.context.result_cache = pandas_gbq.ResultCache(tmp_path)
+
+    first = gbq.read_gbq("SELECT * FROM ds.tbl", project_id="my-project")
+    mock_bigquery_client.query.reset_mock()
+    mock_bigquery_client.query_and_wait.reset_mock()
+    second = gbq.read_gbq("SELECT * FROM ds.tbl", project_id="my-project")
+
+    mock_bigquery_client.query.assert_not_called()
+    mock_bigquery_client.query_and_wait.assert_not_called()
+    pandas.testing.assert_frame_equal(first, second)
+
+
+def test_read_gbq_with_result_cache_skips_dry_run(mock_query_job):
+    import pandas_gbq
+
+    type(mock_query_job)._properties = mock.PropertyMock(return_value={})
+
+    pandas_gbq.context.result_cache = mock.create_autospec(
+        pandas_gbq.ResultCache, instance=True
+    )
+    gbq.read_gbq("SELECT 1", project_id="my-project", dry_run=True)
+    pandas_gbq.context.result_cache.get.assert_not_called()
+    pandas_gbq.context.result_cache.put.assert_not_called()
+
+
+def test_read_gbq_with_memory_cache_returns_independent_copies(
+    mock_bigquery_client, mock_query_job, mock_row_iterator
+):
+    import pandas_gbq
+
+    mock_query_job.statement_type = "SELECT"
+    mock_row_iterator.to_dataframe.return_value = DataFrame({"_f0": [1]})
+    pandas_gbq.context.result_cache = pandas_gbq.MemoryCache(ttl_seconds=60)
+
+    first = gbq.read_gbq("SELECT 1", project_id="my-project", index_col="_f0")
+    mock_bigquery_client.query.reset_mock()
+    mock_bigquery_client.query_and_wait.reset_mock()
+    second = gbq.read_gbq("SELECT 1", project_id="my-project")
+
+    mock_bigquery_client.query.assert_not_called()
+    mock_bigquery_client.query_and_wait.assert_not_called()
+    assert list(first.columns) == []
+    assert list(second.columns) == ["_f0"]
+
+
+def test_run_query_with_coalesce_requests_uses_shared_coalescer(
+    monkeypatch, mock_query_job
+):
+    import pandas_gbq
+    import pandas_gbq.core.coalesce
+
+    mock_run = mock.Mock(side_effect=lambda key, fn, **kwargs: fn())
+    monkeypatch.setattr(pandas_gbq.core.coalesce, "run", mock_run)
+    pandas_gbq.context.coalesce_requests = True
+
+    connector = _make_connector()
+    connector.run_query("SELECT 1")
+    connector.download_table("my-project.my_dataset.my_table")
+
+    assert mock_run.call_count == 2
+    query_key = mock_run.call_args_list[0][0][0]
+    table_key = mock_run.call_args_list[1][0][0]
+    assert query_key[0] == "query"
+    assert table_key[0] == "table"
+
+
+def test_run_query_with_destination_not_coalesced(monkeypatch):
+    import pandas_gbq
+    import pandas_gbq.core.coalesce
+
+    mock_run = mock.Mock()
+    monkeypatch.setattr(pandas_gbq.core.coalesce, "run", mock_run)
+    pandas_gbq.context.coalesce_requests = True
+
+    connector = _make_connector()
+    connector.run_query(
+        "SELECT 1",
+        configuration={
+            "query": {
+                "destinationTable": {
+                    "projectId": "p",
+                    "datasetId": "d",
+                    "tableId": "t",
+                }
+            }
+        },
+    )
+
+    mock_run.assert_not_called()
+
+
+def test_run_query_in_session_from_configuration_not_shared(monkeypatch):
+    import pandas_gbq
+    import pandas_gbq.core.coalesce
+    from pandas_gbq.bigquery_session import _session_config
+
+    mock_run = mock.Mock()
+    monkeypatch.setattr(pandas_gbq.core.coalesce, "run", mock_run)
+    result_cache = mock.create_autospec(pandas_gbq.MemoryCache, instance=True)
+    pandas_gbq.context.result_cache = result_cache
+    pandas_gbq.context.coalesce_requests = True
+
+    connector = _make_connector()
+    connector.run_query(
+        "SELECT * FROM _SESSION.keys", configuration=_session_config("my-session")
+    )
+
+    mock_run.assert_not_called()
+    result_cache.get.assert_not_called()
+    result_cache.put.assert_not_called()
+
+
+def _query_job_config(mock_bigquery_client):
+    if mock_bigquery_client.query_and_wait.called:
+        _, kwargs = mock_bigquery_client.query_and_wait.call_args
+    else:
+        _, kwargs = mock_bigquery_client.query.call_args
+    return kwargs["job_config"]
+
+
+def test_read_gbq_with_query_parameters_dict(mock_bigquery_client):
+    configuration = {"query": {"useQueryCache": False}}
+
+    gbq.read_gbq(
+        "SELECT @x, @ids",
+        project_id="my-project",
+        configuration=configuration,
+        query_parameters={"x": 1, "ids": ["a", "b"]},
+    )
+
+    job_config = _query_job_config(mock_bigquery_client)
+    assert job_config.query_parameters == [
+        google.cloud.bigquery.ScalarQueryParameter("x", "INT64", 1),
+        google.cloud.bigquery.ArrayQueryParameter("ids", "STRING", ["a", "b"]),
+    ]
+    assert job_config.use_query_cache is False
+    # The caller's configuration isn't modified.
+    assert configuration == {"query": {"useQueryCache": False}}
+
+
+def test_read_gbq_with_query_parameters_list(mock_bigquery_client):
+    parameter = google.cloud.bigquery.ScalarQueryParameter("d", "DATE", None)
+
+    gbq.read_gbq("SELECT @d", project_id="my-project", query_parameters=[parameter])
+
+    assert _query_job_config(mock_bigquery_client).query_parameters == [parameter]
+
+
+@pytest.mark.parametrize(
+    ("query_or_table", "dialect"),
+    [("my_dataset.my_table", "standard"), ("SELECT @x", "legacy")],
+)
+def test_read_gbq_with_query_parameters_invalid_raises(query_or_table, dialect):
+    with pytest.raises(ValueError, match="query_parameters"):
+        gbq.read_gbq(
+            query_or_table,
+            project_id="my-project",
+            dialect=dialect,
+            query_parameters={"x": 1},
+        )
+
+
+def test_read_gbq_with_job_id_downloads_existing_job(
+    mock_bigquery_client, mock_query_job
+):
+    mock_bigquery_client.get_job.return_value = mock_query_job
+
+    df = gbq.read_gbq(job_id="some-random-id", project_id="my-project", location="EU")
+
+    assert df is not None
+    mock_bigquery_client.get_job.assert_called_once_with(
+        "some-random-id", project="my-project", location="EU"
+    )
+    # The query isn't submitted again.
+    mock_bigquery_client.query.assert_not_called()
+    mock_bigquery_client.query_and_wait.assert_not_called()
+    mock_query_job.result.assert_called_once_with(max_results=None)
+
+
+def test_read_gbq_with_job_id_interrupted_doesnt_cancel_job(
+    mock_bigquery_client, mock_query_job
+):
+    mock_query_job.done.side_effect = KeyboardInterrupt()
+    mock_bigquery_client.get_job.return_value = mock_query_job
+
+    with pytest.raises(KeyboardInterrupt):
+        gbq.read_gbq(job_id="some-random-id", project_id="my-project")
+
+    # The job may belong to someone else, so it's left running.
+    mock_bigquery_client.cancel_job.assert_not_called()
+    mock_query_job.cancel.assert_not_called()
+
+
+def test_read_gbq_with_job_id_of_load_job_raises(mock_bigquery_client):
+    load_job = mock.create_autospec(google.cloud.bigquery.LoadJob, instance=True)
+    load_job.job_type = "load"
+    mock_bigquery_client.get_job.return_value = load_job
+
+    with pytest.raises(ValueError, match="not a query"):
+        gbq.read_gbq(job_id="some-load-job", project_id="my-project")
+
+
+@pytest.mark.parametrize(
+    ("query_or_table", "kwargs", "match"),
+    [
+        ("SELECT 1", {"job_id": "my-job"}, "not both"),
+        (None, {"job_id": "my-job", "dry_run": True}, "dry_run"),
+        (None, {"job_id": "my-job", "query_parameters": {"x": 1}}, "dry_run"),
+        (None, {}, "required"),
+    ],
+)
+def test_read_gbq_with_invalid_job_id_arguments_raises(query_or_table, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        gbq.read_gbq(query_or_table, project_id="my-project", **kwargs)
+
+
+def _set_dry_run_bytes(mock_query_job, total_bytes_processed):
+    type(mock_query_job)._properties = mock.PropertyMock(
+        return_value={
+            "statistics": {"query": {"totalBytesProcessed": f"{total_bytes_processed}"}}
+        }
+    )
+
+
+def test_read_gbq_with_max_bytes_billed_sets_job_config(
+    mock_bigquery_client, mock_query_job
+):
+    _set_dry_run_bytes(mock_query_job, 100)
+
+    gbq.read_gbq("SELECT 1", project_id="my-project", max_bytes_billed=1000)
+
+    job_config = _query_job_config(mock_bigquery_client)
+    assert job_config.dry_run is not True
+    assert job_config.maximum_bytes_billed == 1000
+
+
+def test_read_gbq_with_max_bytes_billed_rejects_query_over_budget(
+    mock_bigquery_client, mock_query_job
+):
+    import pandas_gbq
+
+    _set_dry_run_bytes(mock_query_job, 10_000)
+    pandas_gbq.context.max_bytes_billed = 1000
+
+    with pytest.raises(
+        pandas_gbq.exceptions.BytesBilledLimitExceeded, match="10000 bytes"
+    ):
+        gbq.read_gbq("SELECT * FROM big_table", project_id="my-project")
+
+    # Only the dry run was sent.
+    assert _query_job_config(mock_bigquery_client).dry_run is True
+
+
+def test_read_gbq_with_max_bytes_billed_keeps_configured_limit(
+    mock_bigquery_client, mock_query_job
+):
+    _set_dry_run_bytes(mock_query_job, 100)
+    configuration = {"query": {"maximumBytesBilled": "500"}}
+
+    gbq.read_gbq(
+        "SELECT 1",
+        project_id="my-project",
+        configuration=configuration,
+        max_bytes_billed=1000,
+    )
+
+    assert _query_job_config(mock_bigquery_client).maximum_bytes_billed == 500
+
+
+def test_read_gbq_with_max_bytes_billed_cache_hit_skips_dry_run(
+    mock_bigquery_client, mock_query_job, mock_row_iterator
+):
+    import pandas_gbq
+
+    _set_dry_run_bytes(mock_query_job, 100)
+    mock_query_job.statement_type = "SELECT"
+    mock_row_iterator.to_dataframe.return_value = DataFrame({"_f0": [1]})
+    pandas_gbq.context.result_cache = pandas_gbq.MemoryCache(ttl_seconds=60)
+    pandas_gbq.context.max_bytes_billed = 1000
+
+    gbq.read_gbq("SELECT 1", project_id="my-project")
+    dry_run_call, query_call = mock_bigquery_client.query.call_args_list
+    assert dry_run_call.kwargs["job_config"].dry_run is True
+    assert not query_call.kwargs["job_config"].dry_run
+    mock_bigquery_client.query.reset_mock()
+    mock_bigquery_client.query_and_wait.reset_mock()
+    gbq.read_gbq("SELECT 1", project_id="my-project")
+
+    # Cached results don't need a dry run, nor any other API request.
+    mock_bigquery_client.query.assert_not_called()
+    mock_bigquery_client.query_and_wait.assert_not_called()
+
+
+def test_read_gbq_without_query_with_max_bytes_billed_raises():
+    import pandas_gbq
+
+    pandas_gbq.context.max_bytes_billed = 1000
+
+    with pytest.raises(ValueError, match="required"):
+        gbq.read_gbq(project_id="my-project")
+
+
+def test_read_gbq_with_invalid_max_bytes_billed_raises():
+    with pytest.raises(ValueError, match="max_bytes_billed"):
+        gbq.read_gbq("SELECT 1", project_id="my-project", max_bytes_billed=0)
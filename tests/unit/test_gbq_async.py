@@ -0,0 +1,222 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import asyncio
+import threading
+from unittest import mock
+
+import google.api_core.exceptions
+import google.cloud.bigquery
+import pandas
+import pandas.testing
+import pytest
+
+import pandas_gbq
+import pandas_gbq.exceptions
+import pandas_gbq.gbq
+import pandas_gbq.gbq_async
+import pandas_gbq.query
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(pandas_gbq.query, "_INITIAL_POLL_SECONDS", 0.001)
+    monkeypatch.setattr(pandas_gbq.query, "_MAX_POLL_SECONDS", 0.001)
+
+
+@pytest.fixture
+def mock_query_job(mock_bigquery_client):
+    mock_job = mock.create_autospec(google.cloud.bigquery.QueryJob)
+    mock_job.job_id = "some-job-id"
+    mock_job.location = "US"
+    mock_job.state = "RUNNING"
+    mock_job.done.side_effect = [False, False, True]
+
+    mock_rows = mock.create_autospec(google.cloud.bigquery.table.RowIterator)
+    mock_rows.total_rows = 1
+    mock_rows.schema = [google.cloud.bigquery.SchemaField("x", "INTEGER")]
+    mock_rows.to_dataframe.return_value = pandas.DataFrame(
+        {"x": pandas.Series([1], dtype="Int64")}
+    )
+    mock_job.result.return_value = mock_rows
+
+    mock_bigquery_client.query.return_value = mock_job
+    return mock_job
+
+
+@pytest.mark.asyncio
+async def test_read_gbq_async_polls_until_done(mock_bigquery_client, mock_query_job):
+    df = await pandas_gbq.read_gbq_async("SELECT 1 AS x", project_id="my-project")
+
+    assert mock_query_job.done.call_count == 3
+    query, kwargs = mock_bigquery_client.query.call_args
+    assert query == ("SELECT 1 AS x",)
+    assert kwargs["project"] == "my-project"
+    pandas.testing.assert_frame_equal(
+        df, pandas.DataFrame({"x": pandas.Series([1], dtype="Int64")})
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_gbq_async_converts_results_off_event_loop(mock_query_job):
+    loop_thread = threading.get_ident()
+    threads = []
+    mock_rows = mock_query_job.result.return_value
+    to_dataframe = mock_rows.to_dataframe.return_value
+
+    def record_thread(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return to_dataframe
+
+    mock_rows.to_dataframe.side_effect = record_thread
+
+    await pandas_gbq.read_gbq_async("SELECT 1 AS x", project_id="my-project")
+
+    assert threads
+    assert loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_read_gbq_async_sets_index(mock_query_job):
+    df = await pandas_gbq.read_gbq_async(
+        "SELECT 1 AS x", project_id="my-project", index_col="x"
+    )
+
+    assert df.index.name == "x"
+
+
+@pytest.mark.asyncio
+async def test_read_gbq_async_timeout_cancels_job(
+    monkeypatch, mock_bigquery_client, mock_query_job
+):
+    mock_query_job.done.side_effect = None
+    mock_query_job.done.return_value = False
+    monkeypatch.setattr(
+        pandas_gbq.gbq_connector.GbqConnector, "get_elapsed_seconds", lambda self: 1.0
+    )
+
+    with pytest.raises(pandas_gbq.exceptions.QueryTimeout):
+        await pandas_gbq.read_gbq_async(
+            "SELECT 1 AS x",
+            project_id="my-project",
+            configuration={"query": {"timeoutMs": 500}},
+        )
+
+    mock_bigquery_client.cancel_job.assert_called_once_with(
+        "some-job-id", location="US"
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_gbq_async_cancellation_cancels_job(
+    mock_bigquery_client, mock_query_job
+):
+    mock_query_job.done.side_effect = None
+    mock_query_job.done.return_value = False
+
+    task = asyncio.ensure_future(
+        pandas_gbq.read_gbq_async("SELECT 1 AS x", project_id="my-project")
+    )
+    while not mock_query_job.done.called:
+        await asyncio.sleep(0.001)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    mock_bigquery_client.cancel_job.assert_called_once_with(
+        "some-job-id", location="US"
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_gbq_async_cancellation_while_inserting_cancels_job(
+    mock_bigquery_client, mock_query_job
+):
+    inserting = threading.Event()
+    release_insert = threading.Event()
+
+    def query(*args, **kwargs):
+        inserting.set()
+        release_insert.wait(timeout=5)
+        return mock_query_job
+
+    mock_bigquery_client.query.side_effect = query
+    task = asyncio.ensure_future(
+        pandas_gbq.read_gbq_async("SELECT 1 AS x", project_id="my-project")
+    )
+    while not inserting.is_set():
+        await asyncio.sleep(0.001)
+    task.cancel()
+    await asyncio.sleep(0.01)
+    release_insert.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    mock_query_job.done.assert_not_called()
+    mock_bigquery_client.cancel_job.assert_called_once_with(
+        "some-job-id", location="US"
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_gbq_async_translates_polling_errors(mock_query_job):
+    mock_query_job.done.side_effect = google.api_core.exceptions.InternalServerError(
+        "boom"
+    )
+
+    with pytest.raises(pandas_gbq.exceptions.GenericGBQException, match="boom"):
+        await pandas_gbq.read_gbq_async("SELECT 1 AS x", project_id="my-project")
+
+
+@pytest.mark.asyncio
+async def test_read_gbq_async_with_dry_run_uses_run_query(monkeypatch):
+    stats = pandas.Series({"totalBytesProcessed": 10})
+    run_query = mock.Mock(return_value=stats)
+    monkeypatch.setattr(pandas_gbq.gbq_connector.GbqConnector, "run_query", run_query)
+
+    result = await pandas_gbq.read_gbq_async(
+        "SELECT 1 AS x", project_id="my-project", dry_run=True
+    )
+
+    assert result is stats
+    assert run_query.call_args.kwargs["dry_run"] is True
+
+
+@pytest.mark.asyncio
+async def test_to_gbq_async_calls_to_gbq(monkeypatch):
+    to_gbq = mock.Mock()
+    monkeypatch.setattr(pandas_gbq.gbq, "to_gbq", to_gbq)
+    df = pandas.DataFrame({"x": [1]})
+
+    await pandas_gbq.to_gbq_async(df, "my_dataset.my_table", project_id="my-project")
+
+    to_gbq.assert_called_once_with(df, "my_dataset.my_table", project_id="my-project")
+
+
+@pytest.mark.asyncio
+async def test_to_gbq_async_cancellation_cancels_load_jobs(monkeypatch):
+    load_job = mock.create_autospec(google.cloud.bigquery.LoadJob)
+    load_job.state = "RUNNING"
+    started = threading.Event()
+    release = threading.Event()
+
+    def to_gbq(*args, **kwargs):
+        pandas_gbq.core.job_tracker.track(load_job)
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(pandas_gbq.gbq, "to_gbq", to_gbq)
+    task = asyncio.ensure_future(
+        pandas_gbq.to_gbq_async(pandas.DataFrame({"x": [1]}), "my_dataset.my_table")
+    )
+    while not started.is_set():
+        await asyncio.sleep(0.001)
+    task.cancel()
+
+    try:
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        load_job.cancel.assert_called_once_with()
+    finally:
+        release.set()
@@ -0,0 +1,35 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import subprocess
+import sys
+
+import pytest
+
+import pandas_gbq
+
+
+def test_import_defers_heavy_dependencies():
+    script = (
+        "import sys\n"
+        "import pandas_gbq\n"
+        "heavy = ['google.cloud.bigquery', 'pandas', 'psutil', 'pydata_google_auth']\n"
+        "print(','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.strip() == ""
+
+
+@pytest.mark.parametrize("name", pandas_gbq.__all__)
+def test_public_attributes_available(name):
+    assert getattr(pandas_gbq, name) is not None
+    assert name in dir(pandas_gbq)
+
+
+def test_getattr_missing_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no_such_attribute"):
+        pandas_gbq.no_such_attribute
@@ -0,0 +1,139 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from unittest import mock
+
+import google.api_core.exceptions
+import google.cloud.bigquery
+import pandas
+import pandas.testing
+import pytest
+
+import pandas_gbq
+import pandas_gbq.exceptions
+from pandas_gbq.gbq_connector import GbqConnector
+
+LOCAL_DF = pandas.DataFrame(
+    {"id": [1, 2, 2, None], "label": ["one", "two", "two again", "none"]}
+)
+REMOTE_DF = pandas.DataFrame({"id": [1, 2], "value": [10.0, 20.0]})
+
+
+@pytest.fixture
+def run_query(monkeypatch):
+    run_query = mock.Mock(return_value=REMOTE_DF)
+    monkeypatch.setattr(GbqConnector, "run_query", run_query)
+    return run_query
+
+
+@pytest.fixture
+def load_job(mock_bigquery_client):
+    load_job = mock.create_autospec(google.cloud.bigquery.LoadJob, instance=True)
+    load_job.session_info.session_id = "my-session"
+    load_job.location = "EU"
+    mock_bigquery_client.load_table_from_dataframe.return_value = load_job
+    return load_job
+
+
+def test_read_gbq_join_semi_uploads_distinct_keys(
+    mock_bigquery_client, load_job, run_query
+):
+    df = pandas_gbq.read_gbq_join(
+        LOCAL_DF, "my_dataset.my_table", on="id", location="EU"
+    )
+
+    pandas.testing.assert_frame_equal(df, REMOTE_DF)
+    args, kwargs = mock_bigquery_client.load_table_from_dataframe.call_args
+    keys, destination = args
+    assert keys["id"].tolist() == [1, 2]
+    assert list(keys.columns) == ["id"]
+    assert destination.startswith("_SESSION.")
+    assert kwargs["job_config"].create_session is True
+
+    (query,), kwargs = run_query.call_args
+    assert query.startswith("SELECT t.* FROM `my_dataset.my_table` AS t WHERE EXISTS")
+    assert f"FROM {destination} AS k WHERE t.`id` = k.`id`" in query
+    assert kwargs["configuration"] == {
+        "query": {
+            "connectionProperties": [{"key": "session_id", "value": "my-session"}]
+        }
+    }
+
+
+def test_read_gbq_join_inner_merges_local_rows(load_job, run_query):
+    df = pandas_gbq.read_gbq_join(
+        LOCAL_DF, "SELECT * FROM t", on=["id"], how="inner", columns=["value"]
+    )
+
+    (query,), _ = run_query.call_args
+    assert query.startswith("SELECT t.`value`, t.`id` FROM (SELECT * FROM t) AS t")
+    assert df["label"].tolist() == ["one", "two", "two again"]
+    assert df["value"].tolist() == [10.0, 20.0, 20.0]
+
+
+def test_read_gbq_join_aborts_session(mock_bigquery_client, load_job, run_query):
+    run_query.side_effect = ValueError("query failed")
+
+    with pytest.raises(ValueError, match="query failed"):
+        pandas_gbq.read_gbq_join(LOCAL_DF, "SELECT * FROM t", on="id")
+
+    (query,), kwargs = mock_bigquery_client.query.call_args
+    assert query == "CALL BQ.ABORT_SESSION()"
+    assert kwargs["location"] == "EU"
+    assert kwargs["job_config"].connection_properties[0].value == "my-session"
+
+
+def test_read_gbq_join_failed_load_aborts_session(
+    mock_bigquery_client, load_job, run_query
+):
+    load_job.result.side_effect = google.api_core.exceptions.BadRequest("bad keys")
+
+    with pytest.raises(pandas_gbq.exceptions.GenericGBQException, match="bad keys"):
+        pandas_gbq.read_gbq_join(LOCAL_DF, "SELECT * FROM t", on="id")
+
+    run_query.assert_not_called()
+    (query,), kwargs = mock_bigquery_client.query.call_args
+    assert query == "CALL BQ.ABORT_SESSION()"
+    assert kwargs["location"] == "EU"
+
+
+def test_read_gbq_join_missing_table_raises(mock_bigquery_client, run_query):
+    mock_bigquery_client.get_table.side_effect = google.api_core.exceptions.NotFound(
+        "my_table"
+    )
+
+    with pytest.raises(pandas_gbq.exceptions.GenericGBQException, match="my_table"):
+        pandas_gbq.read_gbq_join(LOCAL_DF, "my_dataset.my_table", on="id")
+
+
+def test_read_gbq_join_looks_up_table_location(mock_bigquery_client, run_query):
+    table = google.cloud.bigquery.Table("my-project.my_dataset.my_table")
+    table._properties["location"] = "asia-northeast1"
+    mock_bigquery_client.get_table.return_value = table
+
+    pandas_gbq.read_gbq_join(
+        LOCAL_DF.iloc[3:], "my-project.my_dataset.my_table", on="id"
+    )
+
+    mock_bigquery_client.get_table.assert_called_once_with(
+        "my-project.my_dataset.my_table"
+    )
+    # Without keys, nothing is uploaded.
+    mock_bigquery_client.load_table_from_dataframe.assert_not_called()
+    (query,), kwargs = run_query.call_args
+    assert query.endswith("WHERE FALSE")
+    assert kwargs["configuration"] is None
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"on": "id", "how": "left"}, "how"),
+        ({"on": []}, "at least one"),
+        ({"on": "missing"}, "missing"),
+    ],
+)
+def test_read_gbq_join_invalid_arguments_raise(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        pandas_gbq.read_gbq_join(LOCAL_DF, "my_dataset.my_table", **kwargs)
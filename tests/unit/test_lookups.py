@@ -0,0 +1,238 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import datetime
+import threading
+import time
+from unittest import mock
+
+import google.cloud.bigquery
+import pandas
+import pandas.testing
+import pytest
+
+import pandas_gbq
+import pandas_gbq.exceptions
+from pandas_gbq import lookups
+from pandas_gbq.core import job_tracker
+
+TABLE = pandas.DataFrame(
+    {
+        "id": [1, 2, 2, 3, 4],
+        "name": ["a", "b", "b2", "c", "d"],
+    }
+)
+
+
+class FakeConnector:
+    def __init__(self, *args, **kwargs):
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def run_query(self, query, configuration=None, **kwargs):
+        (parameter,) = configuration["query"]["queryParameters"]
+        keys = [
+            int(value["value"]) for value in parameter["parameterValue"]["arrayValues"]
+        ]
+        with self._lock:
+            self.queries.append((query, parameter, keys))
+        return TABLE[TABLE["id"].isin(keys)].reset_index(drop=True)
+
+
+@pytest.fixture
+def connector(monkeypatch):
+    fake = FakeConnector()
+    monkeypatch.setattr(lookups, "GbqConnector", lambda *args, **kwargs: fake)
+    return fake
+
+
+def _sorted(df):
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+def test_read_gbq_by_keys_sends_keys_as_parameter(connector):
+    df = pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", [1, 2])
+
+    (query, parameter, keys) = connector.queries[0]
+    assert query == "SELECT * FROM `my_dataset.my_table` WHERE `id` IN UNNEST(@keys)"
+    assert parameter["name"] == "keys"
+    assert parameter["parameterType"] == {
+        "type": "ARRAY",
+        "arrayType": {"type": "INT64"},
+    }
+    assert keys == [1, 2]
+    assert len(df.index) == 3
+
+
+def test_read_gbq_by_keys_with_numpy_keys(connector):
+    df = pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", TABLE["id"].unique())
+
+    (_, parameter, _) = connector.queries[0]
+    assert parameter["parameterType"]["arrayType"] == {"type": "INT64"}
+    assert parameter["parameterValue"]["arrayValues"] == [
+        {"value": "1"},
+        {"value": "2"},
+        {"value": "3"},
+        {"value": "4"},
+    ]
+    assert len(df.index) == 5
+
+
+def test_read_gbq_by_keys_splits_batches(connector):
+    df = pandas_gbq.read_gbq_by_keys(
+        "my_dataset.my_table", "id", [1, 2, 3, 4, 5], batch_size=2
+    )
+
+    assert sorted(keys for _, _, keys in connector.queries) == [[1, 2], [3, 4], [5]]
+    pandas.testing.assert_frame_equal(_sorted(df), _sorted(TABLE))
+
+
+def test_read_gbq_by_keys_error_cancels_running_batches(connector):
+    job = mock.create_autospec(google.cloud.bigquery.QueryJob, instance=True)
+    job.state = "RUNNING"
+    job_started = threading.Event()
+
+    def run_query(query, configuration=None, **kwargs):
+        (parameter,) = configuration["query"]["queryParameters"]
+        if parameter["parameterValue"]["arrayValues"][0]["value"] == "1":
+            assert job_started.wait(timeout=5)
+            raise ValueError("first batch failed")
+
+        job_tracker.track(job)
+        job_started.set()
+        deadline = time.monotonic() + 5
+        while not job_tracker.cancelled():
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        raise pandas_gbq.exceptions.QueryCancelled("cancelled")
+
+    connector.run_query = run_query
+    outer = job_tracker.JobTracker()
+
+    with job_tracker.tracking(outer):
+        with pytest.raises(ValueError, match="first batch failed"):
+            pandas_gbq.read_gbq_by_keys(
+                "my_dataset.my_table", "id", [1, 2, 3, 4], batch_size=2
+            )
+
+    job.cancel.assert_called_once_with()
+    # The caller's tracker sees jobs started in the worker threads.
+    assert outer.jobs == [job]
+    assert not outer.cancelled
+
+
+def test_read_gbq_by_keys_ignores_duplicate_and_null_keys(connector):
+    pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", [1, None, 1, 3])
+
+    assert [keys for _, _, keys in connector.queries] == [[1, 3]]
+
+
+def test_read_gbq_by_keys_selects_key_column(connector):
+    df = pandas_gbq.read_gbq_by_keys(
+        "my_dataset.my_table", "id", [1], columns=["name"], key_type="INT64"
+    )
+
+    (query, _, _) = connector.queries[0]
+    assert query.startswith("SELECT `name`, `id` FROM")
+    assert list(df.columns) == ["name"]
+
+
+def test_read_gbq_by_keys_with_cache_only_queries_new_keys(connector):
+    pandas_gbq.context.key_cache = pandas_gbq.KeyCache()
+
+    pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", [1, 2, 9])
+    df = pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", [2, 3, 9])
+
+    assert [keys for _, _, keys in connector.queries] == [[1, 2, 9], [3]]
+    pandas.testing.assert_frame_equal(
+        _sorted(df), _sorted(TABLE[TABLE["id"].isin([2, 3])])
+    )
+
+
+def test_read_gbq_by_keys_with_cache_string_keys_for_int_column(connector):
+    pandas_gbq.context.key_cache = pandas_gbq.KeyCache()
+
+    first = pandas_gbq.read_gbq_by_keys(
+        "my_dataset.my_table", "id", ["1", "9"], key_type="INT64"
+    )
+    second = pandas_gbq.read_gbq_by_keys(
+        "my_dataset.my_table", "id", ["1"], key_type="INT64"
+    )
+
+    # "1" wasn't cached as having no rows, so it's queried again.
+    assert [keys for _, _, keys in connector.queries] == [[1, 9], [1]]
+    assert first["name"].tolist() == ["a"]
+    assert second["name"].tolist() == ["a"]
+
+
+def test_read_gbq_by_keys_with_cache_naive_datetime_keys_for_utc_column(connector):
+    pandas_gbq.context.key_cache = pandas_gbq.KeyCache()
+    timestamp = pandas.Timestamp("2026-01-01", tz="UTC")
+    calls = []
+
+    def run_query(query, configuration=None, **kwargs):
+        calls.append(query)
+        return pandas.DataFrame({"ts": [timestamp], "value": [1]})
+
+    connector.run_query = run_query
+    key = datetime.datetime(2026, 1, 1)
+
+    for _ in range(2):
+        df = pandas_gbq.read_gbq_by_keys(
+            "my_dataset.my_table", "ts", [key], key_type="TIMESTAMP"
+        )
+        assert df["value"].tolist() == [1]
+    assert len(calls) == 2
+
+
+def test_read_gbq_by_keys_with_cache_all_cached_skips_queries(connector):
+    pandas_gbq.context.key_cache = pandas_gbq.KeyCache()
+
+    pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", [1, 9])
+    df = pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", [9])
+
+    assert len(connector.queries) == 1
+    assert list(df.columns) == ["id", "name"]
+    assert len(df.index) == 0
+
+
+def test_read_gbq_by_keys_with_cache_separates_columns(connector):
+    pandas_gbq.context.key_cache = pandas_gbq.KeyCache()
+
+    pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", [1])
+    pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", [1], columns=["id"])
+
+    assert len(connector.queries) == 2
+
+
+def test_read_gbq_by_keys_without_keys_does_not_query(connector):
+    df = pandas_gbq.read_gbq_by_keys("my_dataset.my_table", "id", [])
+
+    assert connector.queries == []
+    assert len(df.index) == 0
+
+
+@pytest.mark.parametrize(
+    ("keys", "expected"),
+    [
+        ([1, 2], "INT64"),
+        (["a"], "STRING"),
+        ([b"a"], "BYTES"),
+        ([1.5], "FLOAT64"),
+        ([True], "BOOL"),
+        ([datetime.date(2026, 1, 1)], "DATE"),
+        ([datetime.datetime(2026, 1, 1)], "DATETIME"),
+        (
+            [datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)],
+            "TIMESTAMP",
+        ),
+    ],
+)
+def test_infer_key_type(keys, expected):
+    assert lookups._infer_key_type(keys) == expected
+
+
+def test_infer_key_type_with_mixed_types_raises():
+    with pytest.raises(ValueError, match="key_type"):
+        lookups._infer_key_type([1, "a"])
@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import concurrent.futures
 import datetime
 from unittest import mock
 
@@ -33,9 +32,7 @@ def test_query_and_wait_via_client_library_apierror_raises_genericgbqexception(
 
     connector = _make_connector()
     connector.client = mock_bigquery_client
-    mock_bigquery_client.query_and_wait.side_effect = (
-        google.api_core.exceptions.GoogleAPIError()
-    )
+    mock_bigquery_client.query.side_effect = google.api_core.exceptions.GoogleAPIError()
 
     with pytest.raises(pandas_gbq.exceptions.GenericGBQException):
         module_under_test.query_and_wait_via_client_library(
@@ -61,9 +58,7 @@ def test_query_and_wait_via_client_library_refresherror_raises_accessdenied_serv
     connector = _make_connector()
     connector.private_key = "abc"
     connector.client = mock_bigquery_client
-    mock_bigquery_client.query_and_wait.side_effect = (
-        google.auth.exceptions.RefreshError()
-    )
+    mock_bigquery_client.query.side_effect = google.auth.exceptions.RefreshError()
 
     with pytest.raises(pandas_gbq.exceptions.AccessDenied, match="service account"):
         module_under_test.query_and_wait_via_client_library(
@@ -88,9 +83,7 @@ def test_query_and_wait_via_client_library_refresherror_raises_accessdenied_user
 
     connector = _make_connector()
     connector.client = mock_bigquery_client
-    mock_bigquery_client.query_and_wait.side_effect = (
-        google.auth.exceptions.RefreshError()
-    )
+    mock_bigquery_client.query.side_effect = google.auth.exceptions.RefreshError()
 
     with pytest.raises(pandas_gbq.exceptions.AccessDenied, match="revoked or expired"):
         module_under_test.query_and_wait_via_client_library(
@@ -105,21 +98,18 @@ def test_query_and_wait_via_client_library_refresherror_raises_accessdenied_user
         )
 
 
-def test_query_and_wait_via_client_library_timeout_raises_querytimeout(
+def test_query_and_wait_via_client_library_timeout_cancels_job(
     mock_bigquery_client,
 ):
-    if not hasattr(mock_bigquery_client, "query_and_wait"):
-        pytest.skip(
-            f"google-cloud-bigquery {google.cloud.bigquery.__version__} does not have query_and_wait"
-        )
-
     connector = _make_connector()
     connector.client = mock_bigquery_client
     connector.start = datetime.datetime(2020, 1, 1).timestamp()
-
-    mock_bigquery_client.query_and_wait.side_effect = concurrent.futures.TimeoutError(
-        "fake timeout"
-    )
+    mock_query = mock.create_autospec(google.cloud.bigquery.QueryJob)
+    mock_query.job_id = "a-random-id"
+    mock_query.location = "EU"
+    mock_query.state = "RUNNING"
+    mock_query.done.return_value = False
+    mock_bigquery_client.query.return_value = mock_query
 
     with freezegun.freeze_time(
         "2020-01-01 00:00:00", auto_tick_seconds=15
@@ -135,13 +125,16 @@ def test_query_and_wait_via_client_library_timeout_raises_querytimeout(
             timeout_ms=500,
         )
 
-    mock_bigquery_client.query_and_wait.assert_called_with(
+    # The job is created first, so that it can be cancelled on timeout.
+    mock_bigquery_client.query_and_wait.assert_not_called()
+    mock_bigquery_client.query.assert_called_with(
         "SELECT 1",
         job_config=mock.ANY,
         location="EU",
         project="test-query-and-wait",
-        max_results=123,
-        wait_timeout=0.5,
+    )
+    mock_bigquery_client.cancel_job.assert_called_once_with(
+        "a-random-id", location="EU"
     )
 
 
@@ -172,8 +165,8 @@ def test__wait_for_query_job_exits_when_done(mock_bigquery_client):
     connector.client = mock_bigquery_client
 
     mock_query = mock.create_autospec(google.cloud.bigquery.QueryJob)
-    type(mock_query).state = mock.PropertyMock(side_effect=("RUNNING", "DONE"))
-    mock_query.result.side_effect = concurrent.futures.TimeoutError("fake timeout")
+    mock_query.state = "RUNNING"
+    mock_query.done.side_effect = (False, True)
 
     frozen_time = datetime.datetime(2020, 1, 1)
     with freezegun.freeze_time(frozen_time, tick=False):
@@ -197,7 +190,7 @@ def test__wait_for_query_job_cancels_after_timeout(mock_bigquery_client):
     mock_query.job_id = "a-random-id"
     mock_query.location = "job-location"
     mock_query.state = "RUNNING"
-    mock_query.result.side_effect = concurrent.futures.TimeoutError("fake timeout")
+    mock_query.done.return_value = False
 
     with freezegun.freeze_time(
         "2020-01-01 00:00:00", auto_tick_seconds=15
@@ -209,3 +202,158 @@ def test__wait_for_query_job_cancels_after_timeout(mock_bigquery_client):
     mock_bigquery_client.cancel_job.assert_called_with(
         "a-random-id", location="job-location"
     )
+
+
+def test__wait_for_query_job_polls_with_increasing_intervals(
+    monkeypatch, mock_bigquery_client
+):
+    connector = _make_connector()
+    connector._start_timer()
+    mock_query = mock.create_autospec(google.cloud.bigquery.QueryJob)
+    mock_query.state = "RUNNING"
+    mock_query.done.side_effect = (False, False, False, False, True)
+    sleep = mock.Mock()
+    monkeypatch.setattr(module_under_test.time, "sleep", sleep)
+    monkeypatch.setattr(module_under_test, "_MAX_POLL_SECONDS", 0.2)
+
+    module_under_test._wait_for_query_job(
+        connector, mock_bigquery_client, mock_query, None
+    )
+
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert delays == pytest.approx([0.1, 0.15, 0.2, 0.2])
+
+
+def test__wait_for_query_job_wakes_up_at_timeout(monkeypatch, mock_bigquery_client):
+    sleep = mock.Mock()
+    connector = _make_connector()
+    mock_query = mock.create_autospec(google.cloud.bigquery.QueryJob)
+    mock_query.job_id = "a-random-id"
+    mock_query.location = "job-location"
+    mock_query.state = "RUNNING"
+    mock_query.done.return_value = False
+    # Time passes only while sleeping.
+    connector.get_elapsed_seconds = lambda: 0.45 + 0.15 * (sleep.call_count > 0)
+    monkeypatch.setattr(module_under_test.time, "sleep", sleep)
+
+    with pytest.raises(pandas_gbq.exceptions.QueryTimeout):
+        module_under_test._wait_for_query_job(
+            connector, mock_bigquery_client, mock_query, 500
+        )
+
+    sleep.assert_called_once_with(pytest.approx(0.05))
+
+
+def test__wait_for_query_job_reports_state_changes(mock_bigquery_client):
+    connector = _make_connector()
+    connector._start_timer()
+    mock_query = mock.create_autospec(google.cloud.bigquery.QueryJob)
+    states = iter(["PENDING", "RUNNING", "RUNNING", "DONE"])
+
+    def done():
+        mock_query.state = next(states)
+        return mock_query.state == "DONE"
+
+    mock_query.done.side_effect = done
+    seen = []
+    pandas_gbq.context.query_progress_callback = lambda job: seen.append(job.state)
+
+    with mock.patch.object(module_under_test.time, "sleep"):
+        module_under_test._wait_for_query_job(
+            connector, mock_bigquery_client, mock_query, None
+        )
+
+    assert seen == ["PENDING", "RUNNING", "DONE"]
+
+
+def test__wait_for_query_job_cancels_on_interrupt(monkeypatch, mock_bigquery_client):
+    connector = _make_connector()
+    connector._start_timer()
+    mock_query = mock.create_autospec(google.cloud.bigquery.QueryJob)
+    mock_query.job_id = "a-random-id"
+    mock_query.location = "job-location"
+    mock_query.state = "RUNNING"
+    mock_query.done.return_value = False
+    monkeypatch.setattr(
+        module_under_test.time, "sleep", mock.Mock(side_effect=KeyboardInterrupt)
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        module_under_test._wait_for_query_job(
+            connector, mock_bigquery_client, mock_query, None
+        )
+
+    mock_bigquery_client.cancel_job.assert_called_once_with(
+        "a-random-id", location="job-location"
+    )
+
+
+def test_query_and_wait_via_client_library_keyboard_interrupt_cancels_job(
+    mock_bigquery_client,
+):
+    connector = _make_connector()
+    connector._start_timer()
+    mock_query = mock.create_autospec(google.cloud.bigquery.QueryJob)
+    mock_query.job_id = "a-random-id"
+    mock_query.location = "EU"
+    mock_query.state = "RUNNING"
+    mock_query.done.side_effect = KeyboardInterrupt()
+    mock_bigquery_client.query.return_value = mock_query
+
+    # Without a timeout or a JobTracker, the job still has to be cancelled if
+    # waiting stops early.
+    with pytest.raises(KeyboardInterrupt):
+        module_under_test.query_and_wait_via_client_library(
+            connector,
+            mock_bigquery_client,
+            "SELECT 1",
+            job_config=google.cloud.bigquery.QueryJobConfig(),
+            location="EU",
+            project_id="my-project",
+            max_results=None,
+            timeout_ms=None,
+        )
+
+    mock_bigquery_client.query_and_wait.assert_not_called()
+    mock_bigquery_client.cancel_job.assert_called_once_with(
+        "a-random-id", location="EU"
+    )
+
+
+def test_query_and_wait_via_client_library_with_tracker_cancels_job(
+    mock_bigquery_client,
+):
+    import pandas_gbq.core.job_tracker
+
+    connector = _make_connector()
+    connector._start_timer()
+    tracker = pandas_gbq.core.job_tracker.JobTracker()
+    mock_query = mock.create_autospec(google.cloud.bigquery.QueryJob)
+    mock_query.job_id = "a-random-id"
+    mock_query.location = "EU"
+    mock_query.state = "RUNNING"
+
+    def done():
+        # Another thread cancels while this one waits.
+        tracker.cancel_all()
+        return False
+
+    mock_query.done.side_effect = done
+    mock_bigquery_client.query.return_value = mock_query
+
+    with tracker.tracking(), pytest.raises(pandas_gbq.exceptions.QueryCancelled):
+        module_under_test.query_and_wait_via_client_library(
+            connector,
+            mock_bigquery_client,
+            "SELECT 1",
+            job_config=google.cloud.bigquery.QueryJobConfig(),
+            location="EU",
+            project_id="my-project",
+            max_results=None,
+            timeout_ms=None,
+        )
+
+    mock_bigquery_client.query_and_wait.assert_not_called()
+    assert tracker.jobs == [mock_query]
+    mock_query.cancel.assert_called_with()
+    mock_bigquery_client.cancel_job.assert_called_with("a-random-id", location="EU")
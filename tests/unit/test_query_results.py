@@ -0,0 +1,162 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from unittest import mock
+
+import google.cloud.bigquery
+import pandas
+import pyarrow
+import pyarrow.parquet
+import pytest
+
+import pandas_gbq
+from pandas_gbq.gbq_connector import GbqConnector
+
+SCHEMA = [
+    google.cloud.bigquery.SchemaField("id", "INTEGER"),
+    google.cloud.bigquery.SchemaField("name", "STRING"),
+]
+DESTINATION = google.cloud.bigquery.TableReference.from_string(
+    "my-project._anon.results"
+)
+
+
+def _mock_rows(df):
+    mock_rows = mock.create_autospec(
+        google.cloud.bigquery.table.RowIterator, instance=True
+    )
+    mock_rows.total_rows = len(df.index)
+    mock_rows.schema = [field for field in SCHEMA if field.name in df.columns]
+    mock_rows.to_dataframe.return_value = df
+    return mock_rows
+
+
+@pytest.fixture
+def query_job(mock_bigquery_client):
+    query_job = mock.create_autospec(google.cloud.bigquery.QueryJob, instance=True)
+    query_job.job_id = "my-job"
+    query_job.location = "EU"
+    query_job.destination = DESTINATION
+    query_job.result.return_value.job = query_job
+    mock_bigquery_client.query.return_value = query_job
+
+    table = google.cloud.bigquery.Table(DESTINATION, schema=SCHEMA)
+    table._properties["numRows"] = "3"
+    mock_bigquery_client.get_table.return_value = table
+    return query_job
+
+
+def test_execute_query_creates_job(mock_bigquery_client, query_job):
+    result = pandas_gbq.execute_query(
+        "SELECT @x", project_id="my-project", query_parameters={"x": 1}
+    )
+
+    assert result.job is query_job
+    assert result.job_id == "my-job"
+    assert result.location == "EU"
+    assert result.destination == DESTINATION
+    assert [field.name for field in result.schema] == ["id", "name"]
+    assert result.total_rows == 3
+    # Results are read from the destination table, not from the query.
+    mock_bigquery_client.query_and_wait.assert_not_called()
+    _, kwargs = mock_bigquery_client.query.call_args
+    assert kwargs["job_config"].query_parameters[0].value == 1
+
+
+def test_to_dataframe_reads_destination_table(mock_bigquery_client, query_job):
+    df = pandas.DataFrame({"name": ["a", "b"]})
+    mock_bigquery_client.list_rows.return_value = _mock_rows(df)
+    result = pandas_gbq.execute_query("SELECT 1", project_id="my-project")
+
+    first = result.to_dataframe(columns=["name"], max_results=2)
+    second = result.to_dataframe(columns=["name"], max_results=2)
+
+    pandas.testing.assert_frame_equal(first, df)
+    pandas.testing.assert_frame_equal(second, df)
+    # The query only ran once.
+    mock_bigquery_client.query.assert_called_once()
+    (table,), kwargs = mock_bigquery_client.list_rows.call_args
+    assert table == DESTINATION
+    assert [field.name for field in kwargs["selected_fields"]] == ["name"]
+    assert kwargs["max_results"] == 2
+
+
+def test_to_dataframe_with_row_filter_uses_read_session(monkeypatch, query_job):
+    from google.cloud import bigquery_storage
+
+    bqstorage_client = mock.create_autospec(
+        bigquery_storage.BigQueryReadClient, instance=True
+    )
+    monkeypatch.setattr(
+        GbqConnector, "get_bqstorage_client", lambda self: bqstorage_client
+    )
+    session = bqstorage_client.create_read_session.return_value
+    session.streams = [mock.Mock(), mock.Mock()]
+    page = mock.Mock()
+    page.to_dataframe.return_value = pandas.DataFrame({"id": [1, 2]})
+    bqstorage_client.read_rows.return_value.rows.return_value.pages = [page]
+    result = pandas_gbq.execute_query("SELECT 1", project_id="my-project")
+
+    df = result.to_dataframe(columns=["id"], row_filter="id > 0", max_results=3)
+
+    assert df["id"].tolist() == [1, 2, 1]
+    _, kwargs = bqstorage_client.create_read_session.call_args
+    assert kwargs["parent"] == "projects/my-project"
+    read_session = kwargs["read_session"]
+    assert read_session.table == "projects/my-project/datasets/_anon/tables/results"
+    assert list(read_session.read_options.selected_fields) == ["id"]
+    assert read_session.read_options.row_restriction == "id > 0"
+
+
+def test_iter_batches_with_batch_size_uses_pages(mock_bigquery_client, query_job):
+    rows = _mock_rows(pandas.DataFrame())
+    rows.to_dataframe_iterable.return_value = iter(
+        [pandas.DataFrame({"id": [1, 2]}), pandas.DataFrame({"id": [3]})]
+    )
+    mock_bigquery_client.list_rows.return_value = rows
+    result = pandas_gbq.execute_query("SELECT 1", project_id="my-project")
+
+    batches = list(result.iter_batches(columns=["id"], batch_size=2))
+
+    assert [batch["id"].tolist() for batch in batches] == [[1, 2], [3]]
+    _, kwargs = mock_bigquery_client.list_rows.call_args
+    assert kwargs["page_size"] == 2
+    _, kwargs = rows.to_dataframe_iterable.call_args
+    assert kwargs["bqstorage_client"] is None
+    assert kwargs["dtypes"] == {"id": "Int64"}
+
+
+def test_to_parquet_writes_arrow_table(mock_bigquery_client, query_job, tmp_path):
+    rows = _mock_rows(pandas.DataFrame())
+    rows.to_arrow.return_value = pyarrow.table({"id": [1, 2], "name": ["a", "b"]})
+    mock_bigquery_client.list_rows.return_value = rows
+    result = pandas_gbq.execute_query("SELECT 1", project_id="my-project")
+    path = tmp_path / "results.parquet"
+
+    result.to_parquet(str(path))
+
+    assert pyarrow.parquet.read_table(path).to_pydict() == {
+        "id": [1, 2],
+        "name": ["a", "b"],
+    }
+
+
+def test_reading_unknown_columns_raises(query_job):
+    result = pandas_gbq.execute_query("SELECT 1", project_id="my-project")
+
+    with pytest.raises(ValueError, match="missing"):
+        result.to_dataframe(columns=["id", "missing"])
+
+
+def test_reading_without_destination_raises(query_job):
+    query_job.destination = None
+    result = pandas_gbq.execute_query("DELETE FROM t WHERE TRUE")
+
+    with pytest.raises(ValueError, match="no results table"):
+        result.to_dataframe()
+
+
+def test_execute_query_with_table_id_raises():
+    with pytest.raises(ValueError, match="requires a query"):
+        pandas_gbq.execute_query("my_dataset.my_table")
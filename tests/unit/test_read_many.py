@@ -0,0 +1,173 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import threading
+from unittest import mock
+
+import google.api_core.exceptions
+import google.cloud.bigquery
+import pandas
+import pytest
+
+import pandas_gbq
+import pandas_gbq.exceptions
+
+
+def _mock_rows(df, on_download=None):
+    mock_rows = mock.create_autospec(
+        google.cloud.bigquery.table.RowIterator, instance=True
+    )
+    mock_rows.total_rows = len(df.index)
+    mock_rows.schema = [
+        google.cloud.bigquery.SchemaField(name, "INTEGER") for name in df.columns
+    ]
+
+    def to_dataframe(*args, **kwargs):
+        if on_download is not None:
+            on_download()
+        return df
+
+    mock_rows.to_dataframe.side_effect = to_dataframe
+    return mock_rows
+
+
+@pytest.fixture
+def results_by_query(mock_bigquery_client):
+    results = {}
+
+    def query(sql, **kwargs):
+        result = results[sql]
+        if isinstance(result, Exception):
+            raise result
+        if isinstance(result, google.cloud.bigquery.QueryJob):
+            return result
+
+        job = mock.create_autospec(google.cloud.bigquery.QueryJob, instance=True)
+        job.job_id = sql
+        job.state = "DONE"
+        job.done.return_value = True
+        if callable(result):
+            job.result.side_effect = lambda **kwargs: result()
+        else:
+            job.result.return_value = result
+        return job
+
+    mock_bigquery_client.query.side_effect = query
+    return results
+
+
+def test_read_gbq_many_returns_results_in_order(results_by_query):
+    results_by_query["SELECT 1"] = _mock_rows(pandas.DataFrame({"a": [1]}))
+    results_by_query["SELECT 2"] = _mock_rows(pandas.DataFrame({"b": [2]}))
+
+    dfs = pandas_gbq.read_gbq_many(["SELECT 2", "SELECT 1"], project_id="my-project")
+
+    assert [list(df.columns) for df in dfs] == [["b"], ["a"]]
+
+
+def test_read_gbq_many_with_mapping_returns_dict(results_by_query):
+    results_by_query["SELECT 1"] = _mock_rows(pandas.DataFrame({"a": [1]}))
+    results_by_query["SELECT 2"] = _mock_rows(pandas.DataFrame({"b": [2]}))
+
+    dfs = pandas_gbq.read_gbq_many(
+        {"first": "SELECT 1", "second": "SELECT 2"}, project_id="my-project"
+    )
+
+    assert list(dfs) == ["first", "second"]
+    assert list(dfs["second"].columns) == ["b"]
+
+
+def test_read_gbq_many_tracks_jobs_with_callers_tracker(results_by_query):
+    results_by_query["SELECT 1"] = _mock_rows(pandas.DataFrame({"a": [1]}))
+    results_by_query["SELECT 2"] = _mock_rows(pandas.DataFrame({"b": [2]}))
+    tracker = pandas_gbq.JobTracker()
+
+    with tracker.tracking():
+        pandas_gbq.read_gbq_many(["SELECT 1", "SELECT 2"], project_id="my-project")
+
+    assert sorted(job.job_id for job in tracker.jobs) == ["SELECT 1", "SELECT 2"]
+
+
+def test_read_gbq_many_downloads_while_other_jobs_run(results_by_query):
+    fast_downloaded = threading.Event()
+
+    def slow_query():
+        # Only finishes once the fast query's results have been downloaded.
+        assert fast_downloaded.wait(5)
+        return _mock_rows(pandas.DataFrame({"slow": [1]}))
+
+    results_by_query["SELECT slow"] = slow_query
+    results_by_query["SELECT fast"] = _mock_rows(
+        pandas.DataFrame({"fast": [1]}), on_download=fast_downloaded.set
+    )
+
+    dfs = pandas_gbq.read_gbq_many(
+        ["SELECT slow", "SELECT fast"],
+        project_id="my-project",
+        max_concurrent_jobs=2,
+        max_concurrent_downloads=1,
+    )
+
+    assert [list(df.columns) for df in dfs] == [["slow"], ["fast"]]
+
+
+def test_read_gbq_many_raises_first_error(results_by_query):
+    results_by_query["SELECT 1"] = _mock_rows(pandas.DataFrame({"a": [1]}))
+    results_by_query["SELECT bad"] = google.api_core.exceptions.BadRequest("bad")
+
+    with pytest.raises(pandas_gbq.exceptions.GenericGBQException, match="bad"):
+        pandas_gbq.read_gbq_many(["SELECT 1", "SELECT bad"], project_id="my-project")
+
+
+def test_read_gbq_many_error_cancels_running_jobs(results_by_query):
+    slow_started = threading.Event()
+    slow_job = mock.create_autospec(google.cloud.bigquery.QueryJob, instance=True)
+    slow_job.job_id = "slow"
+    slow_job.state = "RUNNING"
+    slow_job.done.return_value = False
+    slow_job.done.side_effect = lambda *args, **kwargs: slow_started.set()
+
+    def bad_query():
+        assert slow_started.wait(5)
+        raise google.api_core.exceptions.BadRequest("bad")
+
+    results_by_query["SELECT bad"] = mock.Mock(side_effect=bad_query)
+    results_by_query["SELECT slow"] = slow_job
+
+    with pytest.raises(pandas_gbq.exceptions.GenericGBQException, match="bad"):
+        pandas_gbq.read_gbq_many(
+            ["SELECT bad", "SELECT slow"],
+            project_id="my-project",
+            max_concurrent_jobs=2,
+        )
+
+    slow_job.cancel.assert_called_once_with()
+
+
+def test_read_gbq_many_with_return_exceptions(results_by_query):
+    results_by_query["SELECT 1"] = _mock_rows(pandas.DataFrame({"a": [1]}))
+    results_by_query["SELECT bad"] = google.api_core.exceptions.BadRequest("bad")
+
+    dfs = pandas_gbq.read_gbq_many(
+        ["SELECT bad", "SELECT 1"],
+        project_id="my-project",
+        return_exceptions=True,
+    )
+
+    assert isinstance(dfs[0], pandas_gbq.exceptions.GenericGBQException)
+    assert list(dfs[1].columns) == ["a"]
+
+
+def test_read_gbq_many_without_queries_returns_empty(mock_bigquery_client):
+    assert pandas_gbq.read_gbq_many([]) == []
+    assert pandas_gbq.read_gbq_many({}) == {}
+    mock_bigquery_client.query_and_wait.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"max_concurrent_jobs": 0}, {"max_concurrent_downloads": 0}]
+)
+def test_read_gbq_many_with_invalid_limits_raises(kwargs):
+    with pytest.raises(ValueError, match="must be positive"):
+        pandas_gbq.read_gbq_many(["SELECT 1"], **kwargs)
@@ -0,0 +1,160 @@
+# Copyright (c) 2026 pandas-gbq Authors All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from unittest import mock
+
+import google.cloud.bigquery
+import pandas
+import pytest
+
+import pandas_gbq
+import pandas_gbq.contexts
+
+
+@pytest.fixture
+def mock_row_iterator(mock_bigquery_client):
+    rows_iter = mock.create_autospec(google.cloud.bigquery.table.RowIterator)
+    rows_iter.total_rows = 1
+    rows_iter.schema = [google.cloud.bigquery.SchemaField("x", "INTEGER")]
+    rows_iter.to_dataframe.return_value = pandas.DataFrame({"x": [1]})
+    query_job = mock.create_autospec(google.cloud.bigquery.QueryJob, instance=True)
+    query_job.result.return_value = rows_iter
+    mock_bigquery_client.query.return_value = query_job
+    return rows_iter
+
+
+def test_session_authenticates_once(monkeypatch, mock_bigquery_client):
+    import pydata_google_auth
+
+    from .conftest import mock_get_credentials
+
+    get_credentials = mock.Mock(side_effect=mock_get_credentials)
+    monkeypatch.setattr(pydata_google_auth, "default", get_credentials)
+
+    session = pandas_gbq.Session()
+    session.to_gbq(pandas.DataFrame({"x": [1]}), "my_dataset.my_table")
+    session.to_gbq(pandas.DataFrame({"x": [1]}), "my_dataset.my_table")
+
+    get_credentials.assert_called_once()
+    mock_bigquery_client.assert_called_once()
+    assert session.project_id == "default-project"
+    assert session.client is mock_bigquery_client
+    # The global context isn't modified.
+    assert pandas_gbq.context.credentials is None
+    assert pandas_gbq.context.project is None
+
+
+def test_session_read_gbq_uses_defaults(mock_bigquery_client, mock_row_iterator):
+    session = pandas_gbq.Session(
+        "my-project",
+        location="EU",
+        dtypes={"x": "Int64", "y": "Float64"},
+        progress_bar_type=None,
+    )
+
+    df = session.read_gbq("SELECT 1 AS x", dtypes={"y": "float64"})
+
+    assert df is not None
+    _, kwargs = mock_bigquery_client.query.call_args
+    assert kwargs["location"] == "EU"
+    assert kwargs["project"] == "my-project"
+    _, to_dataframe_kwargs = mock_row_iterator.to_dataframe.call_args
+    assert to_dataframe_kwargs["dtypes"]["x"] == "Int64"
+    assert to_dataframe_kwargs["dtypes"]["y"] == "float64"
+
+
+def test_session_uses_own_context(monkeypatch, mock_bigquery_client):
+    import google.api_core.exceptions
+
+    monkeypatch.setattr(pandas_gbq.context, "dialect", "legacy")
+    metadata_cache = pandas_gbq.MetadataCache()
+    session = pandas_gbq.Session("my-project", metadata_cache=metadata_cache)
+    contexts_used = []
+
+    with mock.patch(
+        "pandas_gbq.gbq.read_gbq",
+        side_effect=lambda *args, **kwargs: contexts_used.append(
+            pandas_gbq.contexts.get_context()
+        ),
+    ):
+        session.read_gbq("SELECT 1 AS x")
+
+    assert contexts_used[0] is not pandas_gbq.context
+    assert contexts_used[0].dialect == "standard"
+    assert pandas_gbq.contexts.get_context() is pandas_gbq.context
+
+    mock_bigquery_client.get_table.side_effect = google.api_core.exceptions.NotFound(
+        "my_table"
+    )
+    session.to_gbq(pandas.DataFrame({"x": [1]}), "my_dataset.my_table")
+    # The destination dataset's metadata is kept in the session's cache.
+    assert len(metadata_cache) == 1
+
+
+def test_session_starts_from_global_context(mock_bigquery_client):
+    dry_run_cache = pandas_gbq.DryRunCache()
+    callback = mock.Mock()
+    result_cache = pandas_gbq.MemoryCache()
+    pandas_gbq.context.dry_run_cache = dry_run_cache
+    pandas_gbq.context.query_progress_callback = callback
+    pandas_gbq.context.result_cache = pandas_gbq.MemoryCache()
+    pandas_gbq.context.coalesce_requests = True
+    session = pandas_gbq.Session("my-project", result_cache=result_cache)
+    # Later changes to the global context don't affect the session.
+    pandas_gbq.context.dry_run_cache = None
+    contexts_used = []
+
+    with mock.patch(
+        "pandas_gbq.gbq.read_gbq",
+        side_effect=lambda *args, **kwargs: contexts_used.append(
+            pandas_gbq.contexts.get_context()
+        ),
+    ):
+        session.read_gbq("SELECT 1 AS x")
+
+    (context,) = contexts_used
+    assert context.dry_run_cache is dry_run_cache
+    assert context.query_progress_callback is callback
+    assert context.coalesce_requests is True
+    # Arguments take precedence over the global settings.
+    assert context.result_cache is result_cache
+    assert context.project == "my-project"
+    assert pandas_gbq.context.project is None
+
+
+@pytest.mark.parametrize(
+    ("global_limit", "session_limit", "expected"),
+    [(1000, None, 1000), (1000, 500, 500), (None, None, None)],
+)
+def test_session_max_bytes_billed(
+    mock_bigquery_client, global_limit, session_limit, expected
+):
+    pandas_gbq.context.max_bytes_billed = global_limit
+    session = pandas_gbq.Session("my-project", max_bytes_billed=session_limit)
+    contexts_used = []
+
+    with mock.patch(
+        "pandas_gbq.gbq.read_gbq",
+        side_effect=lambda *args, **kwargs: contexts_used.append(
+            pandas_gbq.contexts.get_context()
+        ),
+    ):
+        session.read_gbq("SELECT 1 AS x")
+
+    assert contexts_used[0].max_bytes_billed == expected
+
+
+def test_session_sample_uses_credentials(mock_bigquery_client):
+    session = pandas_gbq.Session("my-project", use_bqstorage_api=False)
+
+    with mock.patch("pandas_gbq.core.sample.sample") as mock_sample:
+        session.sample("my-project.my_dataset.my_table", target_mb=1)
+
+    mock_sample.assert_called_once_with(
+        "my-project.my_dataset.my_table",
+        target_mb=1,
+        credentials=session.credentials,
+        billing_project_id="my-project",
+        use_bqstorage_api=False,
+    )
@@ -275,6 +275,31 @@ def test_create_user_agent_jupyter_extension():
         )
 
 
+@mock.patch.dict(
+    os.environ,
+    {"JPY_PARENT_PID": "1234", "PANDAS_GBQ_SKIP_ENVIRONMENT_DETECTION": "1"},
+    clear=True,
+)
+def test_create_user_agent_skip_environment_detection():
+    from pandas_gbq.gbq_connector import create_user_agent
+
+    assert create_user_agent() == f"pandas-{pd.__version__}"
+
+
+@mock.patch.dict(os.environ, {"VSCODE_PID": "1234"}, clear=True)
+def test_create_user_agent_detects_environment_once():
+    from pandas_gbq.gbq_connector import create_user_agent
+
+    with mock.patch(
+        "pandas_gbq.environment.is_vscode_google_cloud_code_extension_installed",
+        return_value=False,
+    ) as mock_is_installed:
+        create_user_agent()
+        create_user_agent("my-app")
+
+    mock_is_installed.assert_called_once()
+
+
 def test_to_gbq_with_clustering(mock_bigquery_client):
     mock_bigquery_client.get_table.side_effect = google.api_core.exceptions.NotFound(
         "my_table"